@@ -0,0 +1,174 @@
+"""缓存序列化基准测试
+
+比较各序列化配置（JSON/msgpack × 不压缩/gzip/zstd）的编码、解码耗时和落盘大小，
+并与旧版的缩进 JSON 文件对比。每种配置都会校验解码结果与原数据一致。
+
+    python benchmarks/bench_cache_serialization.py            # 使用内置的典型数据
+    python benchmarks/bench_cache_serialization.py --live     # 先抓取真实工具结果
+
+--live 会调用 IT之家、汽车之家热榜和微博搜索工具，需要网络；任一工具失败时使用内置数据代替。
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from daily_hot_mcp.utils.cache_backend import CacheEntry, FileBackend
+from daily_hot_mcp.utils.cache_serializer import Serializer, msgpack, zstandard
+
+
+def sample_news_list(source: str, count: int = 50) -> List[Dict[str, Any]]:
+    """与 ithome/autohome 工具结构相同的 50 条热榜"""
+    return [
+        {
+            "rank": i + 1,
+            "title": f"{source}热榜新闻标题第{i + 1}条：新款旗舰手机发布，搭载最新处理器",
+            "desc": f"{source}资讯 - 这是一段用于基准测试的新闻摘要，长度与真实数据相近。" * 2,
+            "url": f"https://www.example.com/{source}/2024/{100000 + i}.htm",
+            "source": source,
+            "publish_time": "2024-05-01 12:00",
+            "hot_count": str(1000 * (50 - i)),
+            "category": "科技资讯",
+            "tags": ["科技", "数码", "IT资讯", "互联网"],
+        }
+        for i in range(count)
+    ]
+
+
+def sample_weibo_search(count: int = 15) -> List[Dict[str, Any]]:
+    """与 search-weibo-content 结构相同的搜索结果，包含嵌套的用户信息"""
+    return [
+        {
+            "id": str(4990000000000000 + i),
+            "text": "微博正文内容，<a href='/n/someone'>@某用户</a> 转发并评论了这条关于关键词的微博 #话题# " * 3,
+            "created_at": "Wed May 01 12:00:00 +0800 2024",
+            "user": {
+                "id": 1000000000 + i,
+                "screen_name": f"用户{i}",
+                "profile_image_url": f"https://tvax1.sinaimg.cn/crop.0.0.180.180.180/{i:08x}.jpg",
+            },
+            "comments_count": 10 * i,
+            "attitudes_count": 100 * i,
+            "reposts_count": 5 * i,
+            "url": f"https://m.weibo.cn/status/{4990000000000000 + i}",
+        }
+        for i in range(count)
+    ]
+
+
+async def live_payloads() -> Dict[str, Any]:
+    from daily_hot_mcp.tools.autohome import get_autohome_trending_func
+    from daily_hot_mcp.tools.ithome import get_ithome_trending_func
+    from daily_hot_mcp.tools.weibo_search import search_weibo_content
+
+    fetchers: Dict[str, Callable[[], Any]] = {
+        "ithome": get_ithome_trending_func,
+        "autohome": lambda: get_autohome_trending_func({}),
+        "weibo-search": lambda: search_weibo_content("科技"),
+    }
+    payloads = builtin_payloads()
+    for name, fetch in fetchers.items():
+        try:
+            result = await fetch()
+            if result:
+                payloads[name] = result
+                continue
+        except Exception as e:
+            print(f"{name} 抓取失败，使用内置数据: {e}")
+    return payloads
+
+
+def builtin_payloads() -> Dict[str, Any]:
+    return {
+        "ithome": sample_news_list("IT之家"),
+        "autohome": sample_news_list("汽车之家"),
+        "weibo-search": sample_weibo_search(),
+    }
+
+
+def legacy_encode(value: Any) -> bytes:
+    """旧版 SimpleCache 写入的格式：缩进 JSON 文档"""
+    doc = {"timestamp": "2024-05-01T12:00:00", "expires": 0, "stale_until": 0, "data": value}
+    return json.dumps(doc, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def legacy_decode(raw: bytes) -> Any:
+    return json.loads(raw)["data"]
+
+
+def serializers() -> List[Tuple[str, Serializer]]:
+    configs = [("json", "none"), ("json", "gzip")]
+    if zstandard is not None:
+        configs.append(("json", "zstd"))
+    if msgpack is not None:
+        configs += [("msgpack", "none"), ("msgpack", "gzip")]
+        if zstandard is not None:
+            configs.append(("msgpack", "zstd"))
+    # 阈值设为 0，让每份数据都经过压缩，便于比较
+    return [(f"{f}+{c}", Serializer(f, c, compress_threshold=0)) for f, c in configs]
+
+
+def timeit(fn: Callable[[], Any], rounds: int) -> float:
+    """返回单次调用耗时的中位数（微秒）"""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def bench_file_roundtrip(serializer: Serializer, value: Any, rounds: int) -> Tuple[float, float]:
+    """通过 FileBackend 实际写盘再读回的耗时（微秒）"""
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = FileBackend(Path(tmp), serializer=serializer)
+        entry = CacheEntry(value, time.time(), time.time() + 60, time.time() + 120)
+        write_us = timeit(lambda: backend.write("bench", entry, backend.encode(entry)), rounds)
+        read_us = timeit(lambda: backend.load("bench"), rounds)
+        assert backend.load("bench").data == value, "文件读写结果与原数据不一致"
+    return write_us, read_us
+
+
+def run(payloads: Dict[str, Any], rounds: int) -> None:
+    header = f"{'payload':<14}{'serializer':<16}{'bytes':>8}{'encode µs':>11}{'decode µs':>11}{'write µs':>10}{'read µs':>10}"
+    for name, value in payloads.items():
+        print(header)
+        raw = legacy_encode(value)
+        assert legacy_decode(raw) == value
+        print(
+            f"{name:<14}{'legacy-indent':<16}{len(raw):>8}"
+            f"{timeit(lambda: legacy_encode(value), rounds):>11.1f}"
+            f"{timeit(lambda: legacy_decode(raw), rounds):>11.1f}{'-':>10}{'-':>10}"
+        )
+        for label, serializer in serializers():
+            encoded = serializer.dumps(value)
+            assert Serializer.loads(encoded) == value, f"{label} 解码结果与原数据不一致"
+            write_us, read_us = bench_file_roundtrip(serializer, value, rounds)
+            print(
+                f"{name:<14}{label:<16}{len(encoded):>8}"
+                f"{timeit(lambda: serializer.dumps(value), rounds):>11.1f}"
+                f"{timeit(lambda: Serializer.loads(encoded), rounds):>11.1f}"
+                f"{write_us:>10.1f}{read_us:>10.1f}"
+            )
+        print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--live", action="store_true", help="抓取真实工具结果作为测试数据")
+    parser.add_argument("--rounds", type=int, default=200, help="每项测试的重复次数")
+    args = parser.parse_args()
+
+    payloads = asyncio.run(live_payloads()) if args.live else builtin_payloads()
+    if msgpack is None or zstandard is None:
+        print("提示：安装 msgpack 和 zstandard 后可比较更多格式（pip install daily_hot_mcp[cache]）\n")
+    run(payloads, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""HTML 提取：BeautifulSoup 与 lxml 实现的一致性和性能对比
+
+对百度、IT之家、汽车之家、虎扑、搜狗的页面分别运行旧版（legacy_bs4_parsers.py，
+BeautifulSoup + html.parser）和当前工具中的 lxml 实现：
+
+- 校验两者提取出的条目完全相同（或抛出相同的异常），不一致时打印第一处差异并以非 0 退出；
+- 比较单次解析耗时的中位数；
+- 在独立的子进程中各解析一次，比较进程峰值内存（RSS）的增量（仅 Linux）；
+- IT之家、汽车之家、虎扑、搜狗另与改写之前的 XPath 实现（legacy_xpath_parsers.py）比较。
+
+    python benchmarks/bench_html_extract.py              # 使用 fixtures 目录中的页面，没有时使用内置页面
+    python benchmarks/bench_html_extract.py --fetch      # 先抓取各站点的真实页面保存到 fixtures 目录
+
+fixtures 目录中的页面是第三方网站的内容，不提交到仓库。内置页面按各站点的页面结构生成，
+包含注释、script、嵌套标签、GBK 编码等容易产生差异的写法；这些页面也保存在
+tests/fixtures/html 中，由 tests/test_html_parity.py 校验一致性。
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import legacy_bs4_parsers as legacy
+import legacy_xpath_parsers as legacy_xpath
+from daily_hot_mcp.tools import autohome, baidu, hupu, ithome, sogou
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# 名称 -> (页面地址, 旧实现, 新实现)
+SITES: Dict[str, Tuple[str, Callable[..., list], Callable[..., list]]] = {
+    "baidu": ("https://top.baidu.com/board?tab=realtime", legacy.parse_baidu_html, baidu.parse_baidu_html),
+    "ithome": ("https://www.ithome.com/", legacy.parse_ithome_html, ithome.parse_ithome_html),
+    "autohome": ("https://www.autohome.com.cn/", legacy.parse_autohome_html, autohome.parse_autohome_html),
+    "hupu-bxj": ("https://bbs.hupu.com/bxj", legacy.parse_hupu_bxj_html, hupu.parse_hupu_bxj_html),
+    "hupu-homepage": ("https://www.hupu.com/", legacy.parse_hupu_homepage_html, hupu.parse_hupu_homepage_html),
+    "sogou": ("https://www.sogou.com/web?query=%E6%90%9C%E7%8B%97%E7%83%AD%E6%90%9C",
+              legacy.parse_sogou_html, sogou.parse_sogou_html),
+}
+
+# 改写之前的 lxml 实现：IT之家、汽车之家改为单次遍历，虎扑、搜狗改为正则匹配 class 并按需取出候选元素
+PREVIOUS_LXML: Dict[str, Callable[..., list]] = {
+    "ithome": legacy_xpath.parse_ithome_html,
+    "autohome": legacy_xpath.parse_autohome_html,
+    "hupu-bxj": legacy_xpath.parse_hupu_bxj_html,
+    "hupu-homepage": legacy_xpath.parse_hupu_homepage_html,
+    "sogou": legacy_xpath.parse_sogou_html,
+}
+
+_NAV = '<div class="nav"><a href="/">首页</a><a href="/login">登录</a><!-- 导航 --><script>var hot = "热度";</script></div>'
+
+
+def _page(body: str, charset: str = "utf-8", filler: int = 1500) -> bytes:
+    """拼出完整页面，filler 个无关区块用于模拟真实页面的体积"""
+    noise = "".join(
+        f'<div class="footer-block"><ul><li><span>友情链接 {i}</span><a href="https://example.com/{i}">站点 {i}</a></li></ul>'
+        f'<style>.x{i}{{color:red}}</style></div>'
+        for i in range(filler)
+    )
+    html = (
+        f'<!DOCTYPE html><html><head><meta charset="{charset}"><title>热榜</title></head>'
+        f'<body>{_NAV}{body}{noise}</body></html>'
+    )
+    return html.encode(charset)
+
+
+def builtin_fixtures() -> Dict[str, Tuple[bytes, Optional[str]]]:
+    """按各站点页面结构生成的页面，值为 (页面字节, HTTP 头中的编码)"""
+    baidu_items = "".join(
+        f'<div class="category-wrap_iQLoo horizontal_1eKyQ"><a class="img-wrapper_29V76" href="https://www.baidu.com/s?wd=热搜{i}">'
+        f'<img src="https://fyb-2.cdn.bcebos.com/hotboard_image/{i}.jpg"></a>'
+        f'<div class="content_1YWBm"><a href="/s?wd={i}"><div class="c-single-text-ellipsis">  热搜话题 {i} &amp; 讨论 </div></a>'
+        f'<div class="hot-desc_1m_jR small_Uvkd3">描述 {i}<a href="/s?wd={i}">查看更多&gt;</a></div></div>'
+        f'<div class="trend_2RttY"><div class="hot-index_1Bl1a"> {4_900_000 - i * 1000} </div></div></div>'
+        for i in range(50)
+    )
+    # 热榜、新闻列表、正文区的散链接和卡片各有一部分，部分标题重复出现，散链接共用同一个父元素
+    ithome_hot = "".join(
+        f'<li><a href="/it/0/{800 + i}.htm">IT之家热榜新闻第 {i} 条<b>（图）</b></a><span class="hot">{i}万</span></li>'
+        for i in range(8)
+    )
+    ithome_list = "".join(
+        f'<li><a href="https://www.ithome.com/0/{900 + i}.htm" title="t">IT之家新闻标题第 {i} 条</a>'
+        + (f'<p>摘要 {i}<!-- c --></p>' if i % 3 else '<div class="summary"> 概要 </div>')
+        + f'<span class="time">{i % 24:02d}:00</span><span class="comment">{i} 评</span></li>'
+        for i in range(20)
+    )
+    ithome_loose = "".join(
+        f'<a href="/it/1/{i}.htm">正文区散落的链接标题 {i}</a><time>{i}分钟前</time>' for i in range(15)
+    ) + '<a href="/it/0/800.htm">IT之家热榜新闻第 0 条（图）</a>'
+    ithome_cards = "".join(
+        f'<div class="post-item"><h2><a href="/0/{700 + i}.htm">卡片新闻标题第 {i} 条</a></h2><div class="content">内容 {i}</div></div>'
+        for i in range(20)
+    )
+    ithome_page = (
+        f'<div class="post-item"><a href="/it/9/1.htm">卡片里的 IT 频道链接</a></div>'
+        f'<div class="hot-list"><ul>{ithome_hot}</ul></div><div class="news-list"><ul>{ithome_list}</ul></div>'
+        f'<div class="main">{ithome_loose}</div>{ithome_cards}'
+    )
+    autohome_items = "".join(
+        f'<li><a href="//www.autohome.com.cn/{("news", "advice", "drive")[i % 3]}/2024/{i}.html">汽车之家资讯标题 {i} 号</a>'
+        f'<p>新车上市 {i}</p><span class="time">2024-05-{i % 28 + 1:02d}</span>'
+        + (f'<span class="comment">{i}</span>' if i % 2 else f'<span>{i} 评论</span>')
+        + '</li>'
+        for i in range(12)
+    )
+    autohome_cards = [
+        f'<div class="card"><a href="/{("drive", "advice", "news")[i % 3]}/2024/{100 + i}.html">评测与导购文章标题 {i}</a>'
+        f'<span> {i} <em>评论</em></span><span>{i} 评论</span></div>'
+        for i in range(45)
+    ]
+    bxj_items = "".join(
+        f'<li class="bbs-sl-web-post-body"><div class="post-title"><a href="/{6000 + i}.html" class="p-title">步行街帖子标题第 {i} 条</a></div>'
+        f'<div class="post-datum"> {i * 7} 回复 / {i * 100} 浏览 </div></li>'
+        for i in range(60)
+    ) + '<div class="topic-item"><span>没有链接的热帖标题</span></div>'
+    hupu_home = "".join(
+        f'<div class="hot-item"><a href="/news/{i}">虎扑首页热门内容 {i}</a></div>'
+        f'<div class="list-item" href="/x/{i}"><span>区块 {i} 文字较长</span></div>'
+        for i in range(40)
+    )
+    sogou_items = "".join(
+        f'<div class="hotsearch-item"><a class="hot-link" href="/web?query={i}">搜狗热搜词 {i}</a></div>'
+        f'<span class="Trend-tag">趋势{i}</span>'
+        for i in range(30)
+    ) + '<div class="search-box"><input name="query"></div>'
+    return {
+        "baidu": (_page(baidu_items), "utf-8"),
+        "ithome": (_page(ithome_page), None),
+        "autohome": (_page(
+            "".join(autohome_cards[:5]) + f'<div class="list-article"><ul>{autohome_items}</ul></div>' + "".join(autohome_cards[5:]),
+            charset="gbk",
+        ), "gbk"),
+        "hupu-bxj": (_page(f'<ul class="bbs-sl-web-post">{bxj_items}</ul>'), "utf-8"),
+        "hupu-homepage": (_page(hupu_home), "utf-8"),
+        "sogou": (_page(sogou_items), "utf-8"),
+    }
+
+
+def load_fixtures() -> Dict[str, Tuple[bytes, Optional[str]]]:
+    """优先使用 fixtures 目录中保存的页面"""
+    fixtures = builtin_fixtures()
+    for name in SITES:
+        path = FIXTURES_DIR / f"{name}.html"
+        if path.exists():
+            meta_path = path.with_suffix(".json")
+            encoding = json.loads(meta_path.read_text())["encoding"] if meta_path.exists() else None
+            fixtures[name] = (path.read_bytes(), encoding)
+            print(f"{name}: 使用 {path}")
+    return fixtures
+
+
+async def fetch_fixtures() -> None:
+    """抓取各站点的页面保存到 fixtures 目录"""
+    from daily_hot_mcp.utils.http import http_client
+
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    for name, (url, _, _) in SITES.items():
+        try:
+            response = await http_client.get(url)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"{name} 抓取失败: {e}")
+            continue
+        (FIXTURES_DIR / f"{name}.html").write_bytes(response.content)
+        (FIXTURES_DIR / f"{name}.json").write_text(json.dumps({"url": url, "encoding": response.charset_encoding}))
+        print(f"{name}: 已保存 {len(response.content) / 1024:.0f} KB")
+    await http_client.close()
+
+
+def _outcome(fn: Callable[..., list], html: bytes, encoding: Optional[str]) -> Any:
+    try:
+        return fn(html, encoding)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def check_parity(name: str, html: bytes, encoding: Optional[str]) -> bool:
+    _, old, new = SITES[name]
+    expected, actual = _outcome(old, html, encoding), _outcome(new, html, encoding)
+    if expected == actual:
+        return True
+    print(f"{name}: 结果不一致")
+    if isinstance(expected, list) and isinstance(actual, list):
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            if a != b:
+                print(f"  第 {i + 1} 条\n    bs4:  {a}\n    lxml: {b}")
+                break
+        else:
+            print(f"  条数不同：bs4 {len(expected)} 条，lxml {len(actual)} 条")
+    else:
+        print(f"  bs4:  {str(expected)[:200]}\n  lxml: {str(actual)[:200]}")
+    return False
+
+
+def timeit(fn: Callable[..., list], html: bytes, encoding: Optional[str], rounds: int) -> float:
+    samples: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        _outcome(fn, html, encoding)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def peak_memory_kb(name: str, impl: str, html: bytes, encoding: Optional[str]) -> Optional[int]:
+    """在子进程中解析一次，返回峰值 RSS 的增量（KB）"""
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", name, impl, encoding or ""],
+        input=html, capture_output=True, cwd=Path.cwd(),
+    )
+    try:
+        return int(result.stdout.decode().strip().splitlines()[-1])
+    except (ValueError, IndexError):
+        # 非 Linux 系统或不支持重置峰值时不统计内存
+        return None
+
+
+def _proc_status_kb(field: str) -> int:
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(field + ":"):
+            return int(line.split()[1])
+    raise ValueError(field)
+
+
+def child(name: str, impl: str, encoding: str) -> None:
+    html = sys.stdin.buffer.read()
+    fn = SITES[name][1 if impl == "bs4" else 2]
+    # 导入模块时的内存峰值会掩盖解析的峰值，先把峰值重置为当前值（Linux）
+    Path("/proc/self/clear_refs").write_text("5")
+    before = _proc_status_kb("VmRSS")
+    _outcome(fn, html, encoding or None)
+    print(_proc_status_kb("VmHWM") - before)
+
+
+def run(rounds: int) -> bool:
+    fixtures = load_fixtures()
+    ok = True
+    print(f"{'page':<15}{'size KB':>8}{'items':>7}{'bs4 ms':>9}{'lxml ms':>9}{'speedup':>9}{'bs4 KB':>9}{'lxml KB':>9}  parity")
+    for name, (html, encoding) in fixtures.items():
+        _, old, new = SITES[name]
+        parity = check_parity(name, html, encoding)
+        ok = ok and parity
+        items = _outcome(new, html, encoding)
+        old_ms = timeit(old, html, encoding, rounds)
+        new_ms = timeit(new, html, encoding, rounds)
+        old_kb = peak_memory_kb(name, "bs4", html, encoding)
+        new_kb = peak_memory_kb(name, "lxml", html, encoding)
+        print(
+            f"{name:<15}{len(html) / 1024:>8.0f}{len(items) if isinstance(items, list) else 0:>7}"
+            f"{old_ms:>9.1f}{new_ms:>9.1f}{old_ms / new_ms:>8.1f}x"
+            f"{old_kb if old_kb is not None else '-':>9}{new_kb if new_kb is not None else '-':>9}"
+            f"  {'ok' if parity else 'DIFF'}"
+        )
+
+    print(f"\n{'page':<15}{'xpath ms':>9}{'now ms':>10}{'speedup':>9}  parity")
+    for name, previous in PREVIOUS_LXML.items():
+        html, encoding = fixtures[name]
+        current = SITES[name][2]
+        parity = _outcome(previous, html, encoding) == _outcome(current, html, encoding)
+        ok = ok and parity
+        previous_ms = timeit(previous, html, encoding, rounds)
+        current_ms = timeit(current, html, encoding, rounds)
+        print(
+            f"{name:<15}{previous_ms:>9.1f}{current_ms:>10.1f}{previous_ms / current_ms:>8.1f}x"
+            f"  {'ok' if parity else 'DIFF'}"
+        )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fetch", action="store_true", help="抓取各站点的真实页面保存到 fixtures 目录")
+    parser.add_argument("--rounds", type=int, default=10, help="每个页面的解析次数")
+    parser.add_argument("--child", nargs=3, metavar=("PAGE", "IMPL", "ENCODING"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+    if args.fetch:
+        asyncio.run(fetch_fixtures())
+    sys.exit(0 if run(args.rounds) else 1)
+
+
+if __name__ == "__main__":
+    main()
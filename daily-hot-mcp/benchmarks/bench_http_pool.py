@@ -0,0 +1,128 @@
+"""连接池冷/热启动延迟对比
+
+冷连接池：每次请求都新建 HttpClient，需要重新完成 DNS 解析、TCP 和 TLS 握手；
+热连接池：复用同一个 HttpClient，请求走已建立的 keep-alive 连接（HTTP/2 时复用同一条连接）。
+
+    python benchmarks/bench_http_pool.py                       # 请求主要数据源
+    python benchmarks/bench_http_pool.py --http2               # 同时比较 HTTP/2
+    python benchmarks/bench_http_pool.py --local               # 不联网，请求本机的测试服务器
+
+本机测试服务器没有 TLS 和网络往返，只能体现连接建立本身的开销，差距会明显小于真实数据源。
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from daily_hot_mcp.utils.http import HTTP2_AVAILABLE, HttpClient
+
+DEFAULT_URLS = [
+    "https://m.weibo.cn/api/container/getIndex?containerid=106003type%3D25%26t%3D3%26disable_hot%3D1%26filter_type%3Drealtimehot",
+    "https://api.bilibili.com/x/web-interface/popular",
+    "https://www.zhihu.com/api/v3/feed/topstory/hot-lists/total?limit=50",
+]
+
+
+async def _serve_local() -> asyncio.AbstractServer:
+    """最小的 HTTP/1.1 keep-alive 服务器"""
+    body = b'{"ok":true}'
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                if not request:
+                    break
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def _timed_get(client: HttpClient, url: str) -> Optional[float]:
+    start = time.perf_counter()
+    try:
+        await client.get(url)
+    except Exception as e:
+        print(f"  请求失败 {url}: {e}")
+        return None
+    return (time.perf_counter() - start) * 1000
+
+
+async def bench_url(url: str, rounds: int, config: Dict[str, Any]) -> Dict[str, List[float]]:
+    cold: List[float] = []
+    for _ in range(rounds):
+        client = HttpClient(config)
+        elapsed = await _timed_get(client, url)
+        await client.close()
+        if elapsed is not None:
+            cold.append(elapsed)
+
+    warm: List[float] = []
+    client = HttpClient(config)
+    await _timed_get(client, url)  # 建立连接
+    for _ in range(rounds):
+        elapsed = await _timed_get(client, url)
+        if elapsed is not None:
+            warm.append(elapsed)
+    await client.close()
+    return {"cold": cold, "warm": warm}
+
+
+def _fmt(samples: List[float]) -> str:
+    if not samples:
+        return f"{'-':>9}{'-':>9}"
+    p90 = sorted(samples)[int(0.9 * (len(samples) - 1))]
+    return f"{statistics.median(samples):>9.1f}{p90:>9.1f}"
+
+
+async def run(urls: List[str], rounds: int, http2: bool) -> None:
+    modes = [("http/1.1", {"http2": False})]
+    if http2:
+        if HTTP2_AVAILABLE:
+            modes.append(("http/2", {"http2": True}))
+        else:
+            print("未安装 h2，跳过 HTTP/2（pip install daily_hot_mcp[http2]）")
+
+    print(f"{'url':<40}{'mode':<10}{'cold p50':>9}{'p90':>9}{'warm p50':>9}{'p90':>9}  (ms)")
+    for url in urls:
+        for label, config in modes:
+            result = await bench_url(url, rounds, config)
+            print(f"{url[:38]:<40}{label:<10}{_fmt(result['cold'])}{_fmt(result['warm'])}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    urls = args.url or DEFAULT_URLS
+    server = None
+    if args.local:
+        server = await _serve_local()
+        host, port = server.sockets[0].getsockname()[:2]
+        urls = [f"http://{host}:{port}/"]
+    try:
+        await run(urls, args.rounds, args.http2 and not args.local)
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", action="append", help="要测试的 URL，可重复指定")
+    parser.add_argument("--rounds", type=int, default=10, help="每种模式的请求次数")
+    parser.add_argument("--http2", action="store_true", help="同时测试 HTTP/2")
+    parser.add_argument("--local", action="store_true", help="使用本机测试服务器")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""RSS 解析：feedparser 与 lxml 增量解析的一致性和性能对比
+
+对 BBC、InfoQ、The Verge 的源分别运行旧版（legacy_rss_parsers.py，读取完整响应后交给
+feedparser）和 utils/rss.py 中的增量解析：
+
+- 校验两者得到的条目完全相同，不一致时打印第一处差异并以非 0 退出；
+- 比较单次解析耗时的中位数，响应体按 --chunk 字节分段送入，模拟边下载边解析；
+- 比较传入 limit 时的耗时，并校验结果等于完整结果的前 limit 条；
+- malformed 为含有未声明实体的 BBC 源，用于确认增量解析出错时改用 feedparser 的结果不变。
+
+    python benchmarks/bench_rss.py              # 使用 fixtures 目录中的源，没有时使用内置的源
+    python benchmarks/bench_rss.py --fetch      # 先抓取各站点的真实源保存到 fixtures 目录
+
+fixtures 目录中的源是第三方网站的内容，不提交到仓库。feedparser 会清理摘要中的 HTML
+（去掉 script、style 等），真实源中含有这些标签时会显示为不一致，需要人工确认差异可以接受。
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+import legacy_rss_parsers as legacy
+from daily_hot_mcp.utils import rss
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# 名称 -> (源地址, 旧实现, 新实现)；malformed 由 BBC 的源生成，不抓取
+FEEDS: Dict[str, Tuple[Optional[str], Callable[..., Any], Callable[..., Any]]] = {
+    "bbc": ("https://feeds.bbci.co.uk/news/rss.xml", legacy.parse_rss_items, rss.parse_rss_items),
+    "infoq": ("https://feed.infoq.com/", legacy.parse_rss_items, rss.parse_rss_items),
+    "theverge": ("https://www.theverge.com/rss/index.xml", legacy.parse_rss_feed, rss.parse_rss_feed),
+    "malformed": (None, legacy.parse_rss_items, rss.parse_rss_items),
+}
+
+
+def _bbc(items: int = 60, description: str = "") -> bytes:
+    entries = "".join(
+        f"<item><title><![CDATA[Headline number {i}: minister says talks will continue]]></title>"
+        f"<description><![CDATA[The government says it will publish the plan next week {i}.]]>{description}</description>"
+        f"<link>https://www.bbc.com/news/articles/c{i:05d}?at_medium=RSS&amp;at_campaign=rss</link>"
+        f'<guid isPermaLink="false">https://www.bbc.com/news/articles/c{i:05d}#0</guid>'
+        f"<pubDate>Sat, 17 Oct 2026 {i % 24:02d}:15:00 GMT</pubDate>"
+        f'<media:thumbnail width="240" height="135" url="https://ichef.bbci.co.uk/ace/standard/240/{i}.jpg"/></item>\n'
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<?xml-stylesheet title="XSL_formatting" type="text/xsl" href="/shared/bsp/xsl/rss/nolsol.xsl"?>\n'
+        '<rss xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+        'xmlns:atom="http://www.w3.org/2005/Atom" version="2.0" xmlns:media="http://search.yahoo.com/mrss/">\n'
+        "<channel><title><![CDATA[BBC News]]></title><description><![CDATA[BBC News - News Front Page]]></description>"
+        "<link>https://www.bbc.co.uk/news</link>"
+        "<image><url>https://news.bbcimg.co.uk/nol/shared/img/bbc_news_120x60.gif</url><title>BBC News</title>"
+        "<link>https://www.bbc.co.uk/news</link></image><generator>RSS for Node</generator>"
+        "<lastBuildDate>Sat, 17 Oct 2026 23:50:00 GMT</lastBuildDate>"
+        '<atom:link href="https://feeds.bbci.co.uk/news/rss.xml" rel="self" type="application/rss+xml"/>'
+        "<copyright><![CDATA[Copyright: (C) British Broadcasting Corporation]]></copyright>"
+        f"<language><![CDATA[en-gb]]></language><ttl>15</ttl>\n{entries}</channel></rss>"
+    ).encode("utf-8")
+
+
+def _infoq(items: int = 15) -> bytes:
+    paragraph = "&lt;p&gt;The team explains how they migrated the service to an event-driven design.&lt;/p&gt;" * 6
+    entries = "".join(
+        f"<item><title>Article {i}: Scaling Event-Driven Systems &amp; Observability</title>"
+        f"<link>https://www.infoq.com/news/2026/10/article-{i}/?utm_campaign=infoq_content</link>"
+        f"<description>&lt;img src=\"https://res.infoq.com/news/2026/10/article-{i}/en/headerimage/x.jpg\" /&gt;{paragraph}</description>"
+        f"<category>Architecture</category><category>Cloud</category>"
+        f"<pubDate>Fri, 16 Oct 2026 {i % 24:02d}:00:00 GMT</pubDate>"
+        f"<guid>https://www.infoq.com/news/2026/10/article-{i}/</guid>"
+        f"<dc:creator>Author {i}</dc:creator><dc:date>2026-10-16T{i % 24:02d}:00:00Z</dc:date>"
+        + (f'<enclosure url="https://res.infoq.com/{i}.jpg" length="1" type="image/jpeg"/>' if i % 2 else "")
+        + "</item>\n"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        "<channel><title>InfoQ</title><link>https://www.infoq.com</link>"
+        "<description>InfoQ feed</description><language>en</language>\n"
+        f"{entries}</channel></rss>"
+    ).encode("utf-8")
+
+
+def _theverge(items: int = 10) -> bytes:
+    body = "<p>The company announced the new device on stage today, with shipping expected next month.</p>" * 40
+    entries = "".join(
+        f"<entry><author><name>Reporter {i}</name></author>"
+        f'<title type="html"><![CDATA[The new phone {i} is thinner than ever]]></title>'
+        f'<link rel="alternate" type="text/html" href="https://www.theverge.com/tech/{800000 + i}/new-phone"/>'
+        f"<id>https://www.theverge.com/?p={800000 + i}</id>"
+        f"<updated>2026-10-17T{i % 24:02d}:30:00-04:00</updated>"
+        f"<published>2026-10-17T{i % 24:02d}:00:00-04:00</published>"
+        f'<category scheme="https://www.theverge.com" term="Tech"/>'
+        f'<summary type="html"><![CDATA[A short summary of story {i}.]]></summary>'
+        f'<content type="html"><![CDATA[<figure><img alt="" src="https://platform.theverge.com/{i}.jpg"/></figure>{body}]]></content>'
+        "</entry>\n"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="en-US">'
+        '<title type="text">The Verge</title>'
+        '<subtitle type="text">The Verge is about technology and how it makes us feel.</subtitle>'
+        "<updated>2026-10-17T23:00:00-04:00</updated>"
+        '<link rel="alternate" type="text/html" href="https://www.theverge.com"/>'
+        '<link rel="self" type="application/atom+xml" href="https://www.theverge.com/rss/index.xml"/>'
+        "<id>https://www.theverge.com/rss/index.xml</id>\n"
+        f"{entries}</feed>"
+    ).encode("utf-8")
+
+
+def builtin_fixtures() -> Dict[str, Tuple[bytes, Optional[str]]]:
+    """按各站点源的结构生成的内置源"""
+    return {
+        "bbc": (_bbc(), None),
+        "infoq": (_infoq(), None),
+        "theverge": (_theverge(), None),
+        # HTML 实体在 XML 中未声明，增量解析会出错
+        "malformed": (_bbc(description="&nbsp;&mdash;"), "utf-8"),
+    }
+
+
+def load_fixtures() -> Dict[str, Tuple[bytes, Optional[str]]]:
+    """优先使用 fixtures 目录中保存的源"""
+    fixtures = builtin_fixtures()
+    for name in FEEDS:
+        path = FIXTURES_DIR / f"rss-{name}.xml"
+        if path.exists():
+            meta_path = path.with_suffix(".json")
+            encoding = json.loads(meta_path.read_text())["encoding"] if meta_path.exists() else None
+            fixtures[name] = (path.read_bytes(), encoding)
+            print(f"{name}: 使用 {path}")
+    return fixtures
+
+
+async def fetch_fixtures() -> None:
+    """抓取各站点的源保存到 fixtures 目录"""
+    from daily_hot_mcp.utils.http import http_client
+
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    for name, (url, _, _) in FEEDS.items():
+        if url is None:
+            continue
+        try:
+            response = await http_client.get(url)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"{name} 抓取失败: {e}")
+            continue
+        (FIXTURES_DIR / f"rss-{name}.xml").write_bytes(response.content)
+        (FIXTURES_DIR / f"rss-{name}.json").write_text(json.dumps({"url": url, "encoding": response.charset_encoding}))
+        print(f"{name}: 已保存 {len(response.content) / 1024:.0f} KB")
+    await http_client.close()
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+def _response(body: bytes, encoding: Optional[str], chunk: Optional[int] = None) -> httpx.Response:
+    """构造响应；chunk 不为空时响应体尚未读取，按 chunk 字节分段产生"""
+    content_type = "application/xml" + (f"; charset={encoding}" if encoding else "")
+    return httpx.Response(
+        200,
+        headers={"Content-Type": content_type},
+        content=_chunks(body, chunk) if chunk else body,
+        request=httpx.Request("GET", "https://example.com/feed"),
+    )
+
+
+class Runner:
+    """在同一个事件循环中运行新旧实现"""
+
+    def __init__(self, chunk: int):
+        self.chunk = chunk
+        self.loop = asyncio.new_event_loop()
+
+    def legacy(self, name: str, body: bytes, encoding: Optional[str]) -> Any:
+        return FEEDS[name][1](_response(body, encoding))
+
+    def current(self, name: str, body: bytes, encoding: Optional[str], limit: Optional[int] = None) -> Any:
+        response = _response(body, encoding, self.chunk)
+        return self.loop.run_until_complete(FEEDS[name][2](response, limit))
+
+
+def _entries(result: Any) -> List[Any]:
+    return result["feed"]["entry"] if isinstance(result, dict) else result
+
+
+def check_parity(name: str, expected: Any, actual: Any) -> bool:
+    if expected == actual:
+        return True
+    print(f"{name}: 结果不一致")
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        info = {k: v for k, v in expected["feed"].items() if k != "entry"}
+        actual_info = {k: v for k, v in actual["feed"].items() if k != "entry"}
+        if info != actual_info:
+            print(f"  源信息\n    feedparser: {info}\n    lxml:       {actual_info}")
+            return False
+    expected, actual = _entries(expected), _entries(actual)
+    for i, (a, b) in enumerate(zip(expected, actual)):
+        if a != b:
+            for key in a.keys() | b.keys():
+                if a.get(key) != b.get(key):
+                    print(f"  第 {i + 1} 条的 {key}\n    feedparser: {str(a.get(key))[:200]!r}\n    lxml:       {str(b.get(key))[:200]!r}")
+                    break
+            break
+    else:
+        print(f"  条数不同：feedparser {len(expected)} 条，lxml {len(actual)} 条")
+    return False
+
+
+def timeit(fn: Callable[[], Any], rounds: int) -> float:
+    samples: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def run(rounds: int, chunk: int, limit: int) -> bool:
+    fixtures = load_fixtures()
+    runner = Runner(chunk)
+    ok = True
+    print(
+        f"{'feed':<11}{'size KB':>8}{'items':>7}{'feedparser ms':>15}{'lxml ms':>9}{'speedup':>9}"
+        f"{f'limit={limit} ms':>15}  parity"
+    )
+    for name, (body, encoding) in fixtures.items():
+        expected = runner.legacy(name, body, encoding)
+        actual = runner.current(name, body, encoding)
+        parity = check_parity(name, expected, actual)
+        limited = _entries(runner.current(name, body, encoding, limit))
+        if limited != _entries(actual)[:limit]:
+            print(f"{name}: limit={limit} 的结果不是完整结果的前 {limit} 条")
+            parity = False
+        ok = ok and parity
+        old_ms = timeit(lambda: runner.legacy(name, body, encoding), rounds)
+        new_ms = timeit(lambda: runner.current(name, body, encoding), rounds)
+        limit_ms = timeit(lambda: runner.current(name, body, encoding, limit), rounds)
+        print(
+            f"{name:<11}{len(body) / 1024:>8.0f}{len(_entries(actual)):>7}"
+            f"{old_ms:>15.1f}{new_ms:>9.1f}{old_ms / new_ms:>8.1f}x{limit_ms:>15.1f}"
+            f"  {'ok' if parity else 'DIFF'}"
+        )
+    runner.loop.close()
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fetch", action="store_true", help="抓取各站点的真实源保存到 fixtures 目录")
+    parser.add_argument("--rounds", type=int, default=20, help="每个源的解析次数")
+    parser.add_argument("--chunk", type=int, default=16 * 1024, help="每次送入解析器的字节数")
+    parser.add_argument("--limit", type=int, default=10, help="提前结束时的条目数")
+    args = parser.parse_args()
+    if args.fetch:
+        asyncio.run(fetch_fixtures())
+    sys.exit(0 if run(args.rounds, args.chunk, args.limit) else 1)
+
+
+if __name__ == "__main__":
+    main()
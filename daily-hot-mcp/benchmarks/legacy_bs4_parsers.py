@@ -0,0 +1,353 @@
+"""旧版基于 BeautifulSoup + html.parser 的页面提取函数
+
+保留原样，作为 bench_html_extract.py 对比 lxml 实现的参照，不被服务代码使用。
+"""
+
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+
+def parse_baidu_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从百度热榜页面中提取热搜条目"""
+    soup = BeautifulSoup(html, "html.parser", from_encoding=encoding)
+
+    results = []
+    # 查找热榜条目
+    hot_items = soup.find_all("div", class_="category-wrap_iQLoo")
+
+    if not hot_items:
+        raise Exception("获取百度热榜失败")
+
+    for idx, item in enumerate(hot_items, 1):
+        # 标题
+        title_elem = item.find("div", class_="c-single-text-ellipsis")
+        title = title_elem.text.strip() if title_elem else ""
+
+        # 热搜指数
+        index_elem = item.find("div", class_="hot-index_1Bl1a")
+        hot_index = index_elem.text.strip() if index_elem else ""
+
+        # 描述
+        desc_elem = item.find("div", class_="hot-desc_1m_jR")
+        description = desc_elem.text.strip() if desc_elem else ""
+
+        # 链接
+        link_elem = item.find("a")
+        link = link_elem.get("href", "") if link_elem else ""
+        if link and not link.startswith("http"):
+            link = "https://www.baidu.com" + link
+
+        # 图片
+        img_elem = item.find("img")
+        cover = img_elem.get("src", "") if img_elem else ""
+
+        if title:  # 只有有标题的才添加
+            results.append(
+                {
+                    "title": title,
+                    "description": description,
+                    "popularity": hot_index,
+                    "link": link,
+                    "cover": cover,
+                    "rank": idx,
+                }
+            )
+
+    return results
+
+
+def parse_ithome_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从IT之家首页中提取新闻条目"""
+    soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
+    items = []
+    news_items = (
+        soup.select('.hot-list li a') + 
+        soup.select('.news-list li a') + 
+        soup.select('.list-box li a') +
+        soup.select('a[href*="/it/"]') +
+        soup.select('.post-item a') +
+        soup.select('.news-item a')
+    )
+    rank = 1
+    seen_titles = set()
+    for item in news_items:
+        try:
+            title = item.get_text(strip=True)
+            if not title or len(title) < 5 or title in seen_titles:
+                continue
+            if any(skip in title for skip in ['登录', '注册', '首页', '下载', '更多']):
+                continue
+            seen_titles.add(title)
+            link = item.get('href', '')
+            if link and not link.startswith('http'):
+                if link.startswith('/'):
+                    link = 'https://www.ithome.com' + link
+                else:
+                    link = 'https://www.ithome.com/' + link
+            desc = ""
+            parent = item.parent
+            if parent:
+                desc_elem = (parent.find('p') or 
+                           parent.find('div', class_='summary') or 
+                           parent.find('div', class_='content') or
+                           parent.find('span', class_='desc'))
+                if desc_elem:
+                    desc = desc_elem.get_text(strip=True)[:200]
+            if not desc:
+                desc = f"IT之家科技资讯 - {title}"
+            publish_time = ""
+            if parent:
+                time_elem = (parent.find('time') or 
+                           parent.find('span', class_='time') or 
+                           parent.find('div', class_='time') or
+                           parent.find('.post-time'))
+                if time_elem:
+                    publish_time = time_elem.get_text(strip=True)
+            hot_count = ""
+            if parent:
+                hot_elem = (parent.find('span', class_='hot') or 
+                          parent.find('span', class_='comment') or 
+                          parent.find('span', class_='view') or
+                          parent.find('.comment-count'))
+                if hot_elem:
+                    hot_count = hot_elem.get_text(strip=True)
+            item_data = {
+                'rank': rank,
+                'title': title,
+                'desc': desc,
+                'url': link or f"https://www.ithome.com/search?q={title}",
+                'source': 'IT之家',
+                'publish_time': publish_time,
+                'hot_count': hot_count,
+                'category': '科技资讯',
+                'tags': ['科技', '数码', 'IT资讯', '互联网']
+            }
+            items.append(item_data)
+            rank += 1
+            if rank > 50:
+                break
+        except Exception as e:
+            continue
+    return items
+
+
+def parse_autohome_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从汽车之家首页中提取资讯条目"""
+    soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
+    
+    results = []
+    
+    # 查找热门新闻和汽车资讯
+    news_items = (
+        soup.select('.list-article li a') +
+        soup.select('.hot-news li a') +
+        soup.select('.news-list li a') +
+        soup.select('a[href*="/news/"]') +
+        soup.select('a[href*="/advice/"]') +
+        soup.select('a[href*="/drive/"]')
+    )
+    
+    rank = 1
+    seen_titles = set()
+    
+    for item in news_items:
+        try:
+            title = item.get_text(strip=True)
+            if not title or len(title) < 5 or title in seen_titles:
+                continue
+            
+            # 过滤掉导航链接和无效内容
+            if any(skip in title for skip in ['登录', '注册', '首页', '下载', '更多', '论坛', '导航']):
+                continue
+            
+            seen_titles.add(title)
+            
+            link = item.get('href', '')
+            if link and not link.startswith('http'):
+                if link.startswith('//'):
+                    link = 'https:' + link
+                elif link.startswith('/'):
+                    link = 'https://www.autohome.com.cn' + link
+                else:
+                    link = 'https://www.autohome.com.cn/' + link
+            
+            # 获取描述信息
+            desc = ""
+            parent = item.parent
+            if parent:
+                desc_elem = (parent.find('p') or 
+                           parent.find('div', class_='summary') or 
+                           parent.find('span', class_='desc') or
+                           parent.find('div', class_='content'))
+                if desc_elem:
+                    desc = desc_elem.get_text(strip=True)[:200]
+            
+            if not desc:
+                desc = f"汽车之家资讯 - {title}"
+            
+            # 尝试获取时间和评论数
+            publish_time = ""
+            comment_count = ""
+            
+            if parent:
+                time_elem = (parent.find('time') or 
+                           parent.find('span', class_='time') or 
+                           parent.find('.date'))
+                if time_elem:
+                    publish_time = time_elem.get_text(strip=True)
+                
+                comment_elem = (parent.find('span', class_='comment') or 
+                              parent.find('.comment-count') or
+                              parent.find('span', string=lambda text: text and '评论' in text))
+                if comment_elem:
+                    comment_count = comment_elem.get_text(strip=True)
+            
+            # 判断文章类型
+            category = "汽车资讯"
+            if '/news/' in link:
+                category = "汽车新闻"
+            elif '/advice/' in link:
+                category = "购车指南"
+            elif '/drive/' in link:
+                category = "试驾体验"
+            elif '/dealer/' in link:
+                category = "经销商"
+            
+            item_data = {
+                'rank': rank,
+                'title': title,
+                'desc': desc,
+                'url': link or f"https://www.autohome.com.cn/search?q={title}",
+                'source': '汽车之家',
+                'publish_time': publish_time,
+                'comment_count': comment_count,
+                'category': category,
+                'tags': ['汽车', '汽车资讯', '购车', '试驾']
+            }
+            
+            results.append(item_data)
+            rank += 1
+            
+            if rank > 50:
+                break
+                
+        except Exception as e:
+            continue
+
+    return results
+
+
+def parse_hupu_bxj_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从步行街页面中提取热帖"""
+    soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
+    results = []
+    thread_list = soup.find_all(['tr', 'li', 'div'], class_=lambda x: x and any(
+        keyword in x.lower() for keyword in ['thread', 'post', 'topic', 'item']
+    ))
+    if not thread_list:
+        raise Exception("步行街页面中没有找到帖子列表")
+    rank = 1
+    for item in thread_list:
+        title_elem = item.find('a', href=True)
+        if not title_elem:
+            title_elem = item.find(['span', 'div'], string=lambda text: text and len(text.strip()) > 5)
+        if title_elem:
+            title = title_elem.get_text(strip=True)
+            if title and len(title) > 5 and not any(skip in title for skip in ['登录', '注册', '首页']):
+                url = title_elem.get('href', '') if title_elem.name == 'a' else ""
+                if url and not url.startswith('http'):
+                    url = f"https://bbs.hupu.com{url}"
+                reply_elem = item.find(string=lambda text: text and any(
+                    char in text for char in ['回复', '浏览', '万', '热度']
+                ))
+                reply_count = reply_elem.strip() if reply_elem else ""
+                results.append({
+                    "rank": rank,
+                    "title": title,
+                    "desc": f"虎扑步行街热帖 - {title}",
+                    "url": url or f"https://www.hupu.com/search?q={title}",
+                    "reply_count": reply_count,
+                    "source": "虎扑",
+                    "category": "步行街热帖"
+                })
+                rank += 1
+                if rank > 50:
+                    break
+    if not results:
+        raise Exception("步行街页面中没有解析到热帖")
+    return results[:50]
+
+
+def parse_hupu_homepage_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从虎扑首页中提取热门内容"""
+    soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
+    results = []
+    hot_items = soup.find_all(['a', 'div'], href=True) + soup.find_all(['div', 'span'], class_=lambda x: x and 'hot' in x.lower())
+    rank = 1
+    for item in hot_items:
+        if item.name == 'a':
+            title = item.get_text(strip=True)
+            url = item.get('href', '')
+        else:
+            link_elem = item.find('a', href=True)
+            if link_elem:
+                title = link_elem.get_text(strip=True)
+                url = link_elem.get('href', '')
+            else:
+                title = item.get_text(strip=True)
+                url = ""
+        if title and len(title) > 5 and not any(skip in title for skip in ['登录', '注册', '首页', '下载']):
+            if url and not url.startswith('http'):
+                url = f"https://www.hupu.com{url}"
+            results.append({
+                "rank": rank,
+                "title": title,
+                "desc": f"虎扑热门内容 - {title}",
+                "url": url or f"https://www.hupu.com/search?q={title}",
+                "reply_count": "",
+                "source": "虎扑",
+                "category": "热门内容"
+            })
+            rank += 1
+            if rank > 50:
+                break
+    return results[:50]
+
+
+def parse_sogou_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从搜狗搜索页面中提取热搜词"""
+    soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
+    
+    results = []
+    
+    # 搜索热搜相关的元素
+    hot_elements = soup.find_all(['div', 'span', 'a'], class_=lambda x: x and any(
+        keyword in x.lower() for keyword in ['hot', 'trend', 'popular', 'search']
+    ))
+    
+    # 没有找到足够的热搜元素时由备用接口提供数据
+    if not hot_elements or len(hot_elements) < 5:
+        raise Exception("搜狗页面中没有找到热搜元素")
+        
+    # 提取热搜内容
+    for idx, element in enumerate(hot_elements[:50], 1):
+        text = element.get_text(strip=True)
+        if text and len(text) > 2:  # 过滤太短的文本
+            link = element.get('href', '')
+            if not link.startswith('http'):
+                link = f"https://www.sogou.com/web?query={text}"
+            
+            results.append({
+                "rank": idx,
+                "title": text,
+                "desc": f"搜狗热搜关键词 - {text}",
+                "url": link,
+                "source": "搜狗搜索",
+                "category": "热搜词"
+            })
+    
+    if not results:
+        raise Exception("搜狗页面中没有解析到热搜")
+    
+    return results[:50]
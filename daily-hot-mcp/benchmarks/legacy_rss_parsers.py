@@ -0,0 +1,75 @@
+"""RSS 的 feedparser 解析实现
+
+utils/rss.py 改为 lxml 增量解析之前的版本：读取完整的响应文本后交给 feedparser。
+保留原样，供 bench_rss.py 对比，不被服务代码使用。
+"""
+
+import feedparser
+import httpx
+from typing import Dict, List, Any
+
+
+def parse_rss_items(response: httpx.Response) -> List[Dict[str, Any]]:
+    """把RSS响应解析为条目列表"""
+    # 解析RSS
+    feed = feedparser.parse(response.text)
+    
+    if not feed.entries:
+        return []
+    
+    results = []
+    for entry in feed.entries:
+        item = {
+            "title": getattr(entry, "title", ""),
+            "description": getattr(entry, "summary", ""),
+            "link": getattr(entry, "link", ""),
+            "author": getattr(entry, "author", ""),
+            "publish_time": getattr(entry, "published", ""),
+        }
+        
+        # 处理封面图片
+        cover = None
+        if hasattr(entry, "media_content") and entry.media_content:
+            cover = entry.media_content[0].get("url")
+        elif hasattr(entry, "enclosures") and entry.enclosures:
+            for enclosure in entry.enclosures:
+                if enclosure.get("type", "").startswith("image/"):
+                    cover = enclosure.get("href")
+                    break
+        
+        if cover:
+            item["cover"] = cover
+        
+        results.append(item)
+    
+    return results
+
+
+def parse_rss_feed(response: httpx.Response) -> Dict[str, Any]:
+    """把RSS响应解析为原始结构"""
+    # 解析RSS
+    feed_data = feedparser.parse(response.text)
+    
+    # 转换为字典格式
+    result = {
+        "feed": {
+            "title": getattr(feed_data.feed, "title", ""),
+            "description": getattr(feed_data.feed, "description", ""),
+            "link": getattr(feed_data.feed, "link", ""),
+            "entry": []
+        }
+    }
+    
+    # 添加条目
+    for entry in feed_data.entries:
+        entry_dict = {
+            "title": getattr(entry, "title", ""),
+            "summary": getattr(entry, "summary", ""),
+            "link": getattr(entry, "link", ""),
+            "id": getattr(entry, "id", ""),
+            "published": getattr(entry, "published", ""),
+            "author": getattr(entry, "author", ""),
+        }
+        result["feed"]["entry"].append(entry_dict)
+    
+    return result
@@ -0,0 +1,350 @@
+"""IT之家、汽车之家、虎扑、搜狗的 XPath 提取实现
+
+工具改写之前的 lxml 版本，保留原样，供 bench_html_extract.py 对比，不被服务代码使用：
+
+- IT之家、汽车之家：先用六个选择器分别查询整个文档再拼接，每个链接再对父元素做多次查询；
+- 虎扑、搜狗：用 translate() 把每个元素的 class 转为小写后逐个关键字匹配，先取出全部候选元素。
+"""
+
+from typing import Optional
+
+from daily_hot_mcp.utils.html_extract import class_contains, first, get_text, has_class, iter_strings, parse_html, tag_string, xpath
+
+
+# ithome
+_ITHOME_NEWS_LINKS = [
+    xpath(f"//*[{has_class('hot-list')}]//li//a"),
+    xpath(f"//*[{has_class('news-list')}]//li//a"),
+    xpath(f"//*[{has_class('list-box')}]//li//a"),
+    xpath("//a[contains(@href, '/it/')]"),
+    xpath(f"//*[{has_class('post-item')}]//a"),
+    xpath(f"//*[{has_class('news-item')}]//a"),
+]
+
+_ITHOME_DESC = [
+    xpath("(.//p)[1]"),
+    xpath(f"(.//div[{has_class('summary')}])[1]"),
+    xpath(f"(.//div[{has_class('content')}])[1]"),
+    xpath(f"(.//span[{has_class('desc')}])[1]"),
+]
+
+_ITHOME_TIME = [
+    xpath("(.//time)[1]"),
+    xpath(f"(.//span[{has_class('time')}])[1]"),
+    xpath(f"(.//div[{has_class('time')}])[1]"),
+]
+
+_ITHOME_HOT_COUNT = [
+    xpath(f"(.//span[{has_class('hot')}])[1]"),
+    xpath(f"(.//span[{has_class('comment')}])[1]"),
+    xpath(f"(.//span[{has_class('view')}])[1]"),
+]
+
+def parse_ithome_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从IT之家首页中提取新闻条目"""
+    root = parse_html(html, encoding)
+    items = []
+    news_items = [link for selector in _ITHOME_NEWS_LINKS for link in selector(root)]
+    rank = 1
+    seen_titles = set()
+    for item in news_items:
+        try:
+            title = get_text(item, strip=True)
+            if not title or len(title) < 5 or title in seen_titles:
+                continue
+            if any(skip in title for skip in ['登录', '注册', '首页', '下载', '更多']):
+                continue
+            seen_titles.add(title)
+            link = item.get('href', '')
+            if link and not link.startswith('http'):
+                if link.startswith('/'):
+                    link = 'https://www.ithome.com' + link
+                else:
+                    link = 'https://www.ithome.com/' + link
+            desc = ""
+            parent = item.getparent()
+            if parent is not None:
+                desc_elem = first(parent, *_ITHOME_DESC)
+                if desc_elem is not None:
+                    desc = get_text(desc_elem, strip=True)[:200]
+            if not desc:
+                desc = f"IT之家科技资讯 - {title}"
+            publish_time = ""
+            if parent is not None:
+                time_elem = first(parent, *_ITHOME_TIME)
+                if time_elem is not None:
+                    publish_time = get_text(time_elem, strip=True)
+            hot_count = ""
+            if parent is not None:
+                hot_elem = first(parent, *_ITHOME_HOT_COUNT)
+                if hot_elem is not None:
+                    hot_count = get_text(hot_elem, strip=True)
+            item_data = {
+                'rank': rank,
+                'title': title,
+                'desc': desc,
+                'url': link or f"https://www.ithome.com/search?q={title}",
+                'source': 'IT之家',
+                'publish_time': publish_time,
+                'hot_count': hot_count,
+                'category': '科技资讯',
+                'tags': ['科技', '数码', 'IT资讯', '互联网']
+            }
+            items.append(item_data)
+            rank += 1
+            if rank > 50:
+                break
+        except Exception as e:
+            continue
+    return items
+
+
+# autohome
+_AUTOHOME_NEWS_LINKS = [
+    xpath(f"//*[{has_class('list-article')}]//li//a"),
+    xpath(f"//*[{has_class('hot-news')}]//li//a"),
+    xpath(f"//*[{has_class('news-list')}]//li//a"),
+    xpath("//a[contains(@href, '/news/')]"),
+    xpath("//a[contains(@href, '/advice/')]"),
+    xpath("//a[contains(@href, '/drive/')]"),
+]
+
+_AUTOHOME_DESC = [
+    xpath("(.//p)[1]"),
+    xpath(f"(.//div[{has_class('summary')}])[1]"),
+    xpath(f"(.//span[{has_class('desc')}])[1]"),
+    xpath(f"(.//div[{has_class('content')}])[1]"),
+]
+
+_AUTOHOME_TIME = [
+    xpath("(.//time)[1]"),
+    xpath(f"(.//span[{has_class('time')}])[1]"),
+]
+
+_AUTOHOME_COMMENT = xpath(f"(.//span[{has_class('comment')}])[1]")
+
+_AUTOHOME_SPANS = xpath(".//span")
+
+def parse_autohome_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从汽车之家首页中提取资讯条目"""
+    root = parse_html(html, encoding)
+    
+    results = []
+    
+    # 查找热门新闻和汽车资讯
+    news_items = [link for selector in _AUTOHOME_NEWS_LINKS for link in selector(root)]
+    
+    rank = 1
+    seen_titles = set()
+    
+    for item in news_items:
+        try:
+            title = get_text(item, strip=True)
+            if not title or len(title) < 5 or title in seen_titles:
+                continue
+            
+            # 过滤掉导航链接和无效内容
+            if any(skip in title for skip in ['登录', '注册', '首页', '下载', '更多', '论坛', '导航']):
+                continue
+            
+            seen_titles.add(title)
+            
+            link = item.get('href', '')
+            if link and not link.startswith('http'):
+                if link.startswith('//'):
+                    link = 'https:' + link
+                elif link.startswith('/'):
+                    link = 'https://www.autohome.com.cn' + link
+                else:
+                    link = 'https://www.autohome.com.cn/' + link
+            
+            # 获取描述信息
+            desc = ""
+            parent = item.getparent()
+            if parent is not None:
+                desc_elem = first(parent, *_AUTOHOME_DESC)
+                if desc_elem is not None:
+                    desc = get_text(desc_elem, strip=True)[:200]
+            
+            if not desc:
+                desc = f"汽车之家资讯 - {title}"
+            
+            # 尝试获取时间和评论数
+            publish_time = ""
+            comment_count = ""
+            
+            if parent is not None:
+                time_elem = first(parent, *_AUTOHOME_TIME)
+                if time_elem is not None:
+                    publish_time = get_text(time_elem, strip=True)
+                
+                comment_elem = first(parent, _AUTOHOME_COMMENT)
+                if comment_elem is None:
+                    comment_elem = next(
+                        (span for span in _AUTOHOME_SPANS(parent) if '评论' in (tag_string(span) or '')), None
+                    )
+                if comment_elem is not None:
+                    comment_count = get_text(comment_elem, strip=True)
+            
+            # 判断文章类型
+            category = "汽车资讯"
+            if '/news/' in link:
+                category = "汽车新闻"
+            elif '/advice/' in link:
+                category = "购车指南"
+            elif '/drive/' in link:
+                category = "试驾体验"
+            elif '/dealer/' in link:
+                category = "经销商"
+            
+            item_data = {
+                'rank': rank,
+                'title': title,
+                'desc': desc,
+                'url': link or f"https://www.autohome.com.cn/search?q={title}",
+                'source': '汽车之家',
+                'publish_time': publish_time,
+                'comment_count': comment_count,
+                'category': category,
+                'tags': ['汽车', '汽车资讯', '购车', '试驾']
+            }
+            
+            results.append(item_data)
+            rank += 1
+            
+            if rank > 50:
+                break
+                
+        except Exception as e:
+            continue
+
+    return results
+
+
+# hupu
+_HUPU_THREADS = xpath(f"//*[self::tr or self::li or self::div][{class_contains('thread', 'post', 'topic', 'item')}]")
+_HUPU_THREAD_LINK = xpath("(.//a[@href])[1]")
+_HUPU_THREAD_TEXT_BLOCKS = xpath(".//*[self::span or self::div]")
+
+def parse_hupu_bxj_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从步行街页面中提取热帖"""
+    root = parse_html(html, encoding)
+    results = []
+    thread_list = _HUPU_THREADS(root)
+    if not thread_list:
+        raise Exception("步行街页面中没有找到帖子列表")
+    rank = 1
+    for item in thread_list:
+        title_elem = first(item, _HUPU_THREAD_LINK)
+        if title_elem is None:
+            title_elem = next((
+                el for el in _HUPU_THREAD_TEXT_BLOCKS(item)
+                if len((tag_string(el) or '').strip()) > 5
+            ), None)
+        if title_elem is not None:
+            title = get_text(title_elem, strip=True)
+            if title and len(title) > 5 and not any(skip in title for skip in ['登录', '注册', '首页']):
+                url = title_elem.get('href', '') if title_elem.tag == 'a' else ""
+                if url and not url.startswith('http'):
+                    url = f"https://bbs.hupu.com{url}"
+                reply_elem = next((
+                    text for text in iter_strings(item)
+                    if any(char in text for char in ['回复', '浏览', '万', '热度'])
+                ), None)
+                reply_count = reply_elem.strip() if reply_elem else ""
+                results.append({
+                    "rank": rank,
+                    "title": title,
+                    "desc": f"虎扑步行街热帖 - {title}",
+                    "url": url or f"https://www.hupu.com/search?q={title}",
+                    "reply_count": reply_count,
+                    "source": "虎扑",
+                    "category": "步行街热帖"
+                })
+                rank += 1
+                if rank > 50:
+                    break
+    if not results:
+        raise Exception("步行街页面中没有解析到热帖")
+    return results[:50]
+
+
+_HUPU_HOME_LINKS = xpath("//*[self::a or self::div][@href]")
+_HUPU_HOME_HOT_BLOCKS = xpath(f"//*[self::div or self::span][{class_contains('hot')}]")
+_HUPU_FIRST_LINK = xpath("(.//a[@href])[1]")
+
+def parse_hupu_homepage_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从虎扑首页中提取热门内容"""
+    root = parse_html(html, encoding)
+    results = []
+    hot_items = _HUPU_HOME_LINKS(root) + _HUPU_HOME_HOT_BLOCKS(root)
+    rank = 1
+    for item in hot_items:
+        if item.tag == 'a':
+            title = get_text(item, strip=True)
+            url = item.get('href', '')
+        else:
+            link_elem = first(item, _HUPU_FIRST_LINK)
+            if link_elem is not None:
+                title = get_text(link_elem, strip=True)
+                url = link_elem.get('href', '')
+            else:
+                title = get_text(item, strip=True)
+                url = ""
+        if title and len(title) > 5 and not any(skip in title for skip in ['登录', '注册', '首页', '下载']):
+            if url and not url.startswith('http'):
+                url = f"https://www.hupu.com{url}"
+            results.append({
+                "rank": rank,
+                "title": title,
+                "desc": f"虎扑热门内容 - {title}",
+                "url": url or f"https://www.hupu.com/search?q={title}",
+                "reply_count": "",
+                "source": "虎扑",
+                "category": "热门内容"
+            })
+            rank += 1
+            if rank > 50:
+                break
+    return results[:50]
+
+
+# sogou
+_SOGOU_HOT_ELEMENTS = xpath(
+    f"//*[self::div or self::span or self::a][{class_contains('hot', 'trend', 'popular', 'search')}]"
+)
+
+def parse_sogou_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从搜狗搜索页面中提取热搜词"""
+    root = parse_html(html, encoding)
+    
+    results = []
+    
+    # 搜索热搜相关的元素
+    hot_elements = _SOGOU_HOT_ELEMENTS(root)
+    
+    # 没有找到足够的热搜元素时由备用接口提供数据
+    if not hot_elements or len(hot_elements) < 5:
+        raise Exception("搜狗页面中没有找到热搜元素")
+        
+    # 提取热搜内容
+    for idx, element in enumerate(hot_elements[:50], 1):
+        text = get_text(element, strip=True)
+        if text and len(text) > 2:  # 过滤太短的文本
+            link = element.get('href', '')
+            if not link.startswith('http'):
+                link = f"https://www.sogou.com/web?query={text}"
+            
+            results.append({
+                "rank": idx,
+                "title": text,
+                "desc": f"搜狗热搜关键词 - {text}",
+                "url": link,
+                "source": "搜狗搜索",
+                "category": "热搜词"
+            })
+    
+    if not results:
+        raise Exception("搜狗页面中没有解析到热搜")
+    
+    return results[:50]
@@ -1,9 +1,57 @@
+import asyncio
+import anyio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
 from fastmcp import FastMCP
+from daily_hot_mcp.utils.cache import cache
+from daily_hot_mcp.utils.http import http_client
+from daily_hot_mcp.utils.parse_pool import parse_pool
 from daily_hot_mcp.utils.logger import logger
+from daily_hot_mcp.utils.singleflight import singleflight
+from daily_hot_mcp.utils.swr import swr_cache
+from daily_hot_mcp.utils.strategy import strategy_board
+from daily_hot_mcp.utils.warmup import run_warmup
 from daily_hot_mcp.tools import all_tools
 
+_sessions = 0
+_background_tasks: List["asyncio.Task[None]"] = []
+
+
+@asynccontextmanager
+async def lifespan(app: FastMCP) -> AsyncIterator[dict]:
+    """启动和停止后台任务（缓存清理、连接预热等）
+
+    FastMCP 会为每个客户端会话进入一次 lifespan，因此按会话计数：
+    第一个会话开始时启动后台任务，最后一个会话结束时停止，并关闭 HTTP 客户端的连接。
+    SWR 后台刷新和调用方已离开的合并请求不属于任何会话，关闭客户端前先取消并等待它们。
+    """
+    global _sessions
+    _sessions += 1
+    if _sessions == 1:
+        _background_tasks.append(asyncio.create_task(cache.run_sweeper()))
+        _background_tasks.append(asyncio.create_task(run_warmup()))
+    try:
+        yield {}
+    finally:
+        _sessions -= 1
+        if _sessions == 0:
+            for task in _background_tasks:
+                task.cancel()
+            # 会话结束时 lifespan 所在的任务可能正被取消，清理过程不能被打断
+            with anyio.CancelScope(shield=True):
+                await asyncio.gather(*_background_tasks, return_exceptions=True)
+                _background_tasks.clear()
+                await swr_cache.cancel_refreshes()
+                await singleflight.cancel_all()
+                cache.flush()
+                strategy_board.flush()
+                await http_client.close()
+                parse_pool.shutdown()
+
+
 # 重命名变量，使其符合 mcp dev 命令的预期
-server = FastMCP(name = "daily-hot-mcp")
+server = FastMCP(name = "daily-hot-mcp", lifespan=lifespan)
 
 for tool in all_tools:
     server.add_tool(tool)
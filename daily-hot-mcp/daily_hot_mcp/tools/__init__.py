@@ -27,8 +27,10 @@ from .toutiao import toutiao_hot_tools
 from .weibo import weibo_hot_tools
 from .weread import weread_hot_tools
 from .crawlweb import crawl_website_hot_tools
+from .diagnostics import diagnostics_tools
+from daily_hot_mcp.utils.tool_cache import apply_tool_cache
 
-all_tools = [
+_source_tools = [
     *baidu_hot_tools,
     *kr36_hot_tools,
     *autohome_hot_tools,
@@ -59,3 +61,7 @@ all_tools = [
     *weread_hot_tools,
     *crawl_website_hot_tools,
 ]
+
+# 统一加上缓存：按工具名和参数缓存，支持 force_refresh，相同参数的并发调用只请求一次上游
+# 诊断工具反映实时状态，不经过缓存
+all_tools = apply_tool_cache(_source_tools) + diagnostics_tools
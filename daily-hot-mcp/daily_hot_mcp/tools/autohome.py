@@ -1,12 +1,121 @@
 """汽车之家热榜工具"""
 
 import asyncio
-from daily_hot_mcp.utils import http_client
+from typing import Optional
+from daily_hot_mcp.utils import http_client, parse_pool
+from daily_hot_mcp.utils.html_extract import find_firsts, get_text, iter_links, match, parse_html, tag_string
+from daily_hot_mcp.utils.swr import placeholder
 from fastmcp.tools import Tool
-from bs4 import BeautifulSoup
 import json
 
 
+# 依次收集各区域的资讯链接，同一标题只保留第一次出现的
+_NEWS_LINKS = [
+    ("list", "list-article"),
+    ("list", "hot-news"),
+    ("list", "news-list"),
+    ("href", "/news/"),
+    ("href", "/advice/"),
+    ("href", "/drive/"),
+]
+
+
+def _is_comment_span(el) -> bool:
+    text = tag_string(el) if el.tag == 'span' else None
+    return bool(text) and '评论' in text
+
+
+# 在链接的父元素中查找描述、时间和评论数，每组按优先级排列
+_METADATA = [
+    [match("p"), match("div", "summary"), match("span", "desc"), match("div", "content")],
+    [match("time"), match("span", "time")],
+    [match("span", "comment"), _is_comment_span],
+]
+
+
+def parse_autohome_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从汽车之家首页中提取资讯条目
+
+    只遍历一次文档中的链接，同一父元素下的链接共用一次元数据查找，取够 50 条即停止。
+    """
+    root = parse_html(html, encoding)
+    
+    results = []
+    metadata = {}
+    rank = 1
+    seen_titles = set()
+    
+    for item in iter_links(root, _NEWS_LINKS):
+        try:
+            title = get_text(item, strip=True)
+            if not title or len(title) < 5 or title in seen_titles:
+                continue
+            
+            # 过滤掉导航链接和无效内容
+            if any(skip in title for skip in ['登录', '注册', '首页', '下载', '更多', '论坛', '导航']):
+                continue
+            
+            seen_titles.add(title)
+            
+            link = item.get('href', '')
+            if link and not link.startswith('http'):
+                if link.startswith('//'):
+                    link = 'https:' + link
+                elif link.startswith('/'):
+                    link = 'https://www.autohome.com.cn' + link
+                else:
+                    link = 'https://www.autohome.com.cn/' + link
+            
+            # 获取描述、时间和评论数
+            desc = publish_time = comment_count = ""
+            parent = item.getparent()
+            if parent is not None:
+                if parent not in metadata:
+                    metadata[parent] = [
+                        get_text(elem, strip=True) if elem is not None else ""
+                        for elem in find_firsts(parent, _METADATA)
+                    ]
+                desc, publish_time, comment_count = metadata[parent]
+                desc = desc[:200]
+            
+            if not desc:
+                desc = f"汽车之家资讯 - {title}"
+            
+            # 判断文章类型
+            category = "汽车资讯"
+            if '/news/' in link:
+                category = "汽车新闻"
+            elif '/advice/' in link:
+                category = "购车指南"
+            elif '/drive/' in link:
+                category = "试驾体验"
+            elif '/dealer/' in link:
+                category = "经销商"
+            
+            item_data = {
+                'rank': rank,
+                'title': title,
+                'desc': desc,
+                'url': link or f"https://www.autohome.com.cn/search?q={title}",
+                'source': '汽车之家',
+                'publish_time': publish_time,
+                'comment_count': comment_count,
+                'category': category,
+                'tags': ['汽车', '汽车资讯', '购车', '试驾']
+            }
+            
+            results.append(item_data)
+            rank += 1
+            
+            if rank > 50:
+                break
+                
+        except Exception as e:
+            continue
+
+    return results
+
+
 async def get_autohome_trending_func(args: dict) -> list:
     """获取汽车之家热榜数据"""
     headers = {
@@ -24,107 +133,10 @@ async def get_autohome_trending_func(args: dict) -> list:
         )
         
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        results = []
-        
-        # 查找热门新闻和汽车资讯
-        news_items = (
-            soup.select('.list-article li a') +
-            soup.select('.hot-news li a') +
-            soup.select('.news-list li a') +
-            soup.select('a[href*="/news/"]') +
-            soup.select('a[href*="/advice/"]') +
-            soup.select('a[href*="/drive/"]')
+        results = await parse_pool.run(
+            "autohome", parse_autohome_html, response.content, response.charset_encoding, heavy=True
         )
         
-        rank = 1
-        seen_titles = set()
-        
-        for item in news_items:
-            try:
-                title = item.get_text(strip=True)
-                if not title or len(title) < 5 or title in seen_titles:
-                    continue
-                
-                # 过滤掉导航链接和无效内容
-                if any(skip in title for skip in ['登录', '注册', '首页', '下载', '更多', '论坛', '导航']):
-                    continue
-                
-                seen_titles.add(title)
-                
-                link = item.get('href', '')
-                if link and not link.startswith('http'):
-                    if link.startswith('//'):
-                        link = 'https:' + link
-                    elif link.startswith('/'):
-                        link = 'https://www.autohome.com.cn' + link
-                    else:
-                        link = 'https://www.autohome.com.cn/' + link
-                
-                # 获取描述信息
-                desc = ""
-                parent = item.parent
-                if parent:
-                    desc_elem = (parent.find('p') or 
-                               parent.find('div', class_='summary') or 
-                               parent.find('span', class_='desc') or
-                               parent.find('div', class_='content'))
-                    if desc_elem:
-                        desc = desc_elem.get_text(strip=True)[:200]
-                
-                if not desc:
-                    desc = f"汽车之家资讯 - {title}"
-                
-                # 尝试获取时间和评论数
-                publish_time = ""
-                comment_count = ""
-                
-                if parent:
-                    time_elem = (parent.find('time') or 
-                               parent.find('span', class_='time') or 
-                               parent.find('.date'))
-                    if time_elem:
-                        publish_time = time_elem.get_text(strip=True)
-                    
-                    comment_elem = (parent.find('span', class_='comment') or 
-                                  parent.find('.comment-count') or
-                                  parent.find('span', string=lambda text: text and '评论' in text))
-                    if comment_elem:
-                        comment_count = comment_elem.get_text(strip=True)
-                
-                # 判断文章类型
-                category = "汽车资讯"
-                if '/news/' in link:
-                    category = "汽车新闻"
-                elif '/advice/' in link:
-                    category = "购车指南"
-                elif '/drive/' in link:
-                    category = "试驾体验"
-                elif '/dealer/' in link:
-                    category = "经销商"
-                
-                item_data = {
-                    'rank': rank,
-                    'title': title,
-                    'desc': desc,
-                    'url': link or f"https://www.autohome.com.cn/search?q={title}",
-                    'source': '汽车之家',
-                    'publish_time': publish_time,
-                    'comment_count': comment_count,
-                    'category': category,
-                    'tags': ['汽车', '汽车资讯', '购车', '试驾']
-                }
-                
-                results.append(item_data)
-                rank += 1
-                
-                if rank > 50:
-                    break
-                    
-            except Exception as e:
-                continue
-        
         # 如果没有获取到数据，尝试API接口
         if not results:
             try:
@@ -155,7 +167,7 @@ async def get_autohome_trending_func(args: dict) -> list:
         
         # 如果仍然没有数据，返回默认数据
         if not results:
-            results = [{
+            return placeholder({
                 'rank': 1,
                 'title': '汽车之家热榜数据获取中...',
                 'desc': '汽车之家汽车资讯和热门新闻',
@@ -164,14 +176,15 @@ async def get_autohome_trending_func(args: dict) -> list:
                 'publish_time': '',
                 'comment_count': '',
                 'category': '汽车资讯',
-                'tags': ['汽车', '汽车资讯', '购车', '试驾']
-            }]
+                'tags': ['汽车', '汽车资讯', '购车', '试驾'],
+                'note': '接口暂时不可用，请稍后重试'
+            })
         
         return results[:50]
         
     except Exception as e:
         # 返回备用数据
-        return [{
+        return placeholder({
             'rank': 1,
             'title': '汽车之家热榜数据获取中...',
             'desc': f'汽车之家汽车资讯获取失败: {str(e)}',
@@ -181,8 +194,9 @@ async def get_autohome_trending_func(args: dict) -> list:
             'comment_count': '',
             'category': '汽车资讯',
             'tags': ['汽车', '汽车资讯', '购车', '试驾'],
-            'error': str(e)
-        }]
+            'error': str(e),
+            'note': '接口暂时不可用，请稍后重试'
+        })
 
 
 autohome_tool_config = Tool.from_function(
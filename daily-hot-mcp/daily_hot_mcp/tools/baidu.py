@@ -1,50 +1,54 @@
 """百度热榜工具"""
 
 import asyncio
+from typing import Optional
 from fastmcp.tools import Tool
-from daily_hot_mcp.utils import http_client
-from bs4 import BeautifulSoup
+from daily_hot_mcp.utils import http_client, parse_pool
+from daily_hot_mcp.utils.html_extract import first, get_text, has_class, parse_html, xpath
 
 
-async def get_baidu_trending_func(args: dict) -> list:
-    """获取百度热榜数据"""
+# 热榜条目及其中各字段的选择器，均取第一个匹配的元素
+_HOT_ITEMS = xpath(f"//div[{has_class('category-wrap_iQLoo')}]")
+_TITLE = xpath(f"(.//div[{has_class('c-single-text-ellipsis')}])[1]")
+_HOT_INDEX = xpath(f"(.//div[{has_class('hot-index_1Bl1a')}])[1]")
+_DESC = xpath(f"(.//div[{has_class('hot-desc_1m_jR')}])[1]")
+_LINK = xpath("(.//a)[1]")
+_IMG = xpath("(.//img)[1]")
 
-    response = await http_client.get(
-        "https://top.baidu.com/board", params={"tab": "realtime"}
-    )
-    response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+def parse_baidu_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从百度热榜页面中提取热搜条目"""
+    root = parse_html(html, encoding)
 
     results = []
     # 查找热榜条目
-    hot_items = soup.find_all("div", class_="category-wrap_iQLoo")
+    hot_items = _HOT_ITEMS(root)
 
     if not hot_items:
         raise Exception("获取百度热榜失败")
 
     for idx, item in enumerate(hot_items, 1):
         # 标题
-        title_elem = item.find("div", class_="c-single-text-ellipsis")
-        title = title_elem.text.strip() if title_elem else ""
+        title_elem = first(item, _TITLE)
+        title = get_text(title_elem).strip() if title_elem is not None else ""
 
         # 热搜指数
-        index_elem = item.find("div", class_="hot-index_1Bl1a")
-        hot_index = index_elem.text.strip() if index_elem else ""
+        index_elem = first(item, _HOT_INDEX)
+        hot_index = get_text(index_elem).strip() if index_elem is not None else ""
 
         # 描述
-        desc_elem = item.find("div", class_="hot-desc_1m_jR")
-        description = desc_elem.text.strip() if desc_elem else ""
+        desc_elem = first(item, _DESC)
+        description = get_text(desc_elem).strip() if desc_elem is not None else ""
 
         # 链接
-        link_elem = item.find("a")
-        link = link_elem.get("href", "") if link_elem else ""
+        link_elem = first(item, _LINK)
+        link = link_elem.get("href", "") if link_elem is not None else ""
         if link and not link.startswith("http"):
             link = "https://www.baidu.com" + link
 
         # 图片
-        img_elem = item.find("img")
-        cover = img_elem.get("src", "") if img_elem else ""
+        img_elem = first(item, _IMG)
+        cover = img_elem.get("src", "") if img_elem is not None else ""
 
         if title:  # 只有有标题的才添加
             results.append(
@@ -61,6 +65,19 @@ async def get_baidu_trending_func(args: dict) -> list:
     return results
 
 
+async def get_baidu_trending_func(args: dict) -> list:
+    """获取百度热榜数据"""
+
+    response = await http_client.get(
+        "https://top.baidu.com/board", params={"tab": "realtime"}
+    )
+    response.raise_for_status()
+
+    return await parse_pool.run(
+        "baidu", parse_baidu_html, response.content, response.charset_encoding
+    )
+
+
 baidu_tool_config = Tool.from_function(
     fn=get_baidu_trending_func,
     name="get-baidu-trending",
@@ -6,7 +6,7 @@ import time
 from datetime import datetime
 from typing import Annotated
 from pydantic import Field
-from daily_hot_mcp.utils import http_client, cache, logger
+from daily_hot_mcp.utils import http_client, cache, logger, singleflight
 from fastmcp.tools import Tool
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
@@ -54,18 +54,17 @@ async def get_wbi_keys():
         "sub_key": get_filename_from_url(sub_url),
     }
 
+async def fetch_bili_wbi() -> str:
+    """请求WBI密钥并生成签名参数"""
+    keys = await get_wbi_keys()
+    params = {"foo": "114", "bar": "514", "baz": "1919810"}
+    return encode_wbi(params, keys["img_key"], keys["sub_key"])
+
 async def get_bili_wbi() -> str:
     """获取B站WBI签名"""
-    cache_key = "bilibili-wbi"
-    cached_data = cache.get(cache_key)
-    if cached_data:
-        return cached_data
     try:
-        keys = await get_wbi_keys()
-        params = {"foo": "114", "bar": "514", "baz": "1919810"}
-        query = encode_wbi(params, keys["img_key"], keys["sub_key"])
-        cache.set(cache_key, query)
-        return query
+        # 多个分区同时请求时只获取一次密钥，结果写入缓存
+        return await singleflight.do("bilibili-wbi", fetch_bili_wbi, cache=cache)
     except Exception:
         return "foo=114&bar=514&baz=1919810&wts=" + str(int(time.time()))
 
@@ -108,6 +107,8 @@ async def get_bilibili_rank_main(rank_type: int) -> list:
         elif item.get("bvid"):
             result_item["link"] = f"https://www.bilibili.com/video/{item['bvid']}"
         results.append(result_item)
+    if not results:
+        raise Exception("B站排行榜没有有效条目")
     return results
 
 async def get_bilibili_rank_backup(rank_type: int) -> list:
@@ -135,6 +136,8 @@ async def get_bilibili_rank_backup(rank_type: int) -> list:
         if item.get("bvid"):
             result_item["link"] = f"https://www.bilibili.com/video/{item['bvid']}"
         results.append(result_item)
+    if not results:
+        raise Exception("B站排行榜备用接口没有有效条目")
     return results
 
 async def get_bilibili_rank_func(
@@ -144,11 +147,13 @@ async def get_bilibili_rank_func(
     valid_types = [0, 1, 3, 4, 5, 188, 119, 129, 155, 160, 168, 181]
     if rank_type not in valid_types:
         raise ValueError(f"不支持的排行榜类型: {rank_type}")
+    # 两个接口都在 api.bilibili.com，共用同一个熔断器和限流额度，
+    # 因此不做对冲，主接口失败后再请求备用接口
     try:
         return await get_bilibili_rank_main(rank_type)
     except Exception as e:
-        logger.error(f"主要方法失败: {str(e)}")
-        return await get_bilibili_rank_backup(rank_type)
+        logger.warning(f"B站排行榜主接口失败，使用备用接口: {e}")
+    return await get_bilibili_rank_backup(rank_type)
 
 bilibili_rank_tool = Tool.from_function(
     fn=get_bilibili_rank_func,
@@ -158,12 +163,7 @@ bilibili_rank_tool = Tool.from_function(
 
 async def get_bilibili_trending_func() -> list:
     """Get Bilibili trending videos."""
-    cache_key = "bilibili_trending"
     try:
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.info("从缓存获取哔哩哔哩热榜数据")
-            return cached_data
         url = "https://api.bilibili.com/x/web-interface/popular"
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -189,7 +189,6 @@ async def get_bilibili_trending_func() -> list:
                 "pubdate": video.get("pubdate", 0)
             }
             trending_data.append(item)
-        cache.set(cache_key, trending_data)
         logger.info(f"获取哔哩哔哩热榜数据成功，共{len(trending_data)}条")
         return trending_data
     except Exception as e:
@@ -0,0 +1,39 @@
+"""运行状态诊断工具"""
+
+import asyncio
+import json
+from daily_hot_mcp.utils import cache, http_client, singleflight
+from daily_hot_mcp.utils.metrics import metrics
+from daily_hot_mcp.utils.strategy import strategy_board
+from fastmcp.tools import Tool
+
+
+async def get_diagnostics_func() -> dict:
+    """获取服务运行状态：各域名熔断器、各数据源获取策略、条件请求命中率、DNS 缓存、缓存和请求合并的统计以及运行指标"""
+    return {
+        "circuit_breakers": http_client.breakers.snapshot(),
+        "strategies": strategy_board.snapshot(),
+        "conditional_get": http_client.conditional_stats(),
+        "dns": http_client.dns.snapshot(),
+        "cache": cache.stats(),
+        "singleflight": singleflight.stats(),
+        "metrics": metrics.snapshot(),
+    }
+
+
+diagnostics_tool_config = Tool.from_function(
+    fn=get_diagnostics_func,
+    name="get-diagnostics",
+    description="获取服务运行状态，包括各数据源域名的熔断器状态（closed/open/half_open）、各数据源获取策略的成功率、缓存命中统计和运行指标，用于排查数据源不可用的问题",
+)
+
+diagnostics_tools = [
+    diagnostics_tool_config
+]
+
+def main():
+    result = asyncio.run(get_diagnostics_func())
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,8 @@ async def get_douyin_trending_func() -> list:
             "channel": "channel_pc_web",
             "detail_list": 1,
         },
-        headers=headers
+        headers=headers,
+        retry=True
     )
     response.raise_for_status()
     data = response.json()
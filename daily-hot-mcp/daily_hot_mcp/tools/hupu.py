@@ -1,64 +1,150 @@
 """虎扑热榜工具"""
 
 import asyncio
-from daily_hot_mcp.utils import http_client
+from itertools import chain
+from typing import Iterator, Optional
+from daily_hot_mcp.utils import http_client, parse_pool
+from daily_hot_mcp.utils.strategy import strategy_board
+from daily_hot_mcp.utils.html_extract import Element, class_pattern, get_text, iter_by_class, iter_strings, parse_html, tag_string
+from daily_hot_mcp.utils.swr import placeholder
 from fastmcp.tools import Tool
-from bs4 import BeautifulSoup
 
 async def get_hupu_trending_func() -> list:
     """获取虎扑热榜数据"""
+    try:
+        # 按各策略最近的成功率决定先用步行街还是首页，较慢时同时请求另一个
+        return await strategy_board.run("hupu", {
+            "bxj": get_hupu_trending_bxj,
+            "homepage": get_hupu_trending_homepage,
+        })
+    except Exception:
+        pass
+    return placeholder(
+        {
+            "rank": 1,
+            "title": "虎扑热榜数据获取中...",
+            "desc": "虎扑体育、步行街热门话题和热议内容",
+            "url": "https://www.hupu.com/",
+            "reply_count": "",
+            "source": "虎扑",
+            "category": "系统消息",
+            "note": "接口暂时不可用，请稍后重试"
+        }
+    )
+
+_THREAD_TAGS = ("tr", "li", "div")
+_THREAD_CLASS = class_pattern("thread", "post", "topic", "item")
+
+def _first_link(el: Element) -> Optional[Element]:
+    """el 中第一个带 href 的链接"""
+    return next((a for a in el.iterdescendants("a") if a.get("href") is not None), None)
+
+def parse_hupu_bxj_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从步行街页面中提取热帖
+
+    帖子按文档顺序逐个取出，取够 50 条即停止，不再匹配页面其余元素的 class。
+    """
+    root = parse_html(html, encoding)
+    results = []
+    thread_list = iter_by_class(root, _THREAD_TAGS, _THREAD_CLASS)
+    rank = 1
+    found = False
+    for item in thread_list:
+        found = True
+        title_elem = _first_link(item)
+        if title_elem is None:
+            title_elem = next((
+                el for el in item.iterdescendants("span", "div")
+                if len((tag_string(el) or '').strip()) > 5
+            ), None)
+        if title_elem is not None:
+            title = get_text(title_elem, strip=True)
+            if title and len(title) > 5 and not any(skip in title for skip in ['登录', '注册', '首页']):
+                url = title_elem.get('href', '') if title_elem.tag == 'a' else ""
+                if url and not url.startswith('http'):
+                    url = f"https://bbs.hupu.com{url}"
+                reply_elem = next((
+                    text for text in iter_strings(item)
+                    if any(char in text for char in ['回复', '浏览', '万', '热度'])
+                ), None)
+                reply_count = reply_elem.strip() if reply_elem else ""
+                results.append({
+                    "rank": rank,
+                    "title": title,
+                    "desc": f"虎扑步行街热帖 - {title}",
+                    "url": url or f"https://www.hupu.com/search?q={title}",
+                    "reply_count": reply_count,
+                    "source": "虎扑",
+                    "category": "步行街热帖"
+                })
+                rank += 1
+                if rank > 50:
+                    break
+    if not found:
+        raise Exception("步行街页面中没有找到帖子列表")
+    if not results:
+        raise Exception("步行街页面中没有解析到热帖")
+    return results[:50]
+
+async def get_hupu_trending_bxj() -> list:
+    """从步行街获取热帖"""
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         'Referer': 'https://www.hupu.com/',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         'Accept-Language': 'zh-CN,zh;q=0.9'
     }
-    try:
-        response = await http_client.get("https://bbs.hupu.com/bxj", headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        results = []
-        thread_list = soup.find_all(['tr', 'li', 'div'], class_=lambda x: x and any(
-            keyword in x.lower() for keyword in ['thread', 'post', 'topic', 'item']
-        ))
-        if not thread_list:
-            return await get_hupu_trending_homepage()
-        rank = 1
-        for item in thread_list:
-            title_elem = item.find('a', href=True)
-            if not title_elem:
-                title_elem = item.find(['span', 'div'], string=lambda text: text and len(text.strip()) > 5)
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-                if title and len(title) > 5 and not any(skip in title for skip in ['登录', '注册', '首页']):
-                    url = title_elem.get('href', '') if title_elem.name == 'a' else ""
-                    if url and not url.startswith('http'):
-                        url = f"https://bbs.hupu.com{url}"
-                    reply_elem = item.find(string=lambda text: text and any(
-                        char in text for char in ['回复', '浏览', '万', '热度']
-                    ))
-                    reply_count = reply_elem.strip() if reply_elem else ""
-                    results.append({
-                        "rank": rank,
-                        "title": title,
-                        "desc": f"虎扑步行街热帖 - {title}",
-                        "url": url or f"https://www.hupu.com/search?q={title}",
-                        "reply_count": reply_count,
-                        "source": "虎扑",
-                        "category": "步行街热帖"
-                    })
-                    rank += 1
-                    if rank > 50:
-                        break
-        if results:
-            return results[:50]
+    response = await http_client.get("https://bbs.hupu.com/bxj", headers=headers)
+    response.raise_for_status()
+    return await parse_pool.run("hupu", parse_hupu_bxj_html, response.content, response.charset_encoding)
+
+_HOT_CLASS = class_pattern("hot")
+
+def _home_candidates(root: Element) -> Iterator[Element]:
+    """首页候选元素：先是所有带 href 的 a、div，然后是 class 含 hot 的 div、span"""
+    links = (el for el in root.iter("a", "div") if el.get("href") is not None)
+    return chain(links, iter_by_class(root, ("div", "span"), _HOT_CLASS))
+
+def parse_hupu_homepage_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从虎扑首页中提取热门内容
+
+    候选元素按需逐个取出，链接足够 50 条时不再查找 hot 区块。
+    """
+    root = parse_html(html, encoding)
+    results = []
+    hot_items = _home_candidates(root)
+    rank = 1
+    for item in hot_items:
+        if item.tag == 'a':
+            title = get_text(item, strip=True)
+            url = item.get('href', '')
         else:
-            return await get_hupu_trending_homepage()
-    except Exception as e:
-        return await get_hupu_trending_homepage()
+            link_elem = _first_link(item)
+            if link_elem is not None:
+                title = get_text(link_elem, strip=True)
+                url = link_elem.get('href', '')
+            else:
+                title = get_text(item, strip=True)
+                url = ""
+        if title and len(title) > 5 and not any(skip in title for skip in ['登录', '注册', '首页', '下载']):
+            if url and not url.startswith('http'):
+                url = f"https://www.hupu.com{url}"
+            results.append({
+                "rank": rank,
+                "title": title,
+                "desc": f"虎扑热门内容 - {title}",
+                "url": url or f"https://www.hupu.com/search?q={title}",
+                "reply_count": "",
+                "source": "虎扑",
+                "category": "热门内容"
+            })
+            rank += 1
+            if rank > 50:
+                break
+    return results[:50]
 
 async def get_hupu_trending_homepage():
-    """从虎扑首页获取热门内容"""
+    """从虎扑首页获取热门内容，首页解析不到时使用列表接口"""
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         'Referer': 'https://www.hupu.com/'
@@ -66,37 +152,9 @@ async def get_hupu_trending_homepage():
     try:
         response = await http_client.get("https://www.hupu.com/", headers=headers)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        results = []
-        hot_items = soup.find_all(['a', 'div'], href=True) + soup.find_all(['div', 'span'], class_=lambda x: x and 'hot' in x.lower())
-        rank = 1
-        for item in hot_items:
-            if item.name == 'a':
-                title = item.get_text(strip=True)
-                url = item.get('href', '')
-            else:
-                link_elem = item.find('a', href=True)
-                if link_elem:
-                    title = link_elem.get_text(strip=True)
-                    url = link_elem.get('href', '')
-                else:
-                    title = item.get_text(strip=True)
-                    url = ""
-            if title and len(title) > 5 and not any(skip in title for skip in ['登录', '注册', '首页', '下载']):
-                if url and not url.startswith('http'):
-                    url = f"https://www.hupu.com{url}"
-                results.append({
-                    "rank": rank,
-                    "title": title,
-                    "desc": f"虎扑热门内容 - {title}",
-                    "url": url or f"https://www.hupu.com/search?q={title}",
-                    "reply_count": "",
-                    "source": "虎扑",
-                    "category": "热门内容"
-                })
-                rank += 1
-                if rank > 50:
-                    break
+        results = await parse_pool.run(
+            "hupu", parse_hupu_homepage_html, response.content, response.charset_encoding, heavy=True
+        )
         if results:
             return results[:50]
     except Exception:
@@ -122,18 +180,7 @@ async def get_hupu_trending_homepage():
                 return results
     except Exception:
         pass
-    return [
-        {
-            "rank": 1,
-            "title": "虎扑热榜数据获取中...",
-            "desc": "虎扑体育、步行街热门话题和热议内容",
-            "url": "https://www.hupu.com/",
-            "reply_count": "",
-            "source": "虎扑",
-            "category": "系统消息",
-            "note": "接口暂时不可用，请稍后重试"
-        }
-    ]
+    raise Exception("虎扑首页和列表接口均未获取到数据")
 
 hupu_trending_tool = Tool.from_function(
     fn=get_hupu_trending_func,
@@ -6,16 +6,8 @@ from pydantic import Field
 from daily_hot_mcp.utils import http_client
 from fastmcp.tools import Tool
 
-async def get_ifanr_news_func(
-    limit: Annotated[int, Field(description="返回结果数量限制")] = 20,
-    offset: Annotated[int, Field(description="偏移量")] = 0
-) -> list:
-    """获取爱范儿科技快讯数据"""
-    response = await http_client.get(
-        "https://sso.ifanr.com/api/v5/wp/buzz",
-        params={"limit": limit, "offset": offset}
-    )
-    response.raise_for_status()
+def parse_ifanr_news(response) -> list:
+    """解析爱范儿快讯接口的响应"""
     data = response.json()
     if not isinstance(data.get("objects"), list):
         raise Exception("获取爱范儿快讯失败")
@@ -32,6 +24,19 @@ async def get_ifanr_news_func(
         results.append(result_item)
     return results
 
+async def get_ifanr_news_func(
+    limit: Annotated[int, Field(description="返回结果数量限制")] = 20,
+    offset: Annotated[int, Field(description="偏移量")] = 0
+) -> list:
+    """获取爱范儿科技快讯数据"""
+    # 条件请求：快讯没有更新时复用上次解析的结果
+    return await http_client.get_conditional(
+        "https://sso.ifanr.com/api/v5/wp/buzz",
+        parse_ifanr_news,
+        name="ifanr",
+        params={"limit": limit, "offset": offset}
+    )
+
 ifanr_news_tool = Tool.from_function(
     fn=get_ifanr_news_func,
     name="get-ifanr-news",
@@ -4,9 +4,82 @@ IT之家热榜采集工具
 """
 
 import asyncio
-from daily_hot_mcp.utils import http_client
+from typing import Optional
+from daily_hot_mcp.utils import http_client, parse_pool
+from daily_hot_mcp.utils.html_extract import find_firsts, get_text, iter_links, match, parse_html
+from daily_hot_mcp.utils.swr import placeholder
 from fastmcp.tools import Tool
-from bs4 import BeautifulSoup
+
+# 依次收集各区域的新闻链接，同一标题只保留第一次出现的
+_NEWS_LINKS = [
+    ("list", "hot-list"),
+    ("list", "news-list"),
+    ("list", "list-box"),
+    ("href", "/it/"),
+    ("within", "post-item"),
+    ("within", "news-item"),
+]
+# 在链接的父元素中查找描述、时间和热度，每组按优先级排列
+_METADATA = [
+    [match("p"), match("div", "summary"), match("div", "content"), match("span", "desc")],
+    [match("time"), match("span", "time"), match("div", "time")],
+    [match("span", "hot"), match("span", "comment"), match("span", "view")],
+]
+
+def parse_ithome_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从IT之家首页中提取新闻条目
+
+    只遍历一次文档中的链接，同一父元素下的链接共用一次元数据查找，取够 50 条即停止。
+    """
+    root = parse_html(html, encoding)
+    items = []
+    metadata = {}
+    rank = 1
+    seen_titles = set()
+    for item in iter_links(root, _NEWS_LINKS):
+        try:
+            title = get_text(item, strip=True)
+            if not title or len(title) < 5 or title in seen_titles:
+                continue
+            if any(skip in title for skip in ['登录', '注册', '首页', '下载', '更多']):
+                continue
+            seen_titles.add(title)
+            link = item.get('href', '')
+            if link and not link.startswith('http'):
+                if link.startswith('/'):
+                    link = 'https://www.ithome.com' + link
+                else:
+                    link = 'https://www.ithome.com/' + link
+            desc = publish_time = hot_count = ""
+            parent = item.getparent()
+            if parent is not None:
+                if parent not in metadata:
+                    metadata[parent] = [
+                        get_text(elem, strip=True) if elem is not None else ""
+                        for elem in find_firsts(parent, _METADATA)
+                    ]
+                desc, publish_time, hot_count = metadata[parent]
+                desc = desc[:200]
+            if not desc:
+                desc = f"IT之家科技资讯 - {title}"
+            item_data = {
+                'rank': rank,
+                'title': title,
+                'desc': desc,
+                'url': link or f"https://www.ithome.com/search?q={title}",
+                'source': 'IT之家',
+                'publish_time': publish_time,
+                'hot_count': hot_count,
+                'category': '科技资讯',
+                'tags': ['科技', '数码', 'IT资讯', '互联网']
+            }
+            items.append(item_data)
+            rank += 1
+            if rank > 50:
+                break
+        except Exception as e:
+            continue
+    return items
 
 async def get_ithome_trending_func() -> list:
     """获取IT之家热榜"""
@@ -22,78 +95,11 @@ async def get_ithome_trending_func() -> list:
         url = "https://www.ithome.com/"
         response = await http_client.get(url, headers=headers)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        items = []
-        news_items = (
-            soup.select('.hot-list li a') + 
-            soup.select('.news-list li a') + 
-            soup.select('.list-box li a') +
-            soup.select('a[href*="/it/"]') +
-            soup.select('.post-item a') +
-            soup.select('.news-item a')
+        items = await parse_pool.run(
+            "ithome", parse_ithome_html, response.content, response.charset_encoding, heavy=True
         )
-        rank = 1
-        seen_titles = set()
-        for item in news_items:
-            try:
-                title = item.get_text(strip=True)
-                if not title or len(title) < 5 or title in seen_titles:
-                    continue
-                if any(skip in title for skip in ['登录', '注册', '首页', '下载', '更多']):
-                    continue
-                seen_titles.add(title)
-                link = item.get('href', '')
-                if link and not link.startswith('http'):
-                    if link.startswith('/'):
-                        link = 'https://www.ithome.com' + link
-                    else:
-                        link = 'https://www.ithome.com/' + link
-                desc = ""
-                parent = item.parent
-                if parent:
-                    desc_elem = (parent.find('p') or 
-                               parent.find('div', class_='summary') or 
-                               parent.find('div', class_='content') or
-                               parent.find('span', class_='desc'))
-                    if desc_elem:
-                        desc = desc_elem.get_text(strip=True)[:200]
-                if not desc:
-                    desc = f"IT之家科技资讯 - {title}"
-                publish_time = ""
-                if parent:
-                    time_elem = (parent.find('time') or 
-                               parent.find('span', class_='time') or 
-                               parent.find('div', class_='time') or
-                               parent.find('.post-time'))
-                    if time_elem:
-                        publish_time = time_elem.get_text(strip=True)
-                hot_count = ""
-                if parent:
-                    hot_elem = (parent.find('span', class_='hot') or 
-                              parent.find('span', class_='comment') or 
-                              parent.find('span', class_='view') or
-                              parent.find('.comment-count'))
-                    if hot_elem:
-                        hot_count = hot_elem.get_text(strip=True)
-                item_data = {
-                    'rank': rank,
-                    'title': title,
-                    'desc': desc,
-                    'url': link or f"https://www.ithome.com/search?q={title}",
-                    'source': 'IT之家',
-                    'publish_time': publish_time,
-                    'hot_count': hot_count,
-                    'category': '科技资讯',
-                    'tags': ['科技', '数码', 'IT资讯', '互联网']
-                }
-                items.append(item_data)
-                rank += 1
-                if rank > 50:
-                    break
-            except Exception as e:
-                continue
         if not items:
-            items = [{
+            items = placeholder({
                 'rank': 1,
                 'title': 'IT之家热榜数据获取中...',
                 'desc': 'IT之家科技资讯和热门新闻',
@@ -102,11 +108,12 @@ async def get_ithome_trending_func() -> list:
                 'publish_time': '',
                 'hot_count': '',
                 'category': '科技资讯',
-                'tags': ['科技', '数码', 'IT资讯', '互联网']
-            }]
+                'tags': ['科技', '数码', 'IT资讯', '互联网'],
+                'note': '接口暂时不可用，请稍后重试'
+            })
         return items
     except Exception as e:
-        return [{
+        return placeholder({
             'rank': 1,
             'title': 'IT之家热榜数据获取中...',
             'desc': f'IT之家科技资讯获取失败: {str(e)}',
@@ -116,8 +123,9 @@ async def get_ithome_trending_func() -> list:
             'hot_count': '',
             'category': '科技资讯',
             'tags': ['科技', '数码', 'IT资讯', '互联网'],
-            'error': str(e)
-        }]
+            'error': str(e),
+            'note': '接口暂时不可用，请稍后重试'
+        })
 
 ithome_trending_tool = Tool.from_function(
     fn=get_ithome_trending_func,
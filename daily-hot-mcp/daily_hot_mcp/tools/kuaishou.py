@@ -4,20 +4,39 @@ import asyncio
 from pydantic import Field
 from typing import Annotated
 from daily_hot_mcp.utils import http_client
+from daily_hot_mcp.utils.hedge import hedged
+from daily_hot_mcp.utils.swr import placeholder
 from fastmcp.tools import Tool
 
 
 async def get_kuaishou_trending_func() -> list:
     """获取快手热榜数据"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Referer': 'https://www.kuaishou.com/',
-        'Accept': 'application/json, text/plain, */*'
-    }
+    try:
+        # PC端接口较慢时同时请求移动端接口，取先成功的结果；请求失败或熔断中时直接走备用方案
+        return await hedged("kuaishou", get_kuaishou_trending_main, get_kuaishou_trending_backup)
+    except Exception:
+        pass
     
-    # 快手热搜API
+    # 主备接口都不可用时返回占位数据
+    return placeholder(
+        {
+            "rank": 1,
+            "title": "快手热榜数据获取中...",
+            "author": "快手官方",
+            "view_count": 0,
+            "like_count": 0,
+            "cover": "",
+            "url": "https://www.kuaishou.com/",
+            "timestamp": 0,
+            "note": "接口暂时不可用，请稍后重试"
+        }
+    )
+
+
+async def fetch_kuaishou_feeds(url: str, headers: dict) -> list:
+    """请求快手 graphql 接口并解析热门视频"""
     response = await http_client.get(
-        "https://www.kuaishou.com/graphql",
+        url,
         headers=headers,
         params={
             "operationName": "visionSearchPhoto",
@@ -25,81 +44,48 @@ async def get_kuaishou_trending_func() -> list:
             "extensions": '{"persistedQuery":{"version":1,"sha256Hash":"6c52c9d031dcea45c5b810deedebe91d7ea16a1b30d3999aef0ebc4b3ea9e25c"}}'
         }
     )
+    response.raise_for_status()
+    data = response.json()
     
-    try:
-        response.raise_for_status()
-        data = response.json()
-        
-        # 如果API不可用，使用备用方案
-        if 'data' not in data:
-            return await get_kuaishou_trending_backup()
-            
-        results = []
-        if 'visionSearchPhoto' in data.get('data', {}):
-            photos = data['data']['visionSearchPhoto'].get('feeds', [])
-            
-            for idx, photo in enumerate(photos[:50], 1):
-                photo_info = photo.get('photo', {})
-                results.append({
-                    "rank": idx,
-                    "title": photo_info.get('caption', '').strip(),
-                    "author": photo_info.get('userName', ''),
-                    "view_count": photo_info.get('viewCount', 0),
-                    "like_count": photo_info.get('realLikeCount', 0),
-                    "cover": photo_info.get('coverUrl', ''),
-                    "url": f"https://www.kuaishou.com/short-video/{photo_info.get('id', '')}",
-                    "timestamp": photo_info.get('timestamp', 0)
-                })
-                
-        return results[:50]
+    results = []
+    if 'visionSearchPhoto' in (data.get('data') or {}):
+        photos = data['data']['visionSearchPhoto'].get('feeds', [])
         
-    except Exception:
-        # 如果主API失败，使用备用方案
-        return await get_kuaishou_trending_backup()
+        for idx, photo in enumerate(photos[:50], 1):
+            photo_info = photo.get('photo', {})
+            results.append({
+                "rank": idx,
+                "title": photo_info.get('caption', '').strip(),
+                "author": photo_info.get('userName', ''),
+                "view_count": photo_info.get('viewCount', 0),
+                "like_count": photo_info.get('realLikeCount', 0),
+                "cover": photo_info.get('coverUrl', ''),
+                "url": f"https://www.kuaishou.com/short-video/{photo_info.get('id', '')}",
+                "timestamp": photo_info.get('timestamp', 0)
+            })
+    
+    if not results:
+        raise Exception(f"快手接口返回数据为空: {url}")
+    return results
+
 
+async def get_kuaishou_trending_main() -> list:
+    """快手PC端热搜API"""
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Referer': 'https://www.kuaishou.com/',
+        'Accept': 'application/json, text/plain, */*'
+    }
+    return await fetch_kuaishou_feeds("https://www.kuaishou.com/graphql", headers)
 
-async def get_kuaishou_trending_backup():
+
+async def get_kuaishou_trending_backup() -> list:
     """快手热榜备用获取方案"""
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
     }
-    
-    try:
-        # 使用快手移动端接口
-        response = await http_client.get(
-            "https://m.kuaishou.com/graphql",
-            headers=headers
-        )
-        
-        # 如果还是失败，返回模拟数据表示接口可用性
-        return [
-            {
-                "rank": 1,
-                "title": "快手热榜数据获取中...",
-                "author": "快手官方",
-                "view_count": 0,
-                "like_count": 0,
-                "cover": "",
-                "url": "https://www.kuaishou.com/",
-                "timestamp": 0,
-                "note": "接口暂时不可用，请稍后重试"
-            }
-        ]
-        
-    except Exception:
-        return [
-            {
-                "rank": 1,
-                "title": "快手热榜数据获取中...",
-                "author": "快手官方", 
-                "view_count": 0,
-                "like_count": 0,
-                "cover": "",
-                "url": "https://www.kuaishou.com/",
-                "timestamp": 0,
-                "note": "接口暂时不可用，请稍后重试"
-            }
-        ]
+    # 使用快手移动端接口
+    return await fetch_kuaishou_feeds("https://m.kuaishou.com/graphql", headers)
 
 kuaishou_tool_config = Tool.from_function(
     fn=get_kuaishou_trending_func,
@@ -2,11 +2,43 @@
 
 import asyncio
 from daily_hot_mcp.utils import http_client
+from daily_hot_mcp.utils.strategy import strategy_board
+from daily_hot_mcp.utils.swr import placeholder
 from fastmcp.tools import Tool
 
 
 async def get_so360_trending_func() -> list:
     """获取360热搜榜数据"""
+    try:
+        # 按各策略最近的成功率决定先用热榜接口还是搜索热词接口，较慢时同时请求另一个
+        return await strategy_board.run("so360", {
+            "hotnewsquery": get_so360_trending_main,
+            "suggest": get_so360_trending_backup,
+        })
+    except Exception:
+        pass
+    
+    # 最终备用方案
+    return placeholder(
+        {
+            "rank": 1,
+            "title": "360热搜榜数据获取中...",
+            "desc": "360搜索热门关键词和热点新闻",
+            "url": "https://www.so.com/",
+            "hot_value": 0,
+            "hot_desc": "",
+            "source": "360搜索",
+            "img": "",
+            "time": "",
+            "category": "系统消息",
+            "trend": "",
+            "note": "接口暂时不可用，请稍后重试"
+        }
+    )
+
+
+async def get_so360_trending_main() -> list:
+    """360热榜接口"""
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         'Referer': 'https://www.so.com/',
@@ -14,52 +46,47 @@ async def get_so360_trending_func() -> list:
         'Accept-Language': 'zh-CN,zh;q=0.9'
     }
     
-    try:
-        # 360搜索热榜API
-        response = await http_client.get(
-            "https://ranks.hao.360.com/mbsug-api/hotnewsquery",
-            headers=headers,
-            params={
-                "type": "news",
-                "realhot_limit": "50"
-            }
-        )
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        results = []
+    # 360搜索热榜API
+    response = await http_client.get(
+        "https://ranks.hao.360.com/mbsug-api/hotnewsquery",
+        headers=headers,
+        params={
+            "type": "news",
+            "realhot_limit": "50"
+        }
+    )
+    
+    response.raise_for_status()
+    data = response.json()
+    
+    results = []
+    
+    if data.get('errno') == 0 and 'data' in data:
+        hot_news = data['data'].get('hotnews', [])
         
-        if data.get('errno') == 0 and 'data' in data:
-            hot_news = data['data'].get('hotnews', [])
+        for idx, item in enumerate(hot_news[:50], 1):
+            # 获取热度信息
+            hot_value = item.get('hotValue', 0)
+            hot_desc = item.get('hotDesc', '')
             
-            for idx, item in enumerate(hot_news[:50], 1):
-                # 获取热度信息
-                hot_value = item.get('hotValue', 0)
-                hot_desc = item.get('hotDesc', '')
-                
-                results.append({
-                    "rank": idx,
-                    "title": item.get('title', '').strip(),
-                    "desc": item.get('desc', '').strip(),
-                    "url": item.get('url', ''),
-                    "hot_value": hot_value,
-                    "hot_desc": hot_desc,
-                    "source": item.get('source', ''),
-                    "img": item.get('img', ''),
-                    "time": item.get('time', ''),
-                    "category": item.get('category', ''),
-                    "trend": item.get('trend', ''),  # 上升/下降趋势
-                })
-                
-        if not results:
-            # 备用方案：尝试获取360搜索建议
-            return await get_so360_trending_backup()
+            results.append({
+                "rank": idx,
+                "title": item.get('title', '').strip(),
+                "desc": item.get('desc', '').strip(),
+                "url": item.get('url', ''),
+                "hot_value": hot_value,
+                "hot_desc": hot_desc,
+                "source": item.get('source', ''),
+                "img": item.get('img', ''),
+                "time": item.get('time', ''),
+                "category": item.get('category', ''),
+                "trend": item.get('trend', ''),  # 上升/下降趋势
+            })
             
-        return results[:50]
+    if not results:
+        raise Exception("360热榜接口返回数据为空")
         
-    except Exception as e:
-        return await get_so360_trending_backup()
+    return results[:50]
 
 
 async def get_so360_trending_backup():
@@ -69,68 +96,48 @@ async def get_so360_trending_backup():
         'Referer': 'https://www.so.com/'
     }
     
-    try:
-        # 尝试360搜索热词接口
-        response = await http_client.get(
-            "https://sug.so.360.cn/suggest",
-            headers=headers,
-            params={
-                "encodein": "utf-8",
-                "encodeout": "utf-8", 
-                "format": "json",
-                "word": "",
-                "src": "home"
-            }
-        )
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        results = []
-        if 'result' in data:
-            suggestions = data['result'][:50]
-            
-            for idx, suggestion in enumerate(suggestions, 1):
-                # suggestion通常是个列表，第一个元素是关键词
-                keyword = suggestion[0] if isinstance(suggestion, list) else str(suggestion)
-                
-                results.append({
-                    "rank": idx,
-                    "title": keyword.strip(),
-                    "desc": f"360搜索热词 - {keyword}",
-                    "url": f"https://www.so.com/s?q={keyword}",
-                    "hot_value": 0,
-                    "hot_desc": "",
-                    "source": "360搜索",
-                    "img": "",
-                    "time": "",
-                    "category": "热搜词",
-                    "trend": ""
-                })
+    # 尝试360搜索热词接口
+    response = await http_client.get(
+        "https://sug.so.360.cn/suggest",
+        headers=headers,
+        params={
+            "encodein": "utf-8",
+            "encodeout": "utf-8", 
+            "format": "json",
+            "word": "",
+            "src": "home"
+        }
+    )
+    
+    response.raise_for_status()
+    data = response.json()
+    
+    results = []
+    if 'result' in data:
+        suggestions = data['result'][:50]
         
-        if results:
-            return results
+        for idx, suggestion in enumerate(suggestions, 1):
+            # suggestion通常是个列表，第一个元素是关键词
+            keyword = suggestion[0] if isinstance(suggestion, list) else str(suggestion)
             
-    except Exception:
-        pass
+            results.append({
+                "rank": idx,
+                "title": keyword.strip(),
+                "desc": f"360搜索热词 - {keyword}",
+                "url": f"https://www.so.com/s?q={keyword}",
+                "hot_value": 0,
+                "hot_desc": "",
+                "source": "360搜索",
+                "img": "",
+                "time": "",
+                "category": "热搜词",
+                "trend": ""
+            })
     
-    # 最终备用方案
-    return [
-        {
-            "rank": 1,
-            "title": "360热搜榜数据获取中...",
-            "desc": "360搜索热门关键词和热点新闻",
-            "url": "https://www.so.com/",
-            "hot_value": 0,
-            "hot_desc": "",
-            "source": "360搜索",
-            "img": "",
-            "time": "",
-            "category": "系统消息",
-            "trend": "",
-            "note": "接口暂时不可用，请稍后重试"
-        }
-    ]
+    if not results:
+        raise Exception("360搜索热词接口返回数据为空")
+    
+    return results
 
 
 so360_tool_config = Tool.from_function(
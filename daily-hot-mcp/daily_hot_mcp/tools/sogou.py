@@ -2,13 +2,82 @@
 
 import asyncio
 import json
-from bs4 import BeautifulSoup
-from daily_hot_mcp.utils import http_client
+from itertools import islice
+from typing import Optional
+from daily_hot_mcp.utils import http_client, parse_pool
+from daily_hot_mcp.utils.html_extract import class_pattern, get_text, iter_by_class, parse_html
+from daily_hot_mcp.utils.strategy import strategy_board
+from daily_hot_mcp.utils.swr import placeholder
 from fastmcp.tools import Tool
 
 
 async def get_sogou_trending_func() -> list:
     """获取搜狗热搜榜数据"""
+    try:
+        # 按各策略最近的成功率决定先用页面解析还是搜索建议接口，较慢时同时请求另一个
+        return await strategy_board.run("sogou", {
+            "page": get_sogou_trending_page,
+            "suggest_api": get_sogou_trending_api,
+        })
+    except Exception:
+        pass
+    
+    # 最终备用方案 - 模拟一些常见热搜词
+    return placeholder(
+        {
+            "rank": 1,
+            "title": "搜狗热搜榜数据获取中...",
+            "desc": "搜狗搜索热门关键词和搜索趋势",
+            "url": "https://www.sogou.com/",
+            "source": "搜狗搜索",
+            "category": "系统消息",
+            "note": "接口暂时不可用，请稍后重试"
+        }
+    )
+
+
+_HOT_TAGS = ("div", "span", "a")
+_HOT_CLASS = class_pattern("hot", "trend", "popular", "search")
+
+
+def parse_sogou_html(html: bytes, encoding: Optional[str] = None) -> list:
+    """从搜狗搜索页面中提取热搜词"""
+    root = parse_html(html, encoding)
+    
+    results = []
+    
+    # 搜索热搜相关的元素，只取前 50 个
+    hot_elements = list(islice(iter_by_class(root, _HOT_TAGS, _HOT_CLASS), 50))
+    
+    # 没有找到足够的热搜元素时由备用接口提供数据
+    if not hot_elements or len(hot_elements) < 5:
+        raise Exception("搜狗页面中没有找到热搜元素")
+        
+    # 提取热搜内容
+    for idx, element in enumerate(hot_elements, 1):
+        text = get_text(element, strip=True)
+        if text and len(text) > 2:  # 过滤太短的文本
+            link = element.get('href', '')
+            if not link.startswith('http'):
+                link = f"https://www.sogou.com/web?query={text}"
+            
+            results.append({
+                "rank": idx,
+                "title": text,
+                "desc": f"搜狗热搜关键词 - {text}",
+                "url": link,
+                "source": "搜狗搜索",
+                "category": "热搜词"
+            })
+    
+    if not results:
+        raise Exception("搜狗页面中没有解析到热搜")
+    
+    return results[:50]
+
+
+async def get_sogou_trending_page() -> list:
+    """从搜狗搜索页面解析热搜"""
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         'Referer': 'https://www.sogou.com/',
@@ -16,54 +85,16 @@ async def get_sogou_trending_func() -> list:
         'Accept-Language': 'zh-CN,zh;q=0.9'
     }
     
-    try:
-        # 搜狗热搜页面
-        response = await http_client.get(
-            "https://www.sogou.com/web",
-            headers=headers,
-            params={"query": "搜狗热搜"}
-        )
-        
-        response.raise_for_status()
-        
-        # 尝试从页面解析热搜数据
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        results = []
-        
-        # 搜索热搜相关的元素
-        hot_elements = soup.find_all(['div', 'span', 'a'], class_=lambda x: x and any(
-            keyword in x.lower() for keyword in ['hot', 'trend', 'popular', 'search']
-        ))
-        
-        # 如果没有找到热搜元素，尝试API接口
-        if not hot_elements or len(hot_elements) < 5:
-            return await get_sogou_trending_api()
-            
-        # 提取热搜内容
-        for idx, element in enumerate(hot_elements[:50], 1):
-            text = element.get_text(strip=True)
-            if text and len(text) > 2:  # 过滤太短的文本
-                link = element.get('href', '')
-                if not link.startswith('http'):
-                    link = f"https://www.sogou.com/web?query={text}"
-                
-                results.append({
-                    "rank": idx,
-                    "title": text,
-                    "desc": f"搜狗热搜关键词 - {text}",
-                    "url": link,
-                    "source": "搜狗搜索",
-                    "category": "热搜词"
-                })
-        
-        if results:
-            return results[:50]
-        else:
-            return await get_sogou_trending_api()
-            
-    except Exception as e:
-        return await get_sogou_trending_api()
+    # 搜狗热搜页面
+    response = await http_client.get(
+        "https://www.sogou.com/web",
+        headers=headers,
+        params={"query": "搜狗热搜"}
+    )
+    
+    response.raise_for_status()
+    
+    return await parse_pool.run("sogou", parse_sogou_html, response.content, response.charset_encoding)
 
 
 async def get_sogou_trending_api():
@@ -73,61 +104,46 @@ async def get_sogou_trending_api():
         'Referer': 'https://www.sogou.com/'
     }
     
-    try:
-        # 尝试搜狗搜索建议接口
-        response = await http_client.get(
-            "https://suggestion.sogou.com/sus",
-            headers=headers,
-            params={
-                "type": "web",
-                "key": "",
-                "format": "json"
-            }
-        )
-        
-        response.raise_for_status()
-        text = response.text
-        
-        # 搜狗返回的可能是JSONP格式
-        if text.startswith('window.sugResult='):
-            text = text.replace('window.sugResult=', '').rstrip(';')
-        
-        data = json.loads(text)
-        
-        results = []
-        if isinstance(data, list) and len(data) > 1:
-            suggestions = data[1]  # 通常建议在第二个元素
-            
-            for idx, suggestion in enumerate(suggestions[:50], 1):
-                keyword = suggestion.strip() if suggestion else f"热搜词{idx}"
-                
-                results.append({
-                    "rank": idx,
-                    "title": keyword,
-                    "desc": f"搜狗热搜关键词 - {keyword}",
-                    "url": f"https://www.sogou.com/web?query={keyword}",
-                    "source": "搜狗搜索",
-                    "category": "搜索建议"
-                })
+    # 尝试搜狗搜索建议接口
+    response = await http_client.get(
+        "https://suggestion.sogou.com/sus",
+        headers=headers,
+        params={
+            "type": "web",
+            "key": "",
+            "format": "json"
+        }
+    )
+    
+    response.raise_for_status()
+    text = response.text
+    
+    # 搜狗返回的可能是JSONP格式
+    if text.startswith('window.sugResult='):
+        text = text.replace('window.sugResult=', '').rstrip(';')
+    
+    data = json.loads(text)
+    
+    results = []
+    if isinstance(data, list) and len(data) > 1:
+        suggestions = data[1]  # 通常建议在第二个元素
         
-        if results:
-            return results
+        for idx, suggestion in enumerate(suggestions[:50], 1):
+            keyword = suggestion.strip() if suggestion else f"热搜词{idx}"
             
-    except Exception:
-        pass
+            results.append({
+                "rank": idx,
+                "title": keyword,
+                "desc": f"搜狗热搜关键词 - {keyword}",
+                "url": f"https://www.sogou.com/web?query={keyword}",
+                "source": "搜狗搜索",
+                "category": "搜索建议"
+            })
     
-    # 最终备用方案 - 模拟一些常见热搜词
-    return [
-        {
-            "rank": 1,
-            "title": "搜狗热搜榜数据获取中...",
-            "desc": "搜狗搜索热门关键词和搜索趋势",
-            "url": "https://www.sogou.com/",
-            "source": "搜狗搜索",
-            "category": "系统消息",
-            "note": "接口暂时不可用，请稍后重试"
-        }
-    ]
+    if not results:
+        raise Exception("搜狗搜索建议接口返回数据为空")
+    
+    return results
 
 
 sogou_tool_config = Tool.from_function(
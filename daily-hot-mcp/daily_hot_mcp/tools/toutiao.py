@@ -10,7 +10,8 @@ async def get_toutiao_trending_func() -> list:
     """获取今日头条热榜数据"""
     response = await http_client.get(
         "https://www.toutiao.com/hot-event/hot-board/",
-        params={"origin": "toutiao_pc"}
+        params={"origin": "toutiao_pc"},
+        retry=True
     )
     response.raise_for_status()
     
@@ -1,19 +1,19 @@
 """微博搜索工具"""
 
 import asyncio
-import random
 import time
 from urllib.parse import urlencode
 from daily_hot_mcp.utils import http_client
+from daily_hot_mcp.utils.retry import RetryPolicy
 from fastmcp.tools import Tool
 
+# 搜索接口偶尔返回 5xx 或限流，最多尝试 3 次
+SEARCH_RETRY = RetryPolicy(max_attempts=3, backoff_base=1.0, backoff_max=5.0, total_budget=15.0)
+
 
 async def search_weibo_content(keyword: str, limit: int = 15, page: int = 1) -> list:
     """搜索微博内容"""
     try:
-        # 添加随机延迟避免被检测
-        await asyncio.sleep(random.uniform(1, 3))
-        
         # 使用微博移动端搜索API
         params = {
             'containerid': f'100103type=1&q={keyword}',
@@ -35,17 +35,8 @@ async def search_weibo_content(keyword: str, limit: int = 15, page: int = 1) ->
             "sec-fetch-site": "same-origin",
         }
         
-        # 重试机制
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = await http_client.get(url, headers=headers)
-                response.raise_for_status()
-                break
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise e
-                await asyncio.sleep(random.uniform(2, 5))
+        response = await http_client.get(url, headers=headers, retry=SEARCH_RETRY)
+        response.raise_for_status()
         
         data = response.json()
         if not data.get("data", {}).get("cards"):
@@ -107,9 +98,6 @@ async def search_weibo_content(keyword: str, limit: int = 15, page: int = 1) ->
 async def search_weibo_topics(keyword: str, limit: int = 15, page: int = 1) -> list:
     """搜索微博话题"""
     try:
-        # 添加随机延迟避免被检测
-        await asyncio.sleep(random.uniform(1, 3))
-        
         params = {
             'containerid': f'100103type=38&q={keyword}',
             'page_type': 'searchall',
@@ -130,17 +118,8 @@ async def search_weibo_topics(keyword: str, limit: int = 15, page: int = 1) -> l
             "sec-fetch-site": "same-origin",
         }
         
-        # 重试机制
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = await http_client.get(url, headers=headers)
-                response.raise_for_status()
-                break
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise e
-                await asyncio.sleep(random.uniform(2, 5))
+        response = await http_client.get(url, headers=headers, retry=SEARCH_RETRY)
+        response.raise_for_status()
         
         data = response.json()
         if not data.get("data", {}).get("cards"):
@@ -168,9 +147,6 @@ async def search_weibo_topics(keyword: str, limit: int = 15, page: int = 1) -> l
 async def search_weibo_users(keyword: str, limit: int = 15, page: int = 1) -> list:
     """搜索微博用户"""
     try:
-        # 添加随机延迟避免被检测
-        await asyncio.sleep(random.uniform(1, 3))
-        
         params = {
             'containerid': f'100103type=3&q={keyword}',
             'page_type': 'searchall',
@@ -191,17 +167,8 @@ async def search_weibo_users(keyword: str, limit: int = 15, page: int = 1) -> li
             "sec-fetch-site": "same-origin",
         }
         
-        # 重试机制
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = await http_client.get(url, headers=headers)
-                response.raise_for_status()
-                break
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise e
-                await asyncio.sleep(random.uniform(2, 5))
+        response = await http_client.get(url, headers=headers, retry=SEARCH_RETRY)
+        response.raise_for_status()
         
         data = response.json()
         if not data.get("data", {}).get("cards"):
@@ -24,7 +24,8 @@ async def get_zhihu_trending_func(
     response = await http_client.get(
         "https://www.zhihu.com/api/v3/feed/topstory/hot-lists/total",
         params={"limit": limit},
-        headers=headers
+        headers=headers,
+        retry=True
     )
     response.raise_for_status()
     
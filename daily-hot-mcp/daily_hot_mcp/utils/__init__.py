@@ -4,6 +4,8 @@ from .http import http_client
 from .cache import cache
 from .logger import logger
 from .rss import parse_rss, get_rss_items, get_rss
+from .singleflight import singleflight
+from .parse_pool import parse_pool
 
 __all__ = [
     "http_client",
@@ -12,4 +14,6 @@ __all__ = [
     "parse_rss",
     "get_rss_items",
     "get_rss",
+    "singleflight",
+    "parse_pool",
 ]   
\ No newline at end of file
@@ -0,0 +1,205 @@
+"""按域名的熔断器
+
+上游宕机或屏蔽我们时，每次调用仍要完整地请求一次（往往要等到超时）才会进入备用逻辑。
+熔断器按域名统计最近请求的失败率：
+- closed：正常放行，记录每次请求的成败；
+- open：最近 window 次请求中至少 min_calls 次且失败率达到 failure_rate 时打开，
+  冷却 cooldown 秒内的请求直接抛出 CircuitOpenError，不再访问上游；
+- half_open：冷却结束后放行最多 half_open_calls 个试探请求，全部成功则关闭，
+  任一失败则重新打开。
+
+工具捕获到 CircuitOpenError 后直接走缓存或备用方案。失败指网络错误、超时，
+以及 failure_statuses 中的状态码（默认 403、429 和 5xx，403 通常意味着被屏蔽）。
+
+默认参数可在配置文件中修改，也可按域名覆盖或关闭：
+
+    [http.breaker]
+    failure_rate = 0.5
+    min_calls = 5
+    window = 20
+    cooldown = 30
+
+    [http.hosts."www.kuaishou.com"]
+    breaker = { cooldown = 120 }      # breaker = false 表示不熔断
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, FrozenSet, Optional
+
+from .logger import logger
+from .metrics import metrics
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURE_STATUSES: FrozenSet[int] = frozenset({403, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """熔断器打开时请求被直接拒绝"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} 熔断中，{retry_in:.0f} 秒后重试")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """单个域名的熔断器"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window: int = 20,
+        cooldown: float = 30.0,
+        half_open_calls: int = 1,
+        failure_statuses: FrozenSet[int] = FAILURE_STATUSES,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, int(min_calls))
+        self.cooldown = cooldown
+        self.half_open_calls = max(1, int(half_open_calls))
+        self.failure_statuses = frozenset(failure_statuses)
+        self._results: Deque[bool] = deque(maxlen=max(self.min_calls, int(window)))
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, name: str, section: Dict[str, Any]) -> "CircuitBreaker":
+        fields = ("failure_rate", "min_calls", "window", "cooldown", "half_open_calls")
+        kwargs: Dict[str, Any] = {k: section[k] for k in fields if k in section}
+        if "failure_statuses" in section:
+            kwargs["failure_statuses"] = frozenset(section["failure_statuses"])
+        return cls(name, **kwargs)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            self._state = HALF_OPEN
+            self._trials = 0
+            self._trial_successes = 0
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._results.clear()
+        metrics.incr("breaker.opened", host=self.name)
+        logger.warning(f"{self.name} 失败过多，熔断 {self.cooldown:.0f} 秒")
+
+    def before_call(self) -> None:
+        """请求前调用，熔断中时抛出 CircuitOpenError"""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN:
+                # 试探请求被取消等情况下不会回报结果，超过冷却时间后允许重新试探
+                if time.monotonic() - self._trial_started >= self.cooldown:
+                    self._trials = self._trial_successes = 0
+                if self._trials < self.half_open_calls:
+                    self._trials += 1
+                    self._trial_started = time.monotonic()
+                    return
+            retry_in = max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+        metrics.incr("breaker.rejected", host=self.name)
+        raise CircuitOpenError(self.name, retry_in)
+
+    def release(self) -> None:
+        """before_call() 之后没有结果可回报时调用（例如截止时间用完或被取消），
+        半开状态下归还占用的试探名额，不计入成功或失败"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._trials > self._trial_successes:
+                self._trials -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_calls:
+                    self._state = CLOSED
+                    self._results.clear()
+                    logger.info(f"{self.name} 恢复正常，熔断关闭")
+                return
+            self._results.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._open()
+                return
+            if self._state == OPEN:
+                return
+            self._results.append(False)
+            calls = len(self._results)
+            failures = calls - sum(self._results)
+            if calls >= self.min_calls and failures / calls >= self.failure_rate:
+                self._open()
+
+    def is_failure_status(self, status_code: int) -> bool:
+        return status_code in self.failure_statuses
+
+    def snapshot(self) -> Dict[str, Any]:
+        """返回当前状态，供诊断工具展示"""
+        with self._lock:
+            self._maybe_half_open()
+            calls = len(self._results)
+            failures = calls - sum(self._results)
+            info: Dict[str, Any] = {
+                "state": self._state,
+                "recent_calls": calls,
+                "recent_failures": failures,
+                "failure_rate": round(failures / calls, 3) if calls else 0.0,
+            }
+            if self._state == OPEN:
+                info["retry_in"] = round(
+                    max(0.0, self.cooldown - (time.monotonic() - self._opened_at)), 1
+                )
+            return info
+
+
+class BreakerRegistry:
+    """按域名创建和查找熔断器"""
+
+    def __init__(
+        self,
+        default: Optional[Dict[str, Any]] = None,
+        hosts: Optional[Dict[str, Any]] = None,
+    ):
+        self._default = dict(default or {})
+        # 域名 -> 覆盖参数；False 表示该域名不熔断
+        self._hosts: Dict[str, Any] = {k.lower(): v for k, v in (hosts or {}).items()}
+        self._breakers: Dict[str, Optional[CircuitBreaker]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> Optional[CircuitBreaker]:
+        host = host.lower()
+        with self._lock:
+            if host not in self._breakers:
+                override = self._hosts.get(host, {})
+                if override is False or (self._default.get("enabled") is False and not override):
+                    self._breakers[host] = None
+                else:
+                    section = {**self._default, **(override if isinstance(override, dict) else {})}
+                    self._breakers[host] = CircuitBreaker.from_config(host, section)
+            return self._breakers[host]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """所有已访问过的域名的熔断状态"""
+        with self._lock:
+            breakers = {h: b for h, b in self._breakers.items() if b is not None}
+        return {host: breaker.snapshot() for host, breaker in sorted(breakers.items())}
@@ -1,74 +1,430 @@
 """
 Cache utilities for MCP Daily News.
+
+The cache has two tiers: a bounded in-process LRU holding already-decoded
+values, and a persistent backend underneath it (JSON files by default, or
+SQLite, see ``cache_backend.py``). Reads only touch the backend on a memory
+miss; writes go through to both. Memory hits are reported to the backend's
+access index in batches (before each sweep and on ``flush``), so the keys
+read most often are not the first ones the sweep evicts.
+
+Every entry carries a fresh window and a stale window. ``get``/``aget`` only
+return fresh data; ``get_entry``/``aget_entry`` return the entry in any state
+so stale-while-revalidate callers can decide what to serve.
 """
 
-import json
-import tempfile
-from pathlib import Path
-from typing import Any, Optional
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
 from datetime import datetime, timedelta
 
+from .cache_backend import DEFAULT_NAMESPACE, CacheBackend, CacheEntry, create_backend
+from .cache_serializer import Serializer
+from .config import env_float
+from .logger import logger
+from .metrics import metrics
+
+SWEEP_INTERVAL_ENV = "DAILY_HOT_CACHE_SWEEP_INTERVAL"
+MAX_ENTRIES_ENV = "DAILY_HOT_CACHE_MAX_ENTRIES"
+MAX_SIZE_ENV = "DAILY_HOT_CACHE_MAX_SIZE_MB"
+
 
 class SimpleCache:
-    def __init__(self, cache_duration_minutes: int = 30):
-        """Initialize the cache with specified duration."""
-        self._cache_dir = Path(tempfile.gettempdir()) / "mcp_daily_news" / "cache"
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(
+        self,
+        cache_duration_minutes: int = 30,
+        stale_duration_minutes: int = 24 * 60,
+        memory_max_entries: int = 256,
+        memory_max_bytes: int = 16 * 1024 * 1024,
+        backend: Optional[CacheBackend] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        serializer: Optional[Serializer] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """Initialize the cache with default windows and memory tier bounds.
+
+        ``stale_duration_minutes`` is how long an entry may still be served
+        (with a background refresh) after its fresh window ends.
+        ``memory_max_bytes`` is measured on the encoded size of each entry,
+        which is a stable proxy for how heavy the decoded value is.
+        ``backend`` defaults to the one selected by ``DAILY_HOT_CACHE_BACKEND``,
+        storing entries under ``namespace`` and the current ``CACHE_VERSION``
+        and encoding them with ``serializer`` (see ``cache_serializer.py``;
+        configured from the environment by default).
+        ``max_entries``/``max_bytes`` bound the backend and are enforced by
+        ``sweep``; they default to ``DAILY_HOT_CACHE_MAX_ENTRIES`` (10000)
+        and ``DAILY_HOT_CACHE_MAX_SIZE_MB`` (256).
+        """
         self._cache_duration = timedelta(minutes=cache_duration_minutes)
+        self._stale_duration = timedelta(minutes=stale_duration_minutes)
+        self._backend = backend or create_backend(
+            default_ttl=self._cache_duration.total_seconds(),
+            namespace=namespace,
+            serializer=serializer,
+        )
+        if max_entries is None:
+            max_entries = int(env_float(MAX_ENTRIES_ENV, 10000))
+        if max_bytes is None:
+            max_bytes = int(env_float(MAX_SIZE_ENV, 256) * 1024 * 1024)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
 
-    def _get_cache_file(self, key: str) -> Path:
-        """Get the cache file path for a given key."""
-        safe_key = "".join(c for c in key if c.isalnum() or c in '-_.')
-        return self._cache_dir / f"{safe_key}.json"
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._memory_max_entries = memory_max_entries
+        self._memory_max_bytes = memory_max_bytes
+        self._lock = threading.Lock()
+        # key -> last memory-tier hit not yet reported to the backend
+        self._touched: Dict[str, float] = {}
+        self._stats = {
+            "memory_hits": 0,
+            "memory_misses": 0,
+            "file_hits": 0,
+            "file_misses": 0,
+            "expired_removed": 0,
+            "evicted": 0,
+        }
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get cached data for a key if it exists and is not expired."""
-        cache_file = self._get_cache_file(key)
-        
-        if not cache_file.exists():
-            return None
-            
-        try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                
-            # Check if cache is expired
-            cache_time = datetime.fromisoformat(cache_data['timestamp'])
-            if datetime.now() - cache_time > self._cache_duration:
-                cache_file.unlink()  # Remove expired cache
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    # Memory tier
+
+    def _memory_get(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry in the memory tier, refreshing its LRU position.
+
+        Entries past their stale window are dropped from memory; the file
+        tier still holds them for fallback reads.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                self._stats["memory_misses"] += 1
+                return None
+            if entry.is_expired:
+                self._memory_remove(key)
+                self._stats["memory_misses"] += 1
                 return None
-                
-            return cache_data['data']
+            self._memory.move_to_end(key)
+            self._touched[key] = time.time()
+            self._stats["memory_hits"] += 1
+            return entry
+
+    def _flush_touched(self) -> None:
+        """Report buffered memory-tier hits to the backend's access index."""
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        if not touched:
+            return
+        try:
+            self._backend.touch(touched)
         except Exception:
-            # If there's any error reading cache, remove it
-            if cache_file.exists():
-                cache_file.unlink()
+            pass
+
+    def _memory_put(self, key: str, entry: CacheEntry) -> None:
+        """Insert or replace an entry in the memory tier and enforce its bounds."""
+        with self._lock:
+            self._memory_remove(key)
+            if (
+                entry.size > self._memory_max_bytes
+                or self._memory_max_entries <= 0
+                or entry.is_expired
+            ):
+                return
+            self._memory[key] = entry
+            self._memory_bytes += entry.size
+            self._memory_evict()
+
+    def _memory_remove(self, key: str) -> None:
+        """Drop an entry from the memory tier. Caller must hold the lock."""
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size
+
+    def _memory_evict(self) -> None:
+        """Bring the memory tier back under its bounds. Caller must hold the lock.
+
+        Entries past their stale window are dropped first so that a burst of
+        short-lived keys does not push out entries that are still servable;
+        only then are the least recently used entries evicted.
+        """
+        if not self._memory_over_budget():
+            return
+        for key in [k for k, e in self._memory.items() if e.is_expired]:
+            self._memory_remove(key)
+        while self._memory_over_budget():
+            _, entry = self._memory.popitem(last=False)
+            self._memory_bytes -= entry.size
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _memory_over_budget(self) -> bool:
+        return (
+            len(self._memory) > self._memory_max_entries
+            or self._memory_bytes > self._memory_max_bytes
+        )
+
+    # Backend tier
+    #
+    # The counters keep their historical "file_*" names whatever the backend.
+
+    def _load_file(self, key: str) -> Optional[CacheEntry]:
+        """Read a key from the backend and promote it into the memory tier.
+
+        Expired entries are returned as well, so they stay available as a
+        fallback until the next sweep.
+        """
+        try:
+            entry = self._backend.load(key)
+        except Exception:
+            entry = None
+        if entry is None:
+            self._count("file_misses")
             return None
+        self._memory_put(key, entry)
+        self._count("file_hits")
+        return entry
 
-    def set(self, key: str, data: Any) -> None:
-        """Cache data for a key."""
-        cache_file = self._get_cache_file(key)
-        
-        cache_data = {
-            'timestamp': datetime.now().isoformat(),
-            'data': data
-        }
-        
+    def _load_many(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Resolve several keys, hitting the backend once for all memory misses."""
+        result: Dict[str, CacheEntry] = {}
+        missing = []
+        for key in keys:
+            entry = self._memory_get(key)
+            if entry is not None:
+                result[key] = entry
+            else:
+                missing.append(key)
+        if not missing:
+            return result
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            loaded = self._backend.load_many(missing)
+        except Exception:
+            loaded = {}
+        for key in missing:
+            entry = loaded.get(key)
+            if entry is None:
+                self._count("file_misses")
+                continue
+            self._memory_put(key, entry)
+            self._count("file_hits")
+            result[key] = entry
+        return result
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        entry = self._memory_get(key)
+        if entry is not None:
+            return entry
+        return self._load_file(key)
+
+    def _store(
+        self,
+        key: str,
+        data: Any,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> None:
+        """Encode data and write it through both tiers.
+
+        ``ttl`` and ``stale_ttl`` are in seconds and default to the cache-wide
+        windows; ``stale_ttl`` is counted from the end of the fresh window.
+        """
+        if ttl is None:
+            ttl = self._cache_duration.total_seconds()
+        if stale_ttl is None:
+            stale_ttl = self._stale_duration.total_seconds()
+        updated = datetime.now().timestamp()
+        expires_at = updated + ttl
+        entry = CacheEntry(data, updated, expires_at, expires_at + stale_ttl)
+
+        try:
+            payload = self._backend.encode(entry)
+        except Exception:
+            # Unserializable data is not cached at all
+            return
+        entry.size = len(payload)
+
+        self._memory_put(key, entry)
+
+        try:
+            self._backend.write(key, entry, payload)
         except Exception:
             # Ignore cache write errors
             pass
 
+    def _delete_file(self, key: str) -> None:
+        try:
+            self._backend.delete(key)
+        except Exception:
+            pass
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._memory_remove(key)
+
+    def _sweep(self) -> Dict[str, int]:
+        with self._lock:
+            for key in [k for k, e in self._memory.items() if e.is_expired]:
+                self._memory_remove(key)
+        self._flush_touched()
+        result = self._backend.sweep(max_entries=self._max_entries, max_bytes=self._max_bytes)
+        with self._lock:
+            self._stats["expired_removed"] += result["expired"]
+            self._stats["evicted"] += result["evicted"]
+
+        labels = {"backend": self._backend.name}
+        metrics.incr("cache.sweep.runs", **labels)
+        metrics.incr("cache.sweep.expired", result["expired"], **labels)
+        metrics.incr("cache.sweep.evicted", result["evicted"], **labels)
+        metrics.incr("cache.sweep.reclaimed_bytes", result["reclaimed_bytes"], **labels)
+        metrics.gauge("cache.entries", result["entries"], **labels)
+        metrics.gauge("cache.bytes", result["bytes"], **labels)
+        return result
+
+    # Public API
+    #
+    # The async methods are what tool functions should use: memory hits are
+    # answered inline, and file I/O runs in a worker thread so it never stalls
+    # the event loop. The sync methods do the same work inline and remain for
+    # callers outside a running loop.
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Get fresh cached data for a key without blocking the event loop."""
+        entry = await self.aget_entry(key)
+        if entry is not None and entry.is_fresh:
+            return entry.data
+        return None
+
+    async def aget_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry for a key in any state (fresh, stale or expired)."""
+        entry = self._memory_get(key)
+        if entry is not None:
+            return entry
+        return await asyncio.to_thread(self._load_file, key)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get fresh cached data for several keys in one backend round trip."""
+        entries = await self.aget_entries(keys)
+        return {key: entry.data for key, entry in entries.items() if entry.is_fresh}
+
+    async def aget_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Get the entries for several keys in any state; missing keys are left out."""
+        return await asyncio.to_thread(self._load_many, list(keys))
+
+    async def aset(
+        self,
+        key: str,
+        data: Any,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> None:
+        """Cache data for a key without blocking the event loop."""
+        await asyncio.to_thread(self._store, key, data, ttl, stale_ttl)
+
+    async def adelete(self, key: str) -> None:
+        """Remove a key from both tiers without blocking the event loop."""
+        self._forget(key)
+        await asyncio.to_thread(self._delete_file, key)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached data for a key if it exists and is still fresh."""
+        entry = self._lookup(key)
+        if entry is not None and entry.is_fresh:
+            return entry.data
+        return None
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry for a key in any state (fresh, stale or expired)."""
+        return self._lookup(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get fresh cached data for several keys in one backend round trip."""
+        entries = self._load_many(keys)
+        return {key: entry.data for key, entry in entries.items() if entry.is_fresh}
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> None:
+        """Cache data for a key, writing through both tiers."""
+        self._store(key, data, ttl, stale_ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove a key from both tiers."""
+        self._forget(key)
+        self._delete_file(key)
+
     def clear(self) -> None:
         """Clear all cached data."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
         try:
-            for cache_file in self._cache_dir.glob("*.json"):
-                cache_file.unlink()
+            self._backend.clear()
         except Exception:
             pass
 
+    async def asweep(self) -> Dict[str, int]:
+        """Drop expired entries from both tiers and evict the backend down to its limits.
+
+        Eviction is least-recently-read first, by the backend's access index.
+        """
+        return await asyncio.to_thread(self._sweep)
+
+    async def run_sweeper(self, interval: Optional[float] = None) -> None:
+        """Sweep periodically until cancelled.
+
+        ``interval`` is in seconds and defaults to
+        ``DAILY_HOT_CACHE_SWEEP_INTERVAL`` (minutes, 10 by default).
+        """
+        if interval is None:
+            interval = env_float(SWEEP_INTERVAL_ENV, 10) * 60
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                result = await self.asweep()
+                if result["expired"] or result["evicted"]:
+                    logger.info(
+                        f"缓存清理完成：过期 {result['expired']} 条，淘汰 {result['evicted']} 条，"
+                        f"释放 {result['reclaimed_bytes'] / 1024:.1f} KB；"
+                        f"剩余 {result['entries']} 条，{result['bytes'] / 1024:.1f} KB"
+                    )
+            except Exception as e:
+                logger.warning(f"缓存清理失败: {e}")
+
+    def flush(self) -> None:
+        """Persist writes and access times the backend may still be buffering."""
+        self._flush_touched()
+        self._backend.flush()
+
+    def close(self) -> None:
+        """Flush pending writes and release the backend."""
+        self._flush_touched()
+        self._backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-tier hit/miss counters and the memory tier's current size."""
+        with self._lock:
+            return {
+                **self._stats,
+                "backend": self._backend.name,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "memory_max_entries": self._memory_max_entries,
+                "memory_max_bytes": self._memory_max_bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+            }
+
 
 # Global cache instance
-cache = SimpleCache() 
\ No newline at end of file
+cache = SimpleCache()
\ No newline at end of file
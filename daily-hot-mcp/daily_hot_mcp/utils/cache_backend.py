@@ -0,0 +1,689 @@
+"""
+Storage backends for the persistent tier of ``SimpleCache``.
+
+A backend stores encoded entries by key and knows nothing about the memory
+tier or freshness policy. Two implementations are provided:
+
+- ``FileBackend``: one JSON document per key in a cache directory, named
+  by a hash of the key. This is the default.
+- ``SQLiteBackend``: a single table keyed by cache key, with an index on the
+  end of the stale window so sweeps do not have to scan every row. Writes are
+  buffered and committed in batches; the database runs in WAL mode so reads
+  are not blocked by a pending commit.
+
+Pick one with ``DAILY_HOT_CACHE_BACKEND=file|sqlite``.
+
+Both backends track when each entry was last read in an index of their own
+(not filesystem atime, which is often disabled), so ``sweep`` can enforce
+entry-count and size limits by evicting the least recently used entries.
+
+Both backends store entries under a namespace/version segment (a directory
+for files, a table for SQLite). Bumping ``CACHE_VERSION`` when the shape of
+cached payloads changes makes every older entry unreachable; the next sweep
+deletes the old segment.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+
+from .cache_serializer import Serializer, create_serializer
+from .logger import logger
+
+BACKEND_ENV = "DAILY_HOT_CACHE_BACKEND"
+DEFAULT_CACHE_ROOT = Path(tempfile.gettempdir()) / "mcp_daily_news"
+DEFAULT_NAMESPACE = "default"
+# Bump when the format of cached tool results changes
+CACHE_VERSION = 1
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+def _safe_name(value: str, max_length: int = 48) -> str:
+    """Reduce a string to filename/identifier-safe characters."""
+    return _UNSAFE_CHARS.sub("_", value)[:max_length].strip("_")
+
+
+def cache_file_name(key: str) -> str:
+    """Map a cache key to a fixed-length, collision-free file name.
+
+    The name is the readable part of the key (the tool name before the first
+    ``:``) followed by a SHA-256 digest of the full key, so keys that differ
+    only in punctuation or non-ASCII characters never share a file.
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    prefix = _safe_name(key.split(":", 1)[0]) or "key"
+    return f"{prefix}-{digest}.json"
+
+
+class CacheEntry:
+    """A decoded cache value together with its freshness windows.
+
+    An entry is *fresh* until ``expires_at`` and *stale* until
+    ``stale_until``; after that it is *expired* but kept in the backend so
+    callers can still fall back to it until the next sweep.
+    """
+
+    __slots__ = ("data", "updated", "expires_at", "stale_until", "size")
+
+    def __init__(
+        self,
+        data: Any,
+        updated: float,
+        expires_at: float,
+        stale_until: float,
+        size: int = 0,
+    ):
+        self.data = data
+        self.updated = updated
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.size = size
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def is_stale(self) -> bool:
+        return self.expires_at <= time.time() < self.stale_until
+
+    @property
+    def is_expired(self) -> bool:
+        return time.time() >= self.stale_until
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was written."""
+        return max(0.0, time.time() - self.updated)
+
+
+class CacheBackend:
+    """Interface for the persistent tier.
+
+    ``encode`` turns an entry into the bytes that ``write`` will persist,
+    using the backend's ``Serializer``; it
+    is separate so ``SimpleCache`` can reject unserializable values (and size
+    the memory tier) before anything is written. ``load`` returns entries in
+    any state, including expired ones. All methods are blocking and may be
+    called from worker threads.
+    """
+
+    name = "base"
+
+    def __init__(self, serializer: Optional[Serializer] = None):
+        self.serializer = serializer or create_serializer()
+
+    def encode(self, entry: CacheEntry) -> bytes:
+        raise NotImplementedError
+
+    def write(self, key: str, entry: CacheEntry, payload: bytes) -> None:
+        raise NotImplementedError
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def load_many(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Load several keys at once; missing keys are left out."""
+        result = {}
+        for key in keys:
+            entry = self.load(key)
+            if entry is not None:
+                result[key] = entry
+        return result
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def touch(self, accessed: Dict[str, float]) -> None:
+        """Record read times for keys served without a ``load``.
+
+        ``SimpleCache`` answers most reads of hot keys from its memory tier
+        and reports them here in batches, so the access index the sweep
+        evicts by still reflects them. Keys that are no longer stored are
+        ignored. The default does nothing.
+        """
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def sweep(
+        self,
+        now: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Remove expired entries, then evict least recently read ones over the limits.
+
+        Returns counts of ``expired`` and ``evicted`` entries, the
+        ``reclaimed_bytes``, and the ``entries``/``bytes`` left afterwards.
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Persist any buffered writes."""
+
+    def close(self) -> None:
+        """Flush and release resources."""
+        self.flush()
+
+
+class FileBackend(CacheBackend):
+    """One document per key, written atomically.
+
+    Documents carry the entry's windows next to its data and are encoded with
+    the backend's serializer (compact JSON by default; the ``.json`` suffix is
+    kept whatever the format). Files written before serializer headers
+    existed are plain JSON and are still read.
+
+    An index file (``_index``) maps each file name to its last access time,
+    size and end of stale window, so sweeps do not need to parse every file.
+    Files missing from the index (e.g. written by another process) are parsed
+    once and added, using their mtime as access time.
+    """
+
+    name = "file"
+    INDEX_FILE = "_index"
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        default_ttl: float = 30 * 60,
+        namespace: str = DEFAULT_NAMESPACE,
+        version: int = CACHE_VERSION,
+        serializer: Optional[Serializer] = None,
+    ):
+        super().__init__(serializer)
+        self._root = Path(cache_dir or DEFAULT_CACHE_ROOT / "cache")
+        self._namespace = _safe_name(namespace) or DEFAULT_NAMESPACE
+        self._cache_dir = self._root / f"{self._namespace}-v{version}"
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._default_ttl = default_ttl
+        # file name -> [last access, size in bytes, stale_until]
+        self._index: Dict[str, List[float]] = self._load_index()
+        self._index_lock = threading.Lock()
+
+    def _get_cache_file(self, key: str) -> Path:
+        """Get the cache file path for a given key."""
+        return self._cache_dir / cache_file_name(key)
+
+    def _load_index(self) -> Dict[str, List[float]]:
+        try:
+            index = json.loads((self._cache_dir / self.INDEX_FILE).read_text(encoding='utf-8'))
+            return {name: list(row) for name, row in index.items() if len(row) == 3}
+        except Exception:
+            return {}
+
+    def _save_index(self) -> None:
+        with self._index_lock:
+            raw = json.dumps(self._index, separators=(",", ":"))
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, prefix=".tmp-", suffix=".idx")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(raw)
+            os.replace(tmp_path, self._cache_dir / self.INDEX_FILE)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _touch(self, name: str, size: int, stale_until: float) -> None:
+        with self._index_lock:
+            self._index[name] = [time.time(), size, stale_until]
+
+    def encode(self, entry: CacheEntry) -> bytes:
+        cache_data = {
+            'timestamp': datetime.fromtimestamp(entry.updated).isoformat(),
+            'expires': entry.expires_at,
+            'stale_until': entry.stale_until,
+            'data': entry.data
+        }
+        return self.serializer.dumps(cache_data)
+
+    def _decode(self, raw: bytes) -> CacheEntry:
+        cache_data = self.serializer.loads(raw)
+        updated = datetime.fromisoformat(cache_data['timestamp']).timestamp()
+        # Entries written before per-entry windows existed only carry a timestamp
+        expires_at = cache_data.get('expires', updated + self._default_ttl)
+        stale_until = cache_data.get('stale_until', expires_at)
+        return CacheEntry(cache_data['data'], updated, expires_at, stale_until, len(raw))
+
+    def write(self, key: str, entry: CacheEntry, payload: bytes) -> None:
+        """Write to a temp file in the cache dir and rename it into place.
+
+        ``os.replace`` is atomic on the same filesystem, so concurrent readers
+        see either the previous entry or the new one, never a partial write.
+        """
+        cache_file = self._get_cache_file(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._touch(cache_file.name, len(payload), entry.stale_until)
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        """Read a key; only unreadable files are removed."""
+        cache_file = self._get_cache_file(key)
+        try:
+            raw = cache_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            entry = self._decode(raw)
+        except Exception:
+            # If there's any error reading cache, remove it
+            cache_file.unlink(missing_ok=True)
+            return None
+        self._touch(cache_file.name, entry.size, entry.stale_until)
+        return entry
+
+    def touch(self, accessed: Dict[str, float]) -> None:
+        with self._index_lock:
+            for key, at in accessed.items():
+                row = self._index.get(cache_file_name(key))
+                if row is not None and at > row[0]:
+                    row[0] = at
+
+    def delete(self, key: str) -> None:
+        cache_file = self._get_cache_file(key)
+        cache_file.unlink(missing_ok=True)
+        with self._index_lock:
+            self._index.pop(cache_file.name, None)
+
+    def clear(self) -> None:
+        for cache_file in self._cache_dir.glob("*.json"):
+            cache_file.unlink(missing_ok=True)
+        with self._index_lock:
+            self._index.clear()
+        self._save_index()
+
+    def flush(self) -> None:
+        self._save_index()
+
+    def _remove_obsolete(self) -> Tuple[int, int]:
+        """Delete other versions of this namespace and files from the flat legacy layout."""
+        removed = reclaimed = 0
+        for path in self._root.iterdir():
+            if path.is_file() and path.suffix == ".json":
+                reclaimed += path.stat().st_size
+                path.unlink(missing_ok=True)
+                removed += 1
+            elif (
+                path.is_dir()
+                and path != self._cache_dir
+                and path.name.startswith(f"{self._namespace}-v")
+            ):
+                for cache_file in path.glob("*.json"):
+                    removed += 1
+                    reclaimed += cache_file.stat().st_size
+                shutil.rmtree(path, ignore_errors=True)
+        return removed, reclaimed
+
+    def _reconcile_index(self) -> Dict[str, List[float]]:
+        """Bring the index in line with the files actually on disk and return a copy."""
+        on_disk = {}
+        with os.scandir(self._cache_dir) as it:
+            for item in it:
+                if item.name.endswith(".json") and not item.name.startswith(".tmp-"):
+                    on_disk[item.name] = item
+        with self._index_lock:
+            for name in set(self._index) - set(on_disk):
+                del self._index[name]
+            unknown = [name for name in on_disk if name not in self._index]
+        for name in unknown:
+            item = on_disk[name]
+            try:
+                stat = item.stat()
+                stale_until = self._decode(Path(item.path).read_bytes()).stale_until
+            except FileNotFoundError:
+                continue
+            except Exception:
+                # Unreadable: index it as already expired so the sweep removes it
+                stat, stale_until = item.stat(), 0.0
+            with self._index_lock:
+                self._index.setdefault(name, [stat.st_mtime, stat.st_size, stale_until])
+        with self._index_lock:
+            return {name: list(row) for name, row in self._index.items()}
+
+    def _remove_files(self, names: List[str], index: Dict[str, List[float]]) -> int:
+        reclaimed = 0
+        for name in names:
+            (self._cache_dir / name).unlink(missing_ok=True)
+            reclaimed += int(index.pop(name)[1])
+            with self._index_lock:
+                self._index.pop(name, None)
+        return reclaimed
+
+    def sweep(
+        self,
+        now: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Remove expired files and evict by last access time, using the index."""
+        now = time.time() if now is None else now
+        expired, reclaimed = self._remove_obsolete()
+        index = self._reconcile_index()
+
+        expired_names = [name for name, (_, _, stale_until) in index.items() if stale_until <= now]
+        expired += len(expired_names)
+        reclaimed += self._remove_files(expired_names, index)
+
+        evict: List[str] = []
+        entries = len(index)
+        total = int(sum(row[1] for row in index.values()))
+        for name, (_, size, _) in sorted(index.items(), key=lambda item: item[1][0]):
+            if (max_entries is None or entries <= max_entries) and (
+                max_bytes is None or total <= max_bytes
+            ):
+                break
+            evict.append(name)
+            entries -= 1
+            total -= int(size)
+        reclaimed += self._remove_files(evict, index)
+
+        self._save_index()
+        return {
+            "expired": expired,
+            "evicted": len(evict),
+            "reclaimed_bytes": reclaimed,
+            "entries": entries,
+            "bytes": total,
+        }
+
+
+class SQLiteBackend(CacheBackend):
+    """Single-table SQLite store with buffered, batched writes.
+
+    Writes go to an in-memory pending map and are committed in one
+    transaction once ``batch_size`` entries are pending or ``flush_interval``
+    seconds after the first pending write, whichever comes first. Reads check
+    the pending map before the database, so a write is visible immediately.
+    Read times for the ``accessed`` column are buffered the same way and
+    written with the next batch.
+    """
+
+    name = "sqlite"
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS {table} ("
+        " key TEXT PRIMARY KEY,"
+        " updated REAL NOT NULL,"
+        " expires REAL NOT NULL,"
+        " stale_until REAL NOT NULL,"
+        " data BLOB NOT NULL,"
+        " accessed REAL NOT NULL DEFAULT 0"
+        ")",
+        "CREATE INDEX IF NOT EXISTS {table}_stale_until ON {table} (stale_until)",
+        "CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed)",
+    )
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        batch_size: int = 32,
+        flush_interval: float = 1.0,
+        namespace: str = DEFAULT_NAMESPACE,
+        version: int = CACHE_VERSION,
+        serializer: Optional[Serializer] = None,
+    ):
+        super().__init__(serializer)
+        self._path = Path(path or DEFAULT_CACHE_ROOT / "cache.sqlite3")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._pending: Dict[str, Tuple[CacheEntry, bytes]] = {}
+        self._accessed: Dict[str, float] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._table_prefix = f"cache_{(_safe_name(namespace) or DEFAULT_NAMESPACE).replace('-', '_')}_v"
+        self._table = f"{self._table_prefix}{version}"
+
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False, isolation_level=None)
+        # auto_vacuum only takes effect on a fresh database, before any table exists
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = {
+            row[1] for row in self._conn.execute(f"PRAGMA table_info({self._table})")
+        }
+        if columns and "accessed" not in columns:
+            # Tables created before access tracking existed
+            self._conn.execute(
+                f"ALTER TABLE {self._table} ADD COLUMN accessed REAL NOT NULL DEFAULT 0"
+            )
+        for statement in self._SCHEMA:
+            self._conn.execute(statement.format(table=self._table))
+
+    def encode(self, entry: CacheEntry) -> bytes:
+        return self.serializer.dumps(entry.data)
+
+    def _schedule_flush(self) -> None:
+        """Start the flush timer if none is pending. Caller holds the lock."""
+        if self._timer is None:
+            self._timer = threading.Timer(self._flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _row_to_entry(self, row: Tuple[Any, ...]) -> CacheEntry:
+        _, updated, expires, stale_until, data = row
+        if isinstance(data, str):
+            # Rows written before serializer headers existed hold JSON text
+            data = data.encode('utf-8')
+        return CacheEntry(self.serializer.loads(data), updated, expires, stale_until, len(data))
+
+    def write(self, key: str, entry: CacheEntry, payload: bytes) -> None:
+        with self._lock:
+            self._pending[key] = (entry, payload)
+            self._accessed.pop(key, None)
+            if len(self._pending) >= self._batch_size:
+                self._flush_locked()
+            else:
+                self._schedule_flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending and not self._accessed:
+            return
+        rows = [
+            (key, entry.updated, entry.expires_at, entry.stale_until, payload, entry.updated)
+            for key, (entry, payload) in self._pending.items()
+        ]
+        accessed = [(at, key) for key, at in self._accessed.items()]
+        self._pending.clear()
+        self._accessed.clear()
+        try:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {self._table}"
+                    " (key, updated, expires, stale_until, data, accessed)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.executemany(
+                    f"UPDATE {self._table} SET accessed = ? WHERE key = ?", accessed
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"写入 SQLite 缓存失败: {e}")
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        return self.load_many([key]).get(key)
+
+    def load_many(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Load all requested keys with a single query."""
+        keys = list(dict.fromkeys(keys))
+        result: Dict[str, CacheEntry] = {}
+        with self._lock:
+            missing: List[str] = []
+            for key in keys:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    result[key] = pending[0]
+                else:
+                    missing.append(key)
+            # SQLite limits the number of bound parameters per statement
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, updated, expires, stale_until, data FROM {self._table}"
+                    f" WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    try:
+                        result[row[0]] = self._row_to_entry(row)
+                    except Exception:
+                        self._conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (row[0],))
+            if result:
+                now = time.time()
+                for key in result:
+                    self._accessed[key] = now
+                self._schedule_flush()
+        return result
+
+    def touch(self, accessed: Dict[str, float]) -> None:
+        if not accessed:
+            return
+        with self._lock:
+            for key, at in accessed.items():
+                if at > self._accessed.get(key, 0.0):
+                    self._accessed[key] = at
+            self._schedule_flush()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+            self._accessed.pop(key, None)
+            self._conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._accessed.clear()
+            self._conn.execute(f"DELETE FROM {self._table}")
+            self._conn.execute("PRAGMA incremental_vacuum")
+
+    def sweep(
+        self,
+        now: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Delete expired rows and evict by ``accessed``, both via indexes, then reclaim free pages."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._flush_locked()
+            expired, reclaimed = self._conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM {self._table}"
+                " WHERE stale_until <= ?",
+                (now,),
+            ).fetchone()
+            self._conn.execute(f"DELETE FROM {self._table} WHERE stale_until <= ?", (now,))
+            dropped, dropped_bytes = self._drop_obsolete_tables()
+            expired += dropped
+            reclaimed += dropped_bytes
+
+            entries, total = self._conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM {self._table}"
+            ).fetchone()
+            evict: List[str] = []
+            if (max_entries is not None and entries > max_entries) or (
+                max_bytes is not None and total > max_bytes
+            ):
+                for key, size in self._conn.execute(
+                    f"SELECT key, LENGTH(data) FROM {self._table} ORDER BY accessed"
+                ):
+                    if (max_entries is None or entries <= max_entries) and (
+                        max_bytes is None or total <= max_bytes
+                    ):
+                        break
+                    evict.append(key)
+                    entries -= 1
+                    total -= size
+                    reclaimed += size
+                with self._conn:
+                    self._conn.execute("BEGIN")
+                    self._conn.executemany(
+                        f"DELETE FROM {self._table} WHERE key = ?", [(key,) for key in evict]
+                    )
+
+            if expired or evict:
+                self._conn.execute("PRAGMA incremental_vacuum")
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        return {
+            "expired": expired,
+            "evicted": len(evict),
+            "reclaimed_bytes": reclaimed,
+            "entries": entries,
+            "bytes": total,
+        }
+
+    def _drop_obsolete_tables(self) -> Tuple[int, int]:
+        """Drop tables left behind by other versions of this namespace. Caller holds the lock."""
+        removed = reclaimed = 0
+        tables = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ? ESCAPE '\\'",
+            (self._table_prefix.replace("_", "\\_") + "%",),
+        ).fetchall()
+        for (table,) in tables:
+            if table == self._table:
+                continue
+            count, size = self._conn.execute(
+                f'SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM "{table}"'
+            ).fetchone()
+            removed += count
+            reclaimed += size
+            self._conn.execute(f'DROP TABLE "{table}"')
+        return removed, reclaimed
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+
+def create_backend(
+    name: Optional[str] = None,
+    default_ttl: float = 30 * 60,
+    namespace: str = DEFAULT_NAMESPACE,
+    version: int = CACHE_VERSION,
+    serializer: Optional[Serializer] = None,
+) -> CacheBackend:
+    """Build the backend named by ``name`` or ``DAILY_HOT_CACHE_BACKEND``."""
+    name = (name or os.environ.get(BACKEND_ENV) or "file").strip().lower()
+    if name == "sqlite":
+        try:
+            return SQLiteBackend(namespace=namespace, version=version, serializer=serializer)
+        except sqlite3.Error as e:
+            logger.error(f"无法打开 SQLite 缓存，改用文件缓存: {e}")
+    elif name != "file":
+        logger.warning(f"未知的缓存后端 {name}，使用文件缓存")
+    return FileBackend(
+        default_ttl=default_ttl, namespace=namespace, version=version, serializer=serializer
+    )
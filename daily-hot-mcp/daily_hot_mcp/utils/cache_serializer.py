@@ -0,0 +1,135 @@
+"""
+Serializers for cached payloads.
+
+Every encoded payload starts with a 4-byte header: the magic ``DH``, one byte
+for the format (``j`` JSON, ``m`` msgpack) and one for the compression
+(``-`` none, ``g`` gzip, ``z`` zstd). ``loads`` dispatches on the header
+rather than on the serializer's own settings, so entries written with a
+different configuration, or before headers existed (plain JSON), stay
+readable side by side.
+
+msgpack and zstandard are optional (``pip install daily_hot_mcp[cache]``);
+when one is configured but not installed the serializer falls back to JSON
+or gzip and logs a warning.
+
+Configuration::
+
+    DAILY_HOT_CACHE_FORMAT=json|msgpack
+    DAILY_HOT_CACHE_COMPRESSION=none|gzip|zstd
+    DAILY_HOT_CACHE_COMPRESS_THRESHOLD=4096   # bytes; smaller bodies stay uncompressed
+"""
+
+import gzip
+import json
+import os
+from typing import Any, Optional
+
+from .config import env_float
+from .logger import logger
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+MAGIC = b"DH"
+HEADER_SIZE = 4
+
+_FORMATS = {"json": b"j", "msgpack": b"m"}
+_COMPRESSIONS = {"none": b"-", "gzip": b"g", "zstd": b"z"}
+
+
+def has_header(raw: bytes) -> bool:
+    """Whether ``raw`` was written by a ``Serializer`` (as opposed to legacy JSON)."""
+    return raw[:2] == MAGIC and len(raw) >= HEADER_SIZE
+
+
+class Serializer:
+    """Encode values with a format header and optional compression."""
+
+    def __init__(
+        self,
+        format: str = "json",
+        compression: str = "none",
+        compress_threshold: int = 4096,
+        level: Optional[int] = None,
+    ):
+        if format not in _FORMATS:
+            raise ValueError(f"Unknown cache format: {format}")
+        if compression not in _COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        if format == "msgpack" and msgpack is None:
+            logger.warning("未安装 msgpack，缓存改用 JSON 格式")
+            format = "json"
+        if compression == "zstd" and zstandard is None:
+            logger.warning("未安装 zstandard，缓存改用 gzip 压缩")
+            compression = "gzip"
+        self.format = format
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.level = level
+        self._zstd_compressor = (
+            zstandard.ZstdCompressor(level=level or 3) if compression == "zstd" else None
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Serializer(format={self.format!r}, compression={self.compression!r}, "
+            f"compress_threshold={self.compress_threshold})"
+        )
+
+    def dumps(self, value: Any) -> bytes:
+        if self.format == "msgpack":
+            body = msgpack.packb(value, use_bin_type=True)
+        else:
+            body = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        compression = self.compression
+        if compression == "none" or len(body) < self.compress_threshold:
+            compression = "none"
+        elif compression == "zstd":
+            body = self._zstd_compressor.compress(body)
+        else:
+            body = gzip.compress(body, compresslevel=self.level or 6, mtime=0)
+        return MAGIC + _FORMATS[self.format] + _COMPRESSIONS[compression] + body
+
+    @staticmethod
+    def loads(raw: bytes) -> Any:
+        """Decode a payload written by any ``Serializer``, or legacy plain JSON."""
+        if not has_header(raw):
+            return json.loads(raw)
+        format_byte, compression_byte = raw[2:3], raw[3:4]
+        body = raw[HEADER_SIZE:]
+        if compression_byte == _COMPRESSIONS["gzip"]:
+            body = gzip.decompress(body)
+        elif compression_byte == _COMPRESSIONS["zstd"]:
+            if zstandard is None:
+                raise ValueError("zstd-compressed cache entry but zstandard is not installed")
+            body = zstandard.ZstdDecompressor().decompress(body)
+        elif compression_byte != _COMPRESSIONS["none"]:
+            raise ValueError(f"Unknown cache compression byte: {compression_byte!r}")
+
+        if format_byte == _FORMATS["msgpack"]:
+            if msgpack is None:
+                raise ValueError("msgpack cache entry but msgpack is not installed")
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        if format_byte == _FORMATS["json"]:
+            return json.loads(body)
+        raise ValueError(f"Unknown cache format byte: {format_byte!r}")
+
+
+def create_serializer() -> Serializer:
+    """Build the serializer configured through environment variables."""
+    format = os.environ.get("DAILY_HOT_CACHE_FORMAT", "json").strip().lower()
+    compression = os.environ.get("DAILY_HOT_CACHE_COMPRESSION", "none").strip().lower()
+    threshold = int(env_float("DAILY_HOT_CACHE_COMPRESS_THRESHOLD", 4096))
+    try:
+        return Serializer(format, compression, threshold)
+    except ValueError as e:
+        logger.warning(f"缓存序列化配置无效，使用默认 JSON: {e}")
+        return Serializer()
@@ -0,0 +1,89 @@
+"""配置加载模块
+
+配置来自 TOML 文件，路径由环境变量 DAILY_HOT_CONFIG 指定；未指定时依次查找
+当前目录下的 daily_hot_mcp.toml。没有配置文件时所有配置项都使用代码中的默认值。
+各模块只读取自己关心的段落，例如 [cache]、[http]。
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .logger import logger
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    try:
+        import tomli as tomllib
+    except ImportError:  # pragma: no cover - 仅在未安装 tomli 的 3.10 环境中出现
+        tomllib = None
+
+CONFIG_ENV = "DAILY_HOT_CONFIG"
+DEFAULT_CONFIG_FILE = "daily_hot_mcp.toml"
+
+_config: Optional[Dict[str, Any]] = None
+
+
+def _config_path() -> Optional[Path]:
+    path = os.environ.get(CONFIG_ENV)
+    if path:
+        return Path(path).expanduser()
+    default = Path.cwd() / DEFAULT_CONFIG_FILE
+    return default if default.exists() else None
+
+
+def load_config() -> Dict[str, Any]:
+    """读取配置文件，出错时记录日志并返回空配置"""
+    path = _config_path()
+    if path is None:
+        return {}
+    if tomllib is None:
+        logger.warning(f"未安装 tomli，无法读取配置文件 {path}")
+        return {}
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
+        logger.warning(f"配置文件不存在: {path}")
+    except Exception as e:
+        logger.error(f"读取配置文件 {path} 失败: {e}")
+    return {}
+
+
+def get_config() -> Dict[str, Any]:
+    """返回已加载的配置，首次调用时读取文件"""
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
+
+
+def reload_config() -> Dict[str, Any]:
+    """重新读取配置文件"""
+    global _config
+    _config = load_config()
+    return _config
+
+
+def get_section(*names: str) -> Dict[str, Any]:
+    """按路径读取配置段落，例如 get_section("cache", "tools")"""
+    section: Any = get_config()
+    for name in names:
+        if not isinstance(section, dict):
+            return {}
+        section = section.get(name, {})
+    return section if isinstance(section, dict) else {}
+
+
+def env_float(name: str, default: Optional[float] = None) -> Optional[float]:
+    """读取数值型环境变量，格式不合法时记录日志并返回默认值"""
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"环境变量 {name} 不是合法的数值: {value}")
+        return default
@@ -0,0 +1,164 @@
+"""工具调用的截止时间
+
+每次工具调用都带有一个截止时间（保存在 contextvar 中），调用链上的所有请求共享它：
+- http_client 每次发出请求前把超时缩短到剩余时间，剩余时间为 0 时直接抛出 DeadlineExceeded；
+- 重试的总时间预算不超过剩余时间；
+- 对冲请求和备用接口在同一个上下文中执行，同样受截止时间约束；
+- singleflight 合并的请求由多个调用方共享，使用其中最晚的截止时间（见 SharedDeadline），
+  各调用方只在自己的等待上套用自己的截止时间；
+- 截止时间到达时工具缓存层返回已有的缓存数据，没有缓存时抛出 DeadlineExceeded。
+
+截止时间按以下顺序确定：工具参数 timeout_ms、配置文件中该工具的设置、
+环境变量 DAILY_HOT_TOOL_TIMEOUT_MS、配置文件默认值、代码默认值：
+
+    [deadline]
+    timeout_ms = 20000
+
+    [deadline.tools."get-weibo-trending"]
+    timeout_ms = 8000
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Dict, Iterator, Optional, TypeVar
+
+from .config import env_float, get_section
+
+T = TypeVar("T")
+
+TIMEOUT_ENV = "DAILY_HOT_TOOL_TIMEOUT_MS"
+
+DEFAULT_TIMEOUT_MS = 20000
+
+# 代码内置的工具超时（毫秒），配置文件中的设置会覆盖它们
+DEFAULT_TOOL_TIMEOUTS: Dict[str, float] = {
+    # 爬取整站内容由第三方服务完成，耗时明显长于热榜接口
+    "crawl_website": 120000,
+}
+
+# 截止时间（time.monotonic() 的取值），None 表示没有截止时间
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "daily_hot_deadline", default=None
+)
+
+
+class SharedDeadline:
+    """多个调用方共享的请求的截止时间
+
+    取各调用方中最晚的截止时间，有调用方不限制时间时也不再限制。
+    请求开始后加入的调用方可以延长它。
+    """
+
+    __slots__ = ("deadline",)
+
+    def __init__(self, deadline: Optional[float]):
+        self.deadline = deadline
+
+    def extend(self, deadline: Optional[float]) -> None:
+        """加入一个截止时间为 deadline 的调用方"""
+        if self.deadline is not None:
+            self.deadline = None if deadline is None else max(self.deadline, deadline)
+
+
+# 设置时优先于 _deadline，由 shared_deadline() 设置
+_shared: contextvars.ContextVar[Optional[SharedDeadline]] = contextvars.ContextVar(
+    "daily_hot_shared_deadline", default=None
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """本次工具调用的时间预算已用完"""
+
+
+def tool_timeout(tool_name: str, timeout_ms: Optional[float] = None) -> Optional[float]:
+    """返回工具调用的时间预算（秒），0 或负数表示不限制"""
+    if timeout_ms is None:
+        tool_section = get_section("deadline", "tools", tool_name)
+        if "timeout_ms" in tool_section:
+            timeout_ms = tool_section["timeout_ms"]
+        elif tool_name in DEFAULT_TOOL_TIMEOUTS:
+            timeout_ms = DEFAULT_TOOL_TIMEOUTS[tool_name]
+        elif os.environ.get(TIMEOUT_ENV):
+            timeout_ms = env_float(TIMEOUT_ENV, DEFAULT_TIMEOUT_MS)
+        else:
+            timeout_ms = get_section("deadline").get("timeout_ms", DEFAULT_TIMEOUT_MS)
+    try:
+        timeout_ms = float(timeout_ms)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        timeout_ms = DEFAULT_TIMEOUT_MS
+    return timeout_ms / 1000 if timeout_ms > 0 else None
+
+
+def current() -> Optional[float]:
+    """当前上下文的截止时间（time.monotonic() 的取值），没有截止时间时返回 None"""
+    shared = _shared.get()
+    return shared.deadline if shared is not None else _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """距截止时间的剩余秒数，没有截止时间时返回 None"""
+    deadline = current()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check() -> Optional[float]:
+    """返回剩余秒数，截止时间已过时抛出 DeadlineExceeded"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("已超过本次调用的截止时间")
+    return left
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """在 with 块内设置截止时间；已有更早的截止时间或 seconds 为 None 时沿用外层的截止时间"""
+    deadline = current()
+    if seconds is not None:
+        candidate = time.monotonic() + seconds
+        deadline = candidate if deadline is None else min(deadline, candidate)
+    with _scoped(deadline, None):
+        yield
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """在 with 块内取消截止时间，用于不属于任何调用的后台任务"""
+    with _scoped(None, None):
+        yield
+
+
+@contextmanager
+def shared_deadline(shared: SharedDeadline) -> Iterator[None]:
+    """在 with 块内使用共享的截止时间，用于创建由多个调用方共享的任务"""
+    with _scoped(None, shared):
+        yield
+
+
+@contextmanager
+def _scoped(deadline: Optional[float], shared: Optional[SharedDeadline]) -> Iterator[None]:
+    token = _deadline.set(deadline)
+    shared_token = _shared.set(shared)
+    try:
+        yield
+    finally:
+        _shared.reset(shared_token)
+        _deadline.reset(token)
+
+
+async def within_deadline(awaitable: Awaitable[T]) -> T:
+    """等待 awaitable，超过截止时间时取消等待并抛出 DeadlineExceeded"""
+    left = remaining()
+    if left is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(0.0, left))
+    except asyncio.TimeoutError as e:
+        if isinstance(e, DeadlineExceeded):
+            raise
+        raise DeadlineExceeded("已超过本次调用的截止时间") from e
+
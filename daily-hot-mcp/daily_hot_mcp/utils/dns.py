@@ -0,0 +1,150 @@
+"""进程内 DNS 缓存
+
+httpx 每次新建连接都会重新解析域名。DNSCache 把解析结果按 TTL 缓存在进程内，
+CachingNetworkBackend 包装 httpcore 的网络后端：建立 TCP 连接前先查缓存，
+然后依次尝试解析出的地址。TLS 握手仍使用原始域名（SNI 和证书校验不受影响）。
+
+TTL 在配置文件的 [http] 段落设置，0 表示不缓存：
+
+    [http]
+    dns_cache_ttl = 300     # 秒
+"""
+
+import asyncio
+import ipaddress
+import socket
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from .logger import logger
+from .metrics import metrics
+
+DEFAULT_DNS_TTL = 300.0
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class DNSCache:
+    """按 (域名, 端口) 缓存解析结果"""
+
+    def __init__(self, ttl: float = DEFAULT_DNS_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        """返回域名对应的地址列表，缓存过期或不存在时重新解析"""
+        if _is_ip(host):
+            return [host]
+        key = (host.lower(), port)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[0] > now:
+            metrics.incr("dns.hits")
+            return cached[1]
+
+        metrics.incr("dns.misses")
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses: List[str] = []
+        for info in infos:
+            address = str(info[4][0])
+            if address not in addresses:
+                addresses.append(address)
+        with self._lock:
+            self._entries[key] = (now + self.ttl, addresses)
+        return addresses
+
+    def invalidate(self, host: str, port: int) -> None:
+        with self._lock:
+            self._entries.pop((host.lower(), port), None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """各域名缓存的地址和剩余有效期"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                f"{host}:{port}": {"addresses": addresses, "expires_in": round(expires - now, 1)}
+                for (host, port), (expires, addresses) in sorted(self._entries.items())
+                if expires > now
+            }
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """建立 TCP 连接时使用 DNSCache 解析域名的网络后端"""
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, dns: DNSCache):
+        self._backend = backend
+        self._dns = dns
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await asyncio.wait_for(self._dns.resolve(host, port), timeout)
+        except asyncio.TimeoutError as e:
+            raise httpcore.ConnectTimeout(f"解析 {host} 超时") from e
+        except OSError as e:
+            raise httpcore.ConnectError(f"解析 {host} 失败: {e}") from e
+
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+        # 缓存的地址都连不上时，下次重新解析
+        self._dns.invalidate(host, port)
+        if last_error is None:
+            raise httpcore.ConnectError(f"{host} 没有可用的地址")
+        raise last_error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def install_dns_cache(transports: Iterable[Any], dns: DNSCache) -> int:
+    """为 httpx 的 transport 装上 DNS 缓存，返回成功安装的数量
+
+    httpx 没有公开设置网络后端的参数，这里替换连接池的 _network_backend；
+    代理等其他类型的 transport 保持不变。
+    """
+    installed = 0
+    for transport in transports:
+        pool = getattr(transport, "_pool", None) if isinstance(transport, httpx.AsyncHTTPTransport) else None
+        if type(pool) is not httpcore.AsyncConnectionPool:
+            continue
+        backend = getattr(pool, "_network_backend", None)
+        if backend is None or isinstance(backend, CachingNetworkBackend):
+            continue
+        pool._network_backend = CachingNetworkBackend(backend, dns)
+        installed += 1
+    if not installed:
+        logger.warning("没有可安装 DNS 缓存的连接池")
+    return installed
@@ -0,0 +1,160 @@
+"""主备接口的对冲请求
+
+有备用接口的数据源原先先请求主接口，失败后才请求备用接口，最坏耗时是两者之和。
+hedged() 先发出主接口请求：
+- 主接口在对冲延迟内成功则直接返回；
+- 主接口在对冲延迟内失败（含熔断中）则立即请求备用接口；
+- 超过对冲延迟仍未返回时同时请求备用接口，取先成功的结果并取消另一个。
+
+对冲延迟默认取该数据源（hedged() 的 source）主接口最近耗时的 p90，各数据源的耗时
+分别统计，样本不足时使用 default_delay，并限制在 min_delay 和 max_delay 之间。可在配置文件中调整或按数据源固定：
+
+    [hedge]
+    default_delay = 2.0     # 秒
+    min_delay = 0.2
+    max_delay = 10
+    quantile = 0.9
+
+    [hedge.sources."kuaishou"]
+    delay = 1.5             # 固定延迟；enabled = false 表示按顺序请求，不对冲
+
+主接口和备用接口都应在拿不到有效数据时抛出异常（包括解析出的条目为空），两者都失败时
+hedged() 抛出备用接口的异常，由工具决定返回占位数据还是报错。
+
+两个接口在同一主机上时共用熔断器和限流额度，对冲只会让它们互相挤占，这类数据源
+（如微博热搜、B站排行榜、小红书热榜）应按顺序请求，不使用 hedged()。
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from .config import get_section
+from .logger import logger
+from .metrics import Histogram, metrics
+
+T = TypeVar("T")
+
+DEFAULT_HEDGE_CONFIG: Dict[str, float] = {
+    "default_delay": 2.0,
+    "min_delay": 0.2,
+    "max_delay": 10.0,
+    "quantile": 0.9,
+    "min_samples": 10,
+}
+
+PRIMARY_LATENCY_METRIC = "hedge.primary_seconds"
+
+# 各数据源主接口的耗时，按 hedged() 的 source 分别统计，对冲延迟只取本数据源的样本；
+# 同时上报到 metrics 的 hedge.primary_seconds 供诊断查看
+_primary_latency: Dict[str, Histogram] = {}
+_latency_lock = threading.Lock()
+
+
+def _latency(source: str) -> Histogram:
+    with _latency_lock:
+        histogram = _primary_latency.get(source)
+        if histogram is None:
+            histogram = _primary_latency[source] = Histogram()
+        return histogram
+
+
+def _source_config(source: str) -> Dict[str, Any]:
+    section = get_section("hedge")
+    config = {**DEFAULT_HEDGE_CONFIG, **{
+        k: v for k, v in section.items() if k in DEFAULT_HEDGE_CONFIG
+    }}
+    override = get_section("hedge", "sources", source)
+    return {**config, **override}
+
+
+def hedge_delay(source: str) -> float:
+    """数据源当前的对冲延迟（秒）"""
+    config = _source_config(source)
+    if "delay" in config:
+        return float(config["delay"])
+    delay = float(config["default_delay"])
+    histogram = _latency(source)
+    with _latency_lock:
+        if histogram.count >= config["min_samples"]:
+            delay = histogram.percentile(float(config["quantile"])) or delay
+    return min(float(config["max_delay"]), max(float(config["min_delay"]), delay))
+
+
+async def _cancel(*tasks: "asyncio.Future[Any]") -> None:
+    pending = [task for task in tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def hedged(
+    source: str,
+    primary: Callable[[], Awaitable[T]],
+    backup: Callable[[], Awaitable[T]],
+    delay: Optional[float] = None,
+) -> T:
+    """对冲请求主接口和备用接口，返回先成功的结果
+
+    Args:
+        source: 数据源名称，用于统计主接口耗时和读取配置
+        primary: 请求主接口的无参协程函数
+        backup: 请求备用接口的无参协程函数
+        delay: 对冲延迟（秒），不传时按配置和主接口耗时计算
+    """
+    if _source_config(source).get("enabled") is False:
+        try:
+            return await primary()
+        except Exception as e:
+            logger.info(f"{source} 主接口失败（{e}），使用备用接口")
+            return await backup()
+
+    async def run_primary() -> T:
+        start = time.monotonic()
+        result = await primary()
+        elapsed = time.monotonic() - start
+        histogram = _latency(source)
+        with _latency_lock:
+            histogram.observe(elapsed)
+        metrics.observe(PRIMARY_LATENCY_METRIC, elapsed, source=source)
+        return result
+
+    wait = hedge_delay(source) if delay is None else delay
+    primary_task = asyncio.ensure_future(run_primary())
+    backup_task: Optional["asyncio.Future[T]"] = None
+    try:
+        done, _ = await asyncio.wait({primary_task}, timeout=wait)
+        if done:
+            error = primary_task.exception()
+            if error is None:
+                return primary_task.result()
+            # 主接口很快失败，没有可对冲的请求，直接走备用接口
+            logger.info(f"{source} 主接口失败（{error}），使用备用接口")
+            metrics.incr("hedge.fallback", source=source)
+            try:
+                return await backup()
+            except Exception:
+                metrics.incr("hedge.failed", source=source)
+                raise
+
+        metrics.incr("hedge.fired", source=source)
+        logger.info(f"{source} 主接口 {wait:.2f} 秒未返回，同时请求备用接口")
+        backup_task = asyncio.ensure_future(backup())
+        pending = {primary_task, backup_task}
+        errors: Dict[Any, BaseException] = {}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # 两个请求同时完成时优先使用主接口的结果
+            for task in sorted(done, key=lambda t: t is not primary_task):
+                error = task.exception()
+                if error is None:
+                    winner = "primary" if task is primary_task else "backup"
+                    metrics.incr("hedge.won", source=source, winner=winner)
+                    return task.result()
+                errors[task] = error
+        metrics.incr("hedge.failed", source=source)
+        raise errors[backup_task]
+    finally:
+        await _cancel(primary_task, *(t for t in (backup_task,) if t is not None))
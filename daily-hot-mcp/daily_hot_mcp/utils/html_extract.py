@@ -0,0 +1,224 @@
+"""基于 lxml 的 HTML 提取
+
+各热榜工具原先用 BeautifulSoup + html.parser 解析页面，纯 Python 实现的解析和
+select/find_all 遍历在几百 KB 的页面上很慢，解析树也很占内存。这里提供一组基于
+lxml 的辅助函数，语义与工具中用到的 BeautifulSoup 接口保持一致，使提取结果不变：
+
+- parse_html()：按 BeautifulSoup 的规则识别编码（HTTP 头、BOM、meta 声明……）后用 lxml 解析；
+- xpath()：编译 XPath，工具在模块加载时编译好选择器，之后重复使用；
+- has_class() / class_contains()：生成与 class_="x"、class_=lambda 等价的 XPath 条件；
+- class_pattern() / iter_by_class()：与 class_contains() 条件相同，用预编译的正则匹配 class，
+  按文档顺序逐个返回元素，取够条目后即可停止，不必先取出全部候选元素；
+- get_text()：等价于 Tag.get_text()，不含 script、style 等标签中的文字和注释；
+- tag_string()：等价于 Tag.string；
+- iter_strings()：按文档顺序遍历所有文字节点（含注释），用于 find(string=...)。
+
+另有两个单次遍历的辅助函数，用于替代“多个选择器分别查询再拼接”的写法：
+
+- iter_links()：只遍历一次文档中的链接，结果与各链接规则分别查询后拼接、再去掉重复链接相同；
+- find_firsts()：只遍历一次元素的子孙，按优先级返回多组条件各自第一个匹配的元素。
+
+html.parser 和 lxml 对不规范 HTML 的纠错方式不同，换用本模块前应使用
+benchmarks/bench_html_extract.py 在各站点的页面上对比新旧结果。
+"""
+
+import re
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+from bs4 import UnicodeDammit
+from lxml import etree, html as lxml_html
+
+# BeautifulSoup 把这些标签中的文字存为特殊的字符串类型，get_text() 默认不包含它们
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+_PARSER = lxml_html.HTMLParser(encoding="utf-8", huge_tree=True)
+
+Element = lxml_html.HtmlElement
+
+
+def parse_html(html: bytes, encoding: Optional[str] = None) -> Element:
+    """解析 HTML 页面，encoding 为 HTTP 头中声明的编码"""
+    dammit = UnicodeDammit(html, known_definite_encodings=[encoding] if encoding else [], is_html=True)
+    markup = dammit.unicode_markup
+    if markup is None:
+        markup = html.decode("utf-8", errors="replace")
+    if not markup.strip():
+        # lxml 不接受空文档，BeautifulSoup 会得到一棵空树
+        return lxml_html.Element("html")
+    return etree.fromstring(markup.encode("utf-8"), _PARSER)
+
+
+def xpath(expr: str) -> etree.XPath:
+    """编译 XPath 表达式"""
+    return etree.XPath(expr)
+
+
+def has_class(name: str) -> str:
+    """class 属性中含有 name 这个类名，等价于 class_=name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def class_contains(*keywords: str) -> str:
+    """class 属性（忽略大小写）包含任一关键字，等价于 class_=lambda x: x and any(k in x.lower() ...)"""
+    lowered = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    return "(" + " or ".join(f"contains({lowered}, '{k}')" for k in keywords) + ")"
+
+
+def class_pattern(*keywords: str) -> Pattern[str]:
+    """class 属性（忽略大小写）包含任一关键字，与 class_contains() 条件相同的正则"""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+def iter_by_class(el: Element, tags: Sequence[str], pattern: Pattern[str]) -> Iterator[Element]:
+    """按文档顺序返回 el 及其子孙中标签为 tags 之一、class 属性匹配 pattern 的元素
+
+    等价于 //*[self::tag1 or ...][class_contains(...)]，但逐个返回：标签在 lxml 内部过滤，
+    只对带 class 属性的元素执行一次正则，不再为每个元素转换大小写。
+    """
+    for node in el.iter(*tags):
+        class_name = node.get("class")
+        if class_name and pattern.search(class_name):
+            yield node
+
+
+def first(el: Element, *selectors: etree.XPath) -> Optional[Element]:
+    """依次尝试各选择器，返回第一个匹配的元素
+
+    等价于 Tag.find() 以及 a.find(...) or a.find(...) 这样的写法。lxml 的元素没有子元素时
+    布尔值为假，判断是否找到时应与 None 比较。
+    """
+    for selector in selectors:
+        found = selector(el)
+        if found:
+            return found[0]
+    return None
+
+
+def _text_parts(el: Element, parts: List[str], skip: bool) -> None:
+    skip = skip or el.tag in _NON_TEXT_TAGS
+    if el.text and not skip:
+        parts.append(el.text)
+    for child in el:
+        if isinstance(child.tag, str):
+            _text_parts(child, parts, skip)
+        if child.tail and not skip:
+            parts.append(child.tail)
+
+
+def get_text(el: Element, strip: bool = False) -> str:
+    """元素内的文字，等价于 Tag.get_text() 和 Tag.get_text(strip=True)"""
+    parts: List[str] = []
+    _text_parts(el, parts, False)
+    if strip:
+        return "".join(part.strip() for part in parts if part.strip())
+    return "".join(parts)
+
+
+def iter_strings(el: Element) -> Iterator[str]:
+    """按文档顺序遍历元素内的所有文字节点，包括注释和 script 中的文字"""
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str):
+            yield from iter_strings(child)
+        elif child.tag is etree.Comment and child.text:
+            yield child.text
+        if child.tail:
+            yield child.tail
+
+
+def tag_string(el: Element) -> Optional[str]:
+    """元素只有一个子节点时返回其中的文字，等价于 Tag.string"""
+    while True:
+        children = list(el)
+        nodes = len(children) + sum(1 for child in children if child.tail) + (1 if el.text else 0)
+        if nodes != 1:
+            return None
+        if el.text:
+            return el.text
+        child = children[0]
+        if not isinstance(child.tag, str):
+            return child.text if child.tag is etree.Comment else None
+        el = child
+
+
+# 链接规则：("list", 类名) 等价于 CSS 选择器 ".类名 li a"，("within", 类名) 等价于 ".类名 a"，
+# ("href", 子串) 等价于 'a[href*="子串"]'
+LinkRule = Tuple[str, str]
+
+Matcher = Callable[[Element], bool]
+
+
+def iter_links(root: Element, rules: Sequence[LinkRule]) -> Iterator[Element]:
+    """按规则顺序返回匹配的链接，同一规则内按文档顺序，每个链接只返回一次
+
+    结果与依次用各规则查询整个文档、拼接后去掉重复链接相同：每个链接归入它匹配的第一条
+    规则。只按文档顺序遍历一次链接，由链接的 href 和祖先元素的类名确定它所属的规则。
+    第一条规则的链接遍历到即返回，调用方取够条目后停止迭代即不再遍历文档的其余部分；
+    其他规则的链接要等遍历完整个文档才能确定顺序，届时按规则依次返回。
+    """
+    href_rules = [(index, value) for index, (kind, value) in enumerate(rules) if kind == "href"]
+    class_rules = [(index, kind, value) for index, (kind, value) in enumerate(rules) if kind != "href"]
+    class_names = {value for _, _, value in class_rules}
+    buckets: Dict[int, List[Element]] = {}
+    for link in root.iter("a"):
+        rule = len(rules)
+        href = link.get("href")
+        if href is not None:
+            for index, value in href_rules:
+                if value in href:
+                    rule = index
+                    break
+        if class_rules and rule:
+            in_li = False
+            for ancestor in link.iterancestors():
+                classes = ancestor.get("class")
+                if classes and not class_names.isdisjoint(tokens := classes.split()):
+                    for index, kind, value in class_rules:
+                        if index >= rule:
+                            break
+                        # list 规则要求链接位于容器内的 li 中
+                        if value in tokens and (kind != "list" or in_li):
+                            rule = index
+                            break
+                if ancestor is root or not rule:
+                    break
+                if ancestor.tag == "li":
+                    in_li = True
+        if rule == 0:
+            yield link
+        elif rule < len(rules):
+            buckets.setdefault(rule, []).append(link)
+    for rule in sorted(buckets):
+        yield from buckets[rule]
+
+
+def match(tag: str, class_name: Optional[str] = None) -> Matcher:
+    """匹配标签名和类名的条件，等价于 find(tag, class_=class_name)"""
+    if class_name is None:
+        return lambda el: el.tag == tag
+    return lambda el: el.tag == tag and class_name in (el.get("class") or "").split()
+
+
+def find_firsts(el: Element, groups: Sequence[Sequence[Matcher]]) -> List[Optional[Element]]:
+    """只遍历一次 el 的子孙，对每组条件返回按优先级第一个匹配的元素
+
+    每组条件等价于 el.find(条件1) or el.find(条件2) or ...；各组的第一个条件都已匹配时提前结束遍历。
+    """
+    found: List[List[Optional[Element]]] = [[None] * len(group) for group in groups]
+    pending = len(groups)
+    for node in el.iterdescendants():
+        if not isinstance(node.tag, str):
+            continue
+        for group, matches in zip(groups, found):
+            if matches[0] is not None:
+                continue
+            for i, matcher in enumerate(group):
+                if matches[i] is None and matcher(node):
+                    matches[i] = node
+                    if i == 0:
+                        pending -= 1
+                    break
+        if not pending:
+            break
+    return [next((m for m in matches if m is not None), None) for matches in found]
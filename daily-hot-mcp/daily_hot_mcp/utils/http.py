@@ -1,57 +1,426 @@
-"""HTTP客户端模块"""
+"""HTTP客户端模块
 
+连接池和 HTTP/2 通过配置文件的 [http] 段落设置，可按域名单独覆盖：
+
+    [http]
+    timeout = 30                  # 秒
+    max_connections = 100
+    max_keepalive_connections = 20
+    keepalive_expiry = 5          # 空闲连接保留时长（秒）
+    http2 = false
+    dns_cache_ttl = 300           # 进程内 DNS 缓存时长（秒），0 表示不缓存，见 dns.py
+
+    [http.hosts."m.weibo.cn"]
+    http2 = true
+    max_keepalive_connections = 10
+    keepalive_expiry = 60
+
+HTTP/2 需要安装可选依赖 `pip install daily_hot_mcp[http2]`，未安装时退回 HTTP/1.1。
+同一段落中的 rate/burst 用于按域名限流，见 ratelimit.py；retry 用于按域名启用重试，
+见 retry.py；breaker 用于调整熔断参数，见 breaker.py。
+
+请求的超时不会超过本次工具调用剩余的时间，见 deadline.py。
+
+AsyncClient 在第一次请求时于当前事件循环中创建，每个事件循环、每个进程各有一个：
+用 asyncio.run 运行的测试脚本每次都会得到新的客户端，fork 出的工作进程也不会复用
+父进程的连接。服务关闭时由 lifespan 调用 close() 关闭当前事件循环的客户端。
+
+get_conditional() 发送条件请求：把上次响应的 ETag / Last-Modified 和解析结果一起保存在
+缓存中，下次请求带上 If-None-Match / If-Modified-Since，上游返回 304 时直接复用上次
+的解析结果，不再下载和解析。stream=True 时响应体不预先读取，由解析函数边下载边解析，
+可以在取够数据后提前结束（见 rss.py）。
+"""
+
+import asyncio
+import functools
 import httpx
-from typing import Any, Dict, Optional
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+from . import deadline
+from .breaker import BreakerRegistry
+from .cache import cache
+from .config import get_section
+from .dns import DNSCache, install_dns_cache
+from .logger import logger
+from .metrics import metrics
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - 可选依赖
+    HTTP2_AVAILABLE = False
+
+DEFAULT_HTTP_CONFIG: Dict[str, Any] = {
+    "timeout": 30.0,
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 5.0,
+    "http2": False,
+    "dns_cache_ttl": 300.0,
+}
+
+# retry 参数：None 表示按域名配置，True 表示启用（使用域名或默认策略），False 表示禁用
+RetryOption = Union[bool, RetryPolicy, None]
+
+_POOL_FIELDS = ("max_connections", "max_keepalive_connections", "keepalive_expiry", "http2")
+
+# 条件请求的校验信息和解析结果在缓存中保留的时长（秒）；过期后仍会在清理前用于条件请求
+CONDITIONAL_TTL = 24 * 3600
+CONDITIONAL_STALE_TTL = 6 * 24 * 3600
+
+
+def _parse_name(parse: Callable[..., Any]) -> str:
+    """解析函数在缓存键中的名称，functools.partial 带上绑定的参数"""
+    if isinstance(parse, functools.partial):
+        args = [repr(arg) for arg in parse.args]
+        args += [f"{k}={v!r}" for k, v in sorted(parse.keywords.items())]
+        return f"{_parse_name(parse.func)}({', '.join(args)})"
+    return f"{parse.__module__}.{parse.__qualname__}"
+
+
+def _limits(config: Dict[str, Any]) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config["max_connections"],
+        max_keepalive_connections=config["max_keepalive_connections"],
+        keepalive_expiry=config["keepalive_expiry"],
+    )
+
+
+def _http2(config: Dict[str, Any], host: str) -> bool:
+    if config["http2"] and not HTTP2_AVAILABLE:
+        logger.warning(f"{host} 配置了 HTTP/2，但未安装 h2，使用 HTTP/1.1")
+        return False
+    return bool(config["http2"])
 
 
 class HttpClient:
-    """HTTP客户端封装"""
-    
-    def __init__(self):
-        self._client = httpx.AsyncClient(
+    """HTTP客户端封装
+
+    同一事件循环中的所有请求共用一个 AsyncClient；为单独配置过连接池或 HTTP/2 的域名
+    挂载独立的 transport，其他域名使用默认连接池。熔断器、限流和 DNS 缓存在各事件循环
+    之间共享。
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = get_section("http")
+        self._config = {**DEFAULT_HTTP_CONFIG, **{
+            k: v for k, v in config.items() if k in DEFAULT_HTTP_CONFIG
+        }}
+        self._host_configs: Dict[str, Dict[str, Any]] = {}
+        host_sections: Dict[str, Dict[str, Any]] = {}
+        self._pool_configs: Dict[str, Dict[str, Any]] = {}
+        for host, section in config.get("hosts", {}).items():
+            if not isinstance(section, dict):
+                continue
+            host = host.lower()
+            host_sections[host] = section
+            host_config = self._host_configs[host] = {**self._config, **section}
+            if any(field in section for field in _POOL_FIELDS):
+                self._pool_configs[host] = host_config
+
+        self.dns = DNSCache(ttl=float(self._config["dns_cache_ttl"]))
+        # 事件循环 -> AsyncClient
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._pid = os.getpid()
+        self._clients_lock = threading.Lock()
+        self._limiter = RateLimiter(default=config, hosts=host_sections)
+
+        breaker_section = config.get("breaker")
+        self.breakers = BreakerRegistry(
+            default=breaker_section if isinstance(breaker_section, dict) else {},
+            hosts={h: s["breaker"] for h, s in host_sections.items() if "breaker" in s},
+        )
+
+        self._conditional_stats: Dict[str, Dict[str, int]] = {}
+        self._conditional_lock = threading.Lock()
+
+        retry_section = config.get("retry")
+        self._default_retry = RetryPolicy.from_config(
+            retry_section if isinstance(retry_section, dict) else {}
+        )
+        self._host_retry: Dict[str, RetryPolicy] = {}
+        for host, section in host_sections.items():
+            retry = section.get("retry")
+            if isinstance(retry, dict):
+                self._host_retry[host] = RetryPolicy.from_config(retry, self._default_retry)
+            elif retry:
+                self._host_retry[host] = self._default_retry
+
+    def _build_client(self) -> httpx.AsyncClient:
+        mounts = {
+            f"all://{host}": httpx.AsyncHTTPTransport(
+                limits=_limits(host_config), http2=_http2(host_config, host)
+            )
+            for host, host_config in self._pool_configs.items()
+        }
+        default_transport = httpx.AsyncHTTPTransport(
+            limits=_limits(self._config), http2=_http2(self._config, "默认连接池")
+        )
+        if self.dns.ttl > 0:
+            install_dns_cache([default_transport, *mounts.values()], self.dns)
+        return httpx.AsyncClient(
             headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
             },
-            timeout=30.0,
+            timeout=self._config["timeout"],
+            transport=default_transport,
+            mounts=mounts or None,
             follow_redirects=True,
         )
-    
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """当前事件循环的 AsyncClient，首次使用时创建；必须在事件循环中访问"""
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            if self._pid != os.getpid():
+                # fork 出的子进程不能使用父进程的连接，也不能关闭它们
+                self._clients = {}
+                self._pid = os.getpid()
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                # 丢弃已关闭的事件循环（如 asyncio.run 结束后）留下的客户端
+                for dead in [l for l in self._clients if l.is_closed()]:
+                    del self._clients[dead]
+                client = self._clients[loop] = self._build_client()
+                metrics.incr("http.clients_created")
+        return client
+
+    def host_config(self, url: str) -> Dict[str, Any]:
+        """返回某个 URL 所属域名生效的配置"""
+        host = (urlsplit(url).hostname or "").lower()
+        return self._host_configs.get(host, self._config)
+
+    def _apply_host_timeout(self, url: str, kwargs: Dict[str, Any]) -> None:
+        """域名单独配置了 timeout 且调用方未指定时，使用该域名的超时"""
+        if "timeout" in kwargs:
+            return
+        host_config = self.host_config(url)
+        if host_config is not self._config and "timeout" in host_config:
+            kwargs["timeout"] = host_config["timeout"]
+
+    def _timeout_seconds(self, kwargs: Dict[str, Any]) -> float:
+        timeout = kwargs.get("timeout", self._config["timeout"])
+        if isinstance(timeout, httpx.Timeout):
+            timeout = timeout.read
+        return float(timeout) if timeout is not None else float(self._config["timeout"])
+
+    def _retry_policy(self, host: str, retry: RetryOption) -> Optional[RetryPolicy]:
+        if isinstance(retry, RetryPolicy):
+            return retry
+        if retry is False:
+            return None
+        if retry is True:
+            return self._host_retry.get(host, self._default_retry)
+        return self._host_retry.get(host)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        retry: RetryOption = None,
+        stream: bool = False,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """发送请求；每次尝试都经过熔断器和限流，按 retry 决定是否重试
+
+        域名熔断中时直接抛出 CircuitOpenError，不会访问上游，也不会重试。
+        每次尝试的超时缩短到本次工具调用的剩余时间，时间用完时抛出 DeadlineExceeded。
+        stream=True 时收到响应头即返回，调用方读取响应体后需要调用 aclose()。
+        """
+        self._apply_host_timeout(url, kwargs)
+        host = (urlsplit(url).hostname or "").lower()
+        breaker = self.breakers.get(host)
+
+        async def send() -> httpx.Response:
+            deadline.check()
+            if breaker is not None:
+                breaker.before_call()
+            reported = False
+            try:
+                await self._limiter.acquire(host)
+                request_kwargs = kwargs
+                timeout = self._timeout_seconds(kwargs)
+                left = deadline.check()
+                clamped = left is not None and left < timeout
+                if clamped:
+                    request_kwargs = {**kwargs, "timeout": left}
+                try:
+                    if stream:
+                        response = await self._send_stream(method, url, request_kwargs)
+                    else:
+                        response = await self.client.request(method, url, **request_kwargs)
+                except httpx.TransportError as e:
+                    if clamped and isinstance(e, httpx.TimeoutException):
+                        # 超时是因为调用的时间预算用完，不是上游的问题，不计入熔断
+                        raise deadline.DeadlineExceeded(f"{host} 请求超过本次调用的截止时间") from e
+                    if breaker is not None:
+                        breaker.record_failure()
+                        reported = True
+                    raise
+                if breaker is not None:
+                    if breaker.is_failure_status(response.status_code):
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                    reported = True
+                return response
+            finally:
+                if breaker is not None and not reported:
+                    # 截止时间用完、被取消等情况下没有结果可回报，归还半开状态的试探名额
+                    breaker.release()
+
+        policy = self._retry_policy(host, retry)
+        if policy is None:
+            return await send()
+        return await policy.execute(send, method=method, host=host)
+
+    async def _send_stream(self, method: str, url: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """发送请求但不读取响应体；auth、follow_redirects 是 send() 的参数，其余交给 build_request()"""
+        kwargs = dict(kwargs)
+        send_kwargs = {k: kwargs.pop(k) for k in ("auth", "follow_redirects") if k in kwargs}
+        request = self.client.build_request(method, url, **kwargs)
+        return await self.client.send(request, stream=True, **send_kwargs)
+
     async def get(
-        self, 
-        url: str, 
+        self,
+        url: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        retry: RetryOption = None,
+        stream: bool = False,
         **kwargs: Any
     ) -> httpx.Response:
         """发送GET请求"""
-        return await self._client.get(
-            url, 
-            params=params, 
+        return await self.request(
+            "GET",
+            url,
+            retry=retry,
+            stream=stream,
+            params=params,
             headers=headers,
             **kwargs
         )
-    
+
     async def post(
         self,
         url: str,
         data: Optional[Any] = None,
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        retry: RetryOption = None,
         **kwargs: Any
     ) -> httpx.Response:
-        """发送POST请求"""
-        return await self._client.post(
+        """发送POST请求（POST 不是幂等方法，默认策略下不会重试）"""
+        return await self.request(
+            "POST",
             url,
+            retry=retry,
             data=data,
             json=json,
             headers=headers,
             **kwargs
         )
-    
-    async def close(self):
-        """关闭客户端"""
-        await self._client.aclose()
+
+    async def get_conditional(
+        self,
+        url: str,
+        parse: Callable[[httpx.Response], Any],
+        name: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: RetryOption = None,
+        stream: bool = False,
+        **kwargs: Any
+    ) -> Any:
+        """发送条件 GET 请求，返回 parse(response) 的结果
+
+        上游返回 304 时直接返回上次保存的解析结果；响应带有 ETag 或 Last-Modified 时
+        保存解析结果供下次使用。parse 的结果需要能被缓存序列化。
+
+        Args:
+            url: 请求地址
+            parse: 把响应解析为最终结果的函数
+            name: 统计命中率时使用的名称，默认为完整 URL
+            stream: 为 True 时不预先读取响应体，parse 为协程函数，自行读取响应体，
+                返回后响应随即关闭
+        """
+        full_url = str(httpx.URL(url, params=params)) if params else url
+        name = name or full_url
+        # 同一地址可能以不同方式解析，缓存键包含解析函数及其绑定的参数
+        key = f"http:conditional:{_parse_name(parse)}:{full_url}"
+        entry = await cache.aget_entry(key)
+        stored = entry.data if entry is not None and isinstance(entry.data, dict) else None
+
+        request_headers = dict(headers or {})
+        if stored is not None:
+            if stored.get("etag"):
+                request_headers["If-None-Match"] = stored["etag"]
+            if stored.get("last_modified"):
+                request_headers["If-Modified-Since"] = stored["last_modified"]
+
+        response = await self.get(
+            url, params=params, headers=request_headers, retry=retry, stream=stream, **kwargs
+        )
+        try:
+            not_modified = response.status_code == 304 and stored is not None
+            self._record_conditional(name, not_modified)
+            if not_modified:
+                return stored["data"]  # type: ignore[index]
+
+            response.raise_for_status()
+            data = await parse(response) if stream else parse(response)
+        finally:
+            if stream:
+                await response.aclose()
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if any(validators.values()):
+            await cache.aset(
+                key, {**validators, "data": data}, ttl=CONDITIONAL_TTL, stale_ttl=CONDITIONAL_STALE_TTL
+            )
+        return data
+
+    def _record_conditional(self, name: str, not_modified: bool) -> None:
+        metrics.incr("http.conditional.requests", source=name)
+        if not_modified:
+            metrics.incr("http.conditional.not_modified", source=name)
+        with self._conditional_lock:
+            stats = self._conditional_stats.setdefault(name, {"requests": 0, "not_modified": 0})
+            stats["requests"] += 1
+            stats["not_modified"] += int(not_modified)
+
+    def conditional_stats(self) -> Dict[str, Dict[str, Any]]:
+        """各数据源条件请求的次数和 304 命中率"""
+        with self._conditional_lock:
+            return {
+                name: {**stats, "hit_rate": round(stats["not_modified"] / stats["requests"], 3)}
+                for name, stats in sorted(self._conditional_stats.items())
+            }
+
+    async def warm(self, url: str, timeout: float = 5.0) -> httpx.Response:
+        """预热到 url 所在域名的连接：完成 DNS 解析、TCP 和 TLS 握手并放回连接池
+
+        预热请求不经过熔断器和限流，也不计入它们的统计。
+        """
+        return await self.client.request("HEAD", url, timeout=timeout, follow_redirects=False)
+
+    async def close(self) -> None:
+        """关闭当前事件循环的客户端，之后的请求会重新创建客户端"""
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._clients.pop(loop, None) if self._pid == os.getpid() else None
+        if client is not None:
+            await client.aclose()
 
 
 # 全局HTTP客户端实例
-http_client = HttpClient() 
\ No newline at end of file
+http_client = HttpClient()
@@ -0,0 +1,115 @@
+"""在事件循环之外解析 HTML
+
+百度、IT之家、汽车之家、虎扑、搜狗等工具要解析几百 KB 的页面，每次都要耗费一段
+CPU 时间。直接在工具函数中解析会阻塞事件循环，期间其他 MCP 请求都要等待。
+这些工具把解析写成纯函数（页面字节进、条目列表出），通过 parse_pool.run() 交给线程池执行：
+
+- 默认使用线程池；
+- 标记为 heavy 的页面在配置了进程池时交给进程池，解析不再与事件循环争抢 GIL；
+- 每个数据源的解析耗时记录在 parse.seconds{source=...} 指标中。
+
+交给进程池的解析函数必须定义在模块顶层，参数和返回值必须能被 pickle。
+池的大小在配置文件的 [parse] 段落设置：
+
+    [parse]
+    threads = 4             # 线程池大小
+    processes = 2           # 进程池大小，0 表示不使用进程池
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from .config import get_section
+from .logger import logger
+from .metrics import metrics
+
+T = TypeVar("T")
+
+DEFAULT_PARSE_CONFIG: Dict[str, int] = {
+    "threads": min(4, os.cpu_count() or 1),
+    "processes": 0,
+}
+
+
+def _timed(fn: Callable[..., T], *args: Any) -> Tuple[T, float]:
+    """在工作线程或进程中执行解析并计时，不包含排队时间"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+class ParsePool:
+    """解析用的线程池和进程池，首次使用时创建"""
+
+    def __init__(self, threads: int = 4, processes: int = 0):
+        self.threads = max(1, int(threads))
+        self.processes = max(0, int(processes))
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "ParsePool":
+        section = get_section("parse")
+        config = {**DEFAULT_PARSE_CONFIG, **{
+            k: v for k, v in section.items() if k in DEFAULT_PARSE_CONFIG
+        }}
+        return cls(**config)
+
+    def _executor(self, heavy: bool) -> Tuple[Executor, str]:
+        with self._lock:
+            if heavy and self.processes:
+                if self._process_pool is None:
+                    # fork 会复制事件循环和连接等状态，子进程用 spawn 启动
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                return self._process_pool, "process"
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.threads, thread_name_prefix="daily-hot-parse"
+                )
+            return self._thread_pool, "thread"
+
+    async def run(self, source: str, fn: Callable[..., T], *args: Any, heavy: bool = False) -> T:
+        """在池中执行 fn(*args) 并返回结果
+
+        Args:
+            source: 数据源名称，用于记录解析耗时
+            fn: 解析函数
+            heavy: 是否为较重的页面，配置了进程池时交给进程池
+        """
+        executor, kind = self._executor(heavy)
+        loop = asyncio.get_running_loop()
+        try:
+            result, elapsed = await loop.run_in_executor(executor, _timed, fn, *args)
+        except BrokenProcessPool as e:
+            # 工作进程异常退出后进程池不可再用，之后的解析都改用线程池
+            logger.warning(f"解析进程池不可用，改用线程池: {e}")
+            with self._lock:
+                self.processes = 0
+                self._process_pool = None
+            executor, kind = self._executor(False)
+            result, elapsed = await loop.run_in_executor(executor, _timed, fn, *args)
+        metrics.observe("parse.seconds", elapsed, source=source, pool=kind)
+        return result
+
+    def shutdown(self) -> None:
+        """关闭线程池和进程池，不等待正在执行的解析；之后的调用会重新创建"""
+        with self._lock:
+            pools = [p for p in (self._thread_pool, self._process_pool) if p is not None]
+            self._thread_pool = None
+            self._process_pool = None
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# 全局实例
+parse_pool = ParsePool.from_config()
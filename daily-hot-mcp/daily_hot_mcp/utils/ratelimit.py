@@ -0,0 +1,138 @@
+"""按域名的令牌桶限流
+
+每个域名一个令牌桶：桶容量（burst）内的请求立即发出，超出后按 rate（每秒请求数）
+匀速放行。低负载时请求不会有任何额外等待，只有短时间内请求过多才会排队。
+
+限流参数在配置文件中按域名设置，未配置的域名使用 [http] 段落的默认值，
+默认值也未设置时不限流：
+
+    [http]
+    rate = 10        # 每秒请求数
+    burst = 20
+
+    [http.hosts."m.weibo.cn"]
+    rate = 1
+    burst = 5
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from . import deadline
+from .logger import logger
+from .metrics import metrics
+
+# 代码内置的限流参数，配置文件中的设置会覆盖它们
+DEFAULT_HOST_LIMITS: Dict[str, Dict[str, float]] = {
+    # 微博移动端接口对频繁请求较敏感
+    "m.weibo.cn": {"rate": 1.0, "burst": 5},
+}
+
+
+class TokenBucket:
+    """令牌桶
+
+    令牌数可以为负，表示已经有请求预约了尚未生成的令牌；每个请求按预约顺序等待，
+    因此排队是先到先得的。
+    """
+
+    def __init__(self, rate: float, burst: float):
+        if rate <= 0:
+            raise ValueError("rate 必须大于 0")
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """取走一个令牌，返回需要等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self) -> None:
+        """归还一个预约了但没有使用的令牌"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    async def acquire(self) -> float:
+        """等待直到可以发出请求，返回实际等待的秒数
+
+        需要等待的时间超过本次调用剩余的时间时不再排队，归还令牌并抛出 DeadlineExceeded；
+        等待中被取消时同样归还令牌，不占用后面请求的额度。
+        """
+        wait = self.reserve()
+        if wait > 0:
+            left = deadline.remaining()
+            if left is not None and wait > left:
+                self.refund()
+                raise deadline.DeadlineExceeded(f"限流需要等待 {wait:.2f} 秒，超过本次调用的截止时间")
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+        return wait
+
+
+class RateLimiter:
+    """按域名管理令牌桶"""
+
+    def __init__(
+        self,
+        default: Optional[Dict[str, Any]] = None,
+        hosts: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self._default = self._bucket_args(default or {}, "默认")
+        self._host_args: Dict[str, Optional[Dict[str, float]]] = {}
+        for host, section in {**DEFAULT_HOST_LIMITS, **(hosts or {})}.items():
+            if "rate" in section:
+                self._host_args[host.lower()] = self._bucket_args(section, host)
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bucket_args(section: Dict[str, Any], name: str) -> Optional[Dict[str, float]]:
+        rate = section.get("rate")
+        if rate is None or rate == 0:
+            return None
+        try:
+            rate = float(rate)
+            burst = float(section.get("burst", max(1.0, rate)))
+        except (TypeError, ValueError):
+            logger.warning(f"{name} 的限流配置不是合法的数值: {section}")
+            return None
+        if rate < 0:
+            return None
+        return {"rate": rate, "burst": burst}
+
+    def bucket(self, host: str) -> Optional[TokenBucket]:
+        """返回域名对应的令牌桶，不限流时返回 None"""
+        host = host.lower()
+        with self._lock:
+            if host not in self._buckets:
+                args = self._host_args.get(host, self._default)
+                self._buckets[host] = TokenBucket(**args) if args else None
+            return self._buckets[host]
+
+    async def acquire(self, host: str) -> None:
+        """请求发出前调用，预算用尽时等待"""
+        bucket = self.bucket(host)
+        if bucket is None:
+            return
+        try:
+            wait = await bucket.acquire()
+        except deadline.DeadlineExceeded:
+            metrics.incr("ratelimit.rejected", host=host)
+            raise
+        if wait > 0:
+            metrics.incr("ratelimit.delayed", host=host)
+            metrics.observe("ratelimit.wait_seconds", wait, host=host)
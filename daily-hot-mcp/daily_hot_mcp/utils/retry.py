@@ -0,0 +1,168 @@
+"""HTTP 请求重试策略
+
+RetryPolicy 描述一类请求如何重试：
+- 只重试幂等方法（默认 GET/HEAD/OPTIONS）；
+- 遇到网络错误、超时或可重试的状态码（默认 429/500/502/503/504）时重试；
+- 两次尝试之间按指数退避等待，并使用 full jitter（在 0 到退避上限之间随机取值），
+  避免大量请求同时重试；
+- 响应带 Retry-After 时至少等待其指定的时长；
+- 所有尝试（含等待）不超过总时间预算，也不超过本次工具调用的剩余时间，
+  预算不足以再等一次时直接返回最后的结果。
+
+工具可以按次启用（http_client.get(..., retry=True) 或传入自定义 RetryPolicy），
+也可以在配置文件中按域名启用：
+
+    [http.retry]                  # retry=True 及按域名启用时的默认参数
+    max_attempts = 3
+    backoff_base = 0.5
+    backoff_max = 8
+    total_budget = 20
+
+    [http.hosts."www.zhihu.com"]
+    retry = true                  # 或 retry = { max_attempts = 5 }
+
+重试次数按域名计入 metrics（http.retries、http.retry_exhausted）。
+"""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional
+
+import httpx
+
+from . import deadline as call_deadline
+from .logger import logger
+from .metrics import metrics
+
+RETRYABLE_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 头，支持秒数和 HTTP 日期两种格式"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """重试策略，时长单位均为秒"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        total_budget: float = 20.0,
+        retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES,
+        methods: FrozenSet[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+    ):
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.total_budget = total_budget
+        self.retry_statuses = frozenset(retry_statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.respect_retry_after = respect_retry_after
+
+    @classmethod
+    def from_config(cls, section: Dict[str, Any], base: Optional["RetryPolicy"] = None) -> "RetryPolicy":
+        """用配置段落中的字段覆盖 base（默认参数）生成新策略"""
+        base = base or cls()
+        return cls(
+            max_attempts=section.get("max_attempts", base.max_attempts),
+            backoff_base=section.get("backoff_base", base.backoff_base),
+            backoff_max=section.get("backoff_max", base.backoff_max),
+            total_budget=section.get("total_budget", base.total_budget),
+            retry_statuses=frozenset(section.get("retry_statuses", base.retry_statuses)),
+            methods=frozenset(section.get("methods", base.methods)),
+            respect_retry_after=section.get("respect_retry_after", base.respect_retry_after),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, backoff_base={self.backoff_base}, "
+            f"backoff_max={self.backoff_max}, total_budget={self.total_budget})"
+        )
+
+    def backoff(self, retry_number: int) -> float:
+        """第 retry_number 次重试（从 0 开始）前的等待时长，full jitter"""
+        cap = min(self.backoff_max, self.backoff_base * (2 ** retry_number))
+        return random.uniform(0, cap)
+
+    def should_retry_response(self, response: httpx.Response) -> bool:
+        return response.status_code in self.retry_statuses
+
+    @staticmethod
+    def should_retry_exception(error: BaseException) -> bool:
+        # TransportError 包含连接失败、超时和协议错误
+        return isinstance(error, httpx.TransportError)
+
+    async def execute(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        method: str = "GET",
+        host: str = "",
+    ) -> httpx.Response:
+        """按策略执行 send，返回最后一次的响应或抛出最后一次的异常"""
+        if method.upper() not in self.methods:
+            return await send()
+
+        budget = self.total_budget
+        left = call_deadline.remaining()
+        if left is not None:
+            budget = min(budget, left)
+        deadline = time.monotonic() + budget
+        for attempt in range(self.max_attempts):
+            last_attempt = attempt == self.max_attempts - 1
+            retry_after: Optional[float] = None
+            try:
+                response = await send()
+            except Exception as e:
+                if not self.should_retry_exception(e):
+                    raise
+                if last_attempt:
+                    metrics.incr("http.retry_exhausted", host=host)
+                    raise
+                reason: Any = type(e).__name__
+                result: Optional[httpx.Response] = None
+                error: Optional[BaseException] = e
+            else:
+                if not self.should_retry_response(response):
+                    return response
+                if last_attempt:
+                    metrics.incr("http.retry_exhausted", host=host)
+                    return response
+                if self.respect_retry_after:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                reason = response.status_code
+                result, error = response, None
+
+            delay = self.backoff(attempt)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            if time.monotonic() + delay >= deadline:
+                # 预算不足以再等待一次，返回当前结果
+                metrics.incr("http.retry_exhausted", host=host)
+                if error is not None:
+                    raise error
+                return result  # type: ignore[return-value]
+
+            if result is not None:
+                await result.aclose()
+            metrics.incr("http.retries", host=host)
+            logger.info(f"{host} 请求失败（{reason}），{delay:.2f} 秒后第 {attempt + 1} 次重试")
+            await asyncio.sleep(delay)
+
+        raise RuntimeError("unreachable")  # pragma: no cover
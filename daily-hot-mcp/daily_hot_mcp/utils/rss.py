@@ -1,93 +1,318 @@
-"""RSS解析模块"""
+"""RSS解析模块
+
+RSS 源通过条件请求获取：源未更新时返回 304，直接复用上次解析的条目，
+不再下载和解析，各源的命中率见 http_client.conditional_stats()。
+
+RSS 2.0 / RSS 1.0 / Atom 用 lxml 增量解析：响应体边下载边解析，每个条目解析完即取出
+标题、摘要、链接、作者、发布时间和封面图片，字段与 feedparser 的 title、summary、link、
+author、published、media_content / enclosures 对应。传入 limit 时取够条目即停止下载。
+XML 不规范（例如使用了未声明的 HTML 实体）或不是可识别的 RSS/Atom 时，读取完整的响应
+改用 feedparser 解析，计入 rss.fallback 指标。
+"""
 
 import feedparser
-from typing import Dict, List, Any, Optional
+import httpx
+from functools import partial
+from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import urljoin
+from lxml import etree
 from .http import http_client
+from .logger import logger
+from .metrics import metrics
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_RDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+_CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_MEDIA = "{http://search.yahoo.com/mrss/}"
+
+_ENTRY_TAGS = frozenset({"item", _RSS1 + "item", _ATOM + "entry"})
+_ROOT_TAGS = frozenset({"rss", _RDF + "RDF", _ATOM + "feed"})
+_HTML_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
+# 条目和源信息的统一字段，与 feedparser 的字段名一致
+FeedInfo = Dict[str, str]
+FeedEntry = Dict[str, str]
+
+
+def _text(el: Optional[etree._Element]) -> str:
+    if el is None:
+        return ""
+    return "".join(el.itertext()).strip()
+
+
+def _find(el: etree._Element, *paths: str) -> Optional[etree._Element]:
+    """按顺序返回第一个存在的子元素"""
+    for path in paths:
+        found = el.find(path)
+        if found is not None:
+            return found
+    return None
+
+
+def _atom_link(el: etree._Element) -> str:
+    """rel 为 alternate（或未写）、类型为网页的第一个链接"""
+    for link in el.iterfind(_ATOM + "link"):
+        if link.get("rel", "alternate") == "alternate" and link.get("type", "text/html") in _HTML_TYPES:
+            return (link.get("href") or "").strip()
+    return ""
+
+
+def _cover(el: etree._Element) -> Optional[str]:
+    """第一个 media:content 的地址，没有时取第一个图片类型的附件"""
+    media = next(el.iter(_MEDIA + "content"), None)
+    if media is not None:
+        return media.get("url")
+    for enclosure in el.iter("enclosure", _ATOM + "link"):
+        if enclosure.tag == _ATOM + "link" and enclosure.get("rel") != "enclosure":
+            continue
+        if (enclosure.get("type") or "").startswith("image/"):
+            return enclosure.get("url") if enclosure.tag == "enclosure" else enclosure.get("href")
+    return None
+
+
+def _entry(el: etree._Element) -> FeedEntry:
+    """把 item / entry 元素转换为统一的字段"""
+    if el.tag == _ATOM + "entry":
+        entry = {
+            "title": _text(el.find(_ATOM + "title")),
+            "summary": _text(_find(el, _ATOM + "summary", _ATOM + "content")),
+            "link": _atom_link(el),
+            "id": _text(el.find(_ATOM + "id")),
+            "published": _text(el.find(_ATOM + "published")),
+            "author": _text(_find(el, f"{_ATOM}author/{_ATOM}name", _DC + "creator")),
+        }
+    else:
+        ns = "" if el.tag == "item" else _RSS1
+        guid = el.find("guid")
+        entry = {
+            "title": _text(el.find(ns + "title")),
+            "summary": _text(_find(el, ns + "description", _CONTENT + "encoded")),
+            "link": _text(el.find(ns + "link")),
+            "id": _text(guid) if guid is not None else (el.get(_RDF + "about") or "").strip(),
+            "published": _text(el.find("pubDate")),
+            "author": _text(_find(el, "author", _DC + "creator")),
+        }
+        # 没有 link 时 isPermaLink 不为 false 的 guid 就是链接
+        if not entry["link"] and guid is not None and guid.get("isPermaLink", "true").lower() != "false":
+            entry["link"] = entry["id"]
+    cover = _cover(el)
+    if cover:
+        entry["cover"] = cover
+    return entry
+
+
+def _feed_info(root: etree._Element) -> FeedInfo:
+    """源的标题、描述和链接"""
+    if root.tag == _ATOM + "feed":
+        return {
+            "title": _text(root.find(_ATOM + "title")),
+            "description": _text(root.find(_ATOM + "subtitle")),
+            "link": _atom_link(root),
+        }
+    channel = _find(root, "channel", _RSS1 + "channel")
+    if channel is None:
+        return {"title": "", "description": "", "link": ""}
+    ns = "" if channel.tag == "channel" else _RSS1
+    return {
+        "title": _text(channel.find(ns + "title")),
+        "description": _text(channel.find(ns + "description")),
+        "link": _text(channel.find(ns + "link")),
+    }
+
+
+class FeedReader:
+    """增量解析 RSS/Atom：每次传入一段响应体，解析完的条目追加到 entries
+
+    XML 不规范时 feed() / close() 抛出 lxml.etree.XMLSyntaxError。
+    """
+
+    def __init__(self, limit: Optional[int] = None, encoding: Optional[str] = None):
+        self.limit = limit
+        self.info: Optional[FeedInfo] = None
+        self.entries: List[FeedEntry] = []
+        self._root: Optional[etree._Element] = None
+        # 只产生条目结束的事件；不解析外部实体，也不访问网络
+        self._parser = etree.XMLPullParser(
+            events=("end",), tag=sorted(_ENTRY_TAGS), encoding=encoding,
+            resolve_entities=False, no_network=True, huge_tree=True,
+        )
+
+    @property
+    def done(self) -> bool:
+        """已取够 limit 个条目"""
+        return self.limit is not None and len(self.entries) >= self.limit
+
+    @property
+    def is_feed(self) -> bool:
+        """文档的根元素是否为 rss、rdf:RDF 或 Atom 的 feed"""
+        return self._root is not None and self._root.tag in _ROOT_TAGS
+
+    def feed(self, data: bytes) -> None:
+        self._parser.feed(data)
+        self._read_events()
+
+    def close(self) -> None:
+        """响应体读取完毕"""
+        root = self._parser.close()
+        self._read_events()
+        if self._root is None:
+            self._root = root
+        if self.info is None and self.is_feed:
+            self.info = _feed_info(root)
 
+    def _read_events(self) -> None:
+        for _, el in self._parser.read_events():
+            if self.done:
+                continue
+            if self._root is None:
+                self._root = el.getroottree().getroot()
+            if self.info is None:
+                # 源的标题等信息写在第一个条目之前
+                self.info = _feed_info(self._root)
+            self.entries.append(_entry(el))
+            # 已转换的条目不再需要，释放其子树
+            el.clear()
 
-async def parse_rss(url: str) -> List[Dict[str, Any]]:
-    """解析RSS源"""
+
+def _parse_with_feedparser(body: bytes, content_type: Optional[str] = None) -> Tuple[FeedInfo, List[FeedEntry]]:
+    """用 feedparser 解析完整的响应体
+
+    传入原始字节，由 feedparser 按 Content-Type、XML 声明和 BOM 判断编码。
+    """
+    headers = {"content-type": content_type} if content_type else None
+    feed = feedparser.parse(body, response_headers=headers)
+    info = {
+        "title": getattr(feed.feed, "title", ""),
+        "description": getattr(feed.feed, "description", ""),
+        "link": getattr(feed.feed, "link", ""),
+    }
+    entries = []
+    for entry in feed.entries:
+        item = {
+            "title": getattr(entry, "title", ""),
+            "summary": getattr(entry, "summary", ""),
+            "link": getattr(entry, "link", ""),
+            "id": getattr(entry, "id", ""),
+            "published": getattr(entry, "published", ""),
+            "author": getattr(entry, "author", ""),
+        }
+
+        # 处理封面图片
+        cover = None
+        if hasattr(entry, "media_content") and entry.media_content:
+            cover = entry.media_content[0].get("url")
+        elif hasattr(entry, "enclosures") and entry.enclosures:
+            for enclosure in entry.enclosures:
+                if enclosure.get("type", "").startswith("image/"):
+                    cover = enclosure.get("href")
+                    break
+
+        if cover:
+            item["cover"] = cover
+
+        entries.append(item)
+    return info, entries
+
+
+async def read_feed(response: httpx.Response, limit: Optional[int] = None) -> Tuple[FeedInfo, List[FeedEntry]]:
+    """边下载边解析 RSS/Atom 响应，返回源信息和条目
+
+    Args:
+        response: 以 stream=True 发送的请求的响应，响应体尚未读取
+        limit: 最多解析的条目数，取够后不再读取剩余的响应体
+    """
+    reader = FeedReader(limit, response.charset_encoding)
+    body = bytearray()
+    chunks = response.aiter_bytes()
     try:
-        # 获取RSS内容
-        response = await http_client.get(url)
-        response.raise_for_status()
-        
-        # 解析RSS
-        feed = feedparser.parse(response.text)
-        
-        if not feed.entries:
-            return []
-        
-        results = []
-        for entry in feed.entries:
-            item = {
-                "title": getattr(entry, "title", ""),
-                "description": getattr(entry, "summary", ""),
-                "link": getattr(entry, "link", ""),
-                "author": getattr(entry, "author", ""),
-                "publish_time": getattr(entry, "published", ""),
-            }
-            
-            # 处理封面图片
-            cover = None
-            if hasattr(entry, "media_content") and entry.media_content:
-                cover = entry.media_content[0].get("url")
-            elif hasattr(entry, "enclosures") and entry.enclosures:
-                for enclosure in entry.enclosures:
-                    if enclosure.get("type", "").startswith("image/"):
-                        cover = enclosure.get("href")
-                        break
-            
-            if cover:
-                item["cover"] = cover
-            
-            results.append(item)
-        
-        return results
-    
+        async for chunk in chunks:
+            body += chunk
+            reader.feed(chunk)
+            if reader.done:
+                break
+        else:
+            reader.close()
+    except etree.XMLSyntaxError as e:
+        reason = str(e)
+    else:
+        if reader.is_feed and reader.info is not None:
+            return reader.info, reader.entries
+        reason = "不是 RSS/Atom 文档"
+
+    async for chunk in chunks:
+        body += chunk
+    metrics.incr("rss.fallback")
+    logger.debug(f"RSS 增量解析失败，改用 feedparser: {response.url}: {reason}")
+    info, entries = _parse_with_feedparser(bytes(body), response.headers.get("content-type"))
+    return info, entries[:limit]
+
+
+async def parse_rss_items(response: httpx.Response, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """把RSS响应解析为条目列表"""
+    _, entries = await read_feed(response, limit)
+
+    results = []
+    for entry in entries:
+        item = {
+            "title": entry["title"],
+            "description": entry["summary"],
+            "link": entry["link"],
+            "author": entry["author"],
+            "publish_time": entry["published"],
+        }
+        if entry.get("cover"):
+            item["cover"] = entry["cover"]
+        results.append(item)
+
+    return results
+
+
+async def parse_rss_feed(response: httpx.Response, limit: Optional[int] = None) -> Dict[str, Any]:
+    """把RSS响应解析为原始结构"""
+    info, entries = await read_feed(response, limit)
+
+    return {
+        "feed": {
+            **info,
+            "entry": [
+                {key: entry[key] for key in ("title", "summary", "link", "id", "published", "author")}
+                for entry in entries
+            ],
+        }
+    }
+
+
+def _bind_limit(parse: Any, limit: Optional[int]) -> Any:
+    # 不同 limit 的解析结果分别缓存
+    return partial(parse, limit=limit) if limit is not None else parse
+
+
+async def parse_rss(url: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """解析RSS源，limit 为最多返回的条目数"""
+    try:
+        # 获取RSS内容，源未更新时复用上次解析的条目
+        return await http_client.get_conditional(
+            url, _bind_limit(parse_rss_items, limit), name=f"rss:{url}", stream=True
+        )
+
     except Exception as e:
         raise Exception(f"解析RSS失败: {str(e)}")
 
 
-async def get_rss_items(url: str) -> List[Dict[str, Any]]:
+async def get_rss_items(url: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """获取RSS条目（parse_rss的别名）"""
-    return await parse_rss(url)
+    return await parse_rss(url, limit)
 
 
-async def get_rss(url: str) -> Dict[str, Any]:
+async def get_rss(url: str, limit: Optional[int] = None) -> Dict[str, Any]:
     """获取原始RSS数据"""
     try:
-        # 获取RSS内容
-        response = await http_client.get(url)
-        response.raise_for_status()
-        
-        # 解析RSS
-        feed_data = feedparser.parse(response.text)
-        
-        # 转换为字典格式
-        result = {
-            "feed": {
-                "title": getattr(feed_data.feed, "title", ""),
-                "description": getattr(feed_data.feed, "description", ""),
-                "link": getattr(feed_data.feed, "link", ""),
-                "entry": []
-            }
-        }
-        
-        # 添加条目
-        for entry in feed_data.entries:
-            entry_dict = {
-                "title": getattr(entry, "title", ""),
-                "summary": getattr(entry, "summary", ""),
-                "link": getattr(entry, "link", ""),
-                "id": getattr(entry, "id", ""),
-                "published": getattr(entry, "published", ""),
-                "author": getattr(entry, "author", ""),
-            }
-            result["feed"]["entry"].append(entry_dict)
-        
-        return result
-    
+        # 获取RSS内容，源未更新时复用上次解析的结果
+        return await http_client.get_conditional(
+            url, _bind_limit(parse_rss_feed, limit), name=f"rss-raw:{url}", stream=True
+        )
+
     except Exception as e:
-        raise Exception(f"获取RSS数据失败: {str(e)}") 
\ No newline at end of file
+        raise Exception(f"获取RSS数据失败: {str(e)}")
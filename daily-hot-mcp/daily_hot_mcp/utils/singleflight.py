@@ -0,0 +1,114 @@
+"""并发请求合并（singleflight）
+
+同一时刻对同一个工具、同一组参数的多次调用只会触发一次上游请求，
+其余调用方等待这次请求完成并共享结果。共享的请求使用所有调用方中最晚的截止时间，
+调用方自己的截止时间只约束它自己的等待（见 deadline.within_deadline）。
+"""
+
+import asyncio
+import inspect
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from . import deadline
+
+
+def make_key(name: str, arguments: Optional[Dict[str, Any]] = None) -> str:
+    """根据工具名和参数生成规范化的键
+
+    参数按键名排序并紧凑序列化，因此参数顺序和默认值是否显式传入都不影响结果。
+    """
+    if not arguments:
+        return name
+    normalized = json.dumps(
+        arguments, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+    return f"{name}:{normalized}"
+
+
+def bind_arguments(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """把一次调用的参数绑定到函数签名上，并补齐默认值"""
+    bound = inspect.signature(fn).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+class SingleFlight:
+    """按键合并并发中的异步调用"""
+
+    def __init__(self):
+        self._calls: Dict[str, "asyncio.Task[Any]"] = {}
+        self._deadlines: Dict[str, deadline.SharedDeadline] = {}
+        self._stats = {"executed": 0, "coalesced": 0}
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        cache: Optional[Any] = None,
+    ) -> Any:
+        """执行 fn，若相同 key 的调用正在进行则直接等待其结果
+
+        传入 cache 时先查缓存，未命中才发起请求，并由第一个完成的请求写回缓存，
+        这样后续调用即使不在同一时刻到达也能直接命中。
+        """
+        if cache is not None:
+            cached = await cache.aget(key)
+            if cached is not None:
+                return cached
+
+        task = self._calls.get(key)
+        if task is None:
+            self._stats["executed"] += 1
+            # 共享的请求不继承第一个调用方的截止时间，后加入的调用方可以延长它
+            shared = deadline.SharedDeadline(deadline.current())
+            with deadline.shared_deadline(shared):
+                task = asyncio.ensure_future(self._run(key, fn, cache))
+            # 所有调用方都被取消时，避免出现 "Task exception was never retrieved"
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._calls[key] = task
+            self._deadlines[key] = shared
+        else:
+            self._stats["coalesced"] += 1
+            self._deadlines[key].extend(deadline.current())
+
+        # shield 保证单个调用方被取消（例如客户端断开）时不会取消共享的请求
+        return await asyncio.shield(task)
+
+    async def _run(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        cache: Optional[Any],
+    ) -> Any:
+        try:
+            result = await fn()
+            if cache is not None and result is not None:
+                await cache.aset(key, result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+            self._deadlines.pop(key, None)
+
+    async def cancel_all(self) -> None:
+        """取消并等待所有进行中的请求，用于关闭 HTTP 客户端之前
+
+        请求由 shield 保护，调用方离开后仍会继续，因此需要单独取消。
+        """
+        tasks = list(self._calls.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def in_flight(self) -> int:
+        """当前正在进行的请求数"""
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """返回实际执行次数和被合并的调用次数"""
+        return {**self._stats, "in_flight": len(self._calls)}
+
+
+# 全局实例
+singleflight = SingleFlight()
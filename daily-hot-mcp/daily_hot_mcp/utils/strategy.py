@@ -0,0 +1,247 @@
+"""按数据源记录各获取策略的表现，自适应选择先用哪个策略
+
+sogou、hupu、so360 等数据源有多种获取方式（页面解析、备用接口……）。原先总是先试
+主策略，即使它已经连续失败了很多次。StrategyBoard 为每个数据源的每个策略记录：
+- 最近成功率（指数加权，alpha 越大越看重最近的结果）；
+- 成功请求的平均耗时（同样指数加权）；
+- 累计调用和成功次数。
+
+新的调用按最近成功率从高到低排序，成功率相同时保持声明顺序；每 probe_every 次调用
+会把一个被降级的策略放到最前面试探一次，以便它恢复后能重新排到前面。排序后前两个
+策略交给 hedged() 对冲执行，其余策略在两者都失败后依次尝试。
+
+统计结果保存在 JSON 文件中，重启后沿用，可在配置文件中调整：
+
+    [strategy]
+    path = "/var/cache/daily-hot/strategy.json"   # 默认在缓存目录下
+    alpha = 0.2
+    probe_every = 20
+    save_interval = 30                            # 秒，最多每隔这么久写一次文件
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from .cache_backend import DEFAULT_CACHE_ROOT
+from .config import get_section
+from .deadline import DeadlineExceeded
+from .hedge import hedged
+from .logger import logger
+from .metrics import metrics
+
+T = TypeVar("T")
+
+DEFAULT_STRATEGY_CONFIG: Dict[str, Any] = {
+    "alpha": 0.2,
+    "probe_every": 20,
+    "save_interval": 30.0,
+}
+
+
+class StrategyStats:
+    """单个策略的统计"""
+
+    __slots__ = ("success_rate", "latency", "calls", "successes", "last_error")
+
+    def __init__(
+        self,
+        success_rate: float = 1.0,
+        latency: Optional[float] = None,
+        calls: int = 0,
+        successes: int = 0,
+        last_error: str = "",
+    ):
+        # 没有记录的策略按成功处理，保证新策略会被尝试
+        self.success_rate = success_rate
+        self.latency = latency
+        self.calls = calls
+        self.successes = successes
+        self.last_error = last_error
+
+    def record(self, ok: bool, latency: float, alpha: float, error: str = "") -> None:
+        self.calls += 1
+        self.success_rate += alpha * ((1.0 if ok else 0.0) - self.success_rate)
+        if ok:
+            self.successes += 1
+            self.latency = latency if self.latency is None else self.latency + alpha * (latency - self.latency)
+        else:
+            self.last_error = error[:200]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success_rate": round(self.success_rate, 4),
+            "latency": None if self.latency is None else round(self.latency, 4),
+            "calls": self.calls,
+            "successes": self.successes,
+            "last_error": self.last_error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StrategyStats":
+        return cls(
+            success_rate=float(data.get("success_rate", 1.0)),
+            latency=data.get("latency"),
+            calls=int(data.get("calls", 0)),
+            successes=int(data.get("successes", 0)),
+            last_error=str(data.get("last_error", "")),
+        )
+
+
+class StrategyBoard:
+    """各数据源策略的记分板"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        alpha: float = 0.2,
+        probe_every: int = 20,
+        save_interval: float = 30.0,
+    ):
+        self.path = Path(path) if path else DEFAULT_CACHE_ROOT / "strategy.json"
+        self.alpha = alpha
+        self.probe_every = max(0, int(probe_every))
+        self.save_interval = save_interval
+        self._stats: Dict[str, Dict[str, StrategyStats]] = {}
+        self._calls: Dict[str, int] = {}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_config(cls) -> "StrategyBoard":
+        section = get_section("strategy")
+        config = {**DEFAULT_STRATEGY_CONFIG, **{
+            k: v for k, v in section.items() if k in DEFAULT_STRATEGY_CONFIG
+        }}
+        return cls(path=section.get("path"), **config)
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"读取策略统计文件失败: {e}")
+            return
+        for source, strategies in data.get("sources", {}).items():
+            if isinstance(strategies, dict):
+                self._stats[source] = {
+                    name: StrategyStats.from_dict(stats)
+                    for name, stats in strategies.items()
+                    if isinstance(stats, dict)
+                }
+
+    def _stats_for(self, source: str, name: str) -> StrategyStats:
+        strategies = self._stats.setdefault(source, {})
+        stats = strategies.get(name)
+        if stats is None:
+            stats = strategies[name] = StrategyStats()
+        return stats
+
+    def order(self, source: str, names: List[str]) -> List[str]:
+        """按最近成功率排序策略，定期把一个降级的策略提到最前面试探"""
+        with self._lock:
+            ranked = sorted(
+                names,
+                key=lambda n: (-round(self._stats_for(source, n).success_rate, 2), names.index(n)),
+            )
+            calls = self._calls[source] = self._calls.get(source, 0) + 1
+        if self.probe_every and len(ranked) > 1 and ranked != names and calls % self.probe_every == 0:
+            # 被降级的策略（排名比声明顺序靠后）有多个时轮流试探
+            demoted = [n for n in names if ranked.index(n) > names.index(n)]
+            if demoted:
+                probe = demoted[(calls // self.probe_every) % len(demoted)]
+                ranked.remove(probe)
+                ranked.insert(0, probe)
+                metrics.incr("strategy.probes", source=source, strategy=probe)
+        return ranked
+
+    def record(self, source: str, name: str, ok: bool, latency: float, error: str = "") -> None:
+        with self._lock:
+            self._stats_for(source, name).record(ok, latency, self.alpha, error)
+            self._dirty = True
+            due = time.monotonic() - self._saved_at >= self.save_interval
+        metrics.incr("strategy.calls", source=source, strategy=name, ok=ok)
+        if ok:
+            metrics.observe("strategy.latency_seconds", latency, source=source, strategy=name)
+        if due:
+            self.flush()
+
+    def track(self, source: str, name: str, fn: Callable[[], Awaitable[T]]) -> Callable[[], Awaitable[T]]:
+        """包装策略函数，记录其成败和耗时
+
+        被取消或超过本次调用截止时间的调用不计入：这是调用方的时间预算不够，不是策略的问题。
+        """
+
+        async def tracked() -> T:
+            start = time.monotonic()
+            try:
+                result = await fn()
+            except (DeadlineExceeded, asyncio.CancelledError):
+                raise
+            except Exception as e:
+                self.record(source, name, False, time.monotonic() - start, str(e))
+                raise
+            self.record(source, name, True, time.monotonic() - start)
+            return result
+
+        return tracked
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                source: {name: stats.to_dict() for name, stats in strategies.items()}
+                for source, strategies in sorted(self._stats.items())
+            }
+
+    def flush(self) -> None:
+        """有未保存的统计时写入文件"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"sources": {
+                source: {name: stats.to_dict() for name, stats in strategies.items()}
+                for source, strategies in self._stats.items()
+            }}
+            self._dirty = False
+            self._saved_at = time.monotonic()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"保存策略统计文件失败: {e}")
+
+    async def run(self, source: str, strategies: Dict[str, Callable[[], Awaitable[T]]]) -> T:
+        """按当前排序执行策略：前两个对冲执行，都失败后依次尝试其余策略
+
+        Args:
+            source: 数据源名称
+            strategies: 策略名到无参协程函数的映射，按默认优先级排列
+        """
+        names = self.order(source, list(strategies))
+        tracked = [self.track(source, name, strategies[name]) for name in names]
+        if len(tracked) == 1:
+            return await tracked[0]()
+        try:
+            return await hedged(source, tracked[0], tracked[1])
+        except Exception:
+            if len(tracked) == 2:
+                raise
+        for fn in tracked[2:-1]:
+            try:
+                return await fn()
+            except Exception:
+                pass
+        return await tracked[-1]()
+
+
+# 全局实例
+strategy_board = StrategyBoard.from_config()
@@ -0,0 +1,189 @@
+"""Stale-while-revalidate 缓存读取
+
+每个缓存条目有两个时间窗口：
+- 新鲜期内直接返回缓存；
+- 过期但仍在陈旧期内时立即返回缓存，并在后台触发一次刷新；
+- 超过陈旧期或没有缓存时同步请求上游，上游失败或超过本次调用的截止时间时
+  退回最后一次成功的数据。
+
+超过截止时间时只是不再等待，上游请求仍会在所有等待它的调用方中最晚的截止时间内继续，
+成功后照常写入缓存。
+后台刷新不属于任何一次调用，不受截止时间约束。
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from .cache import CacheEntry, SimpleCache, cache as default_cache
+from .deadline import no_deadline, within_deadline
+from .logger import logger
+from .singleflight import SingleFlight, singleflight
+
+FRESH = "fresh"
+STALE = "stale"
+FALLBACK = "fallback"
+BYPASS = "bypass"
+
+
+class UnusableResult(Exception):
+    """上游返回了不应缓存的结果（空列表或占位数据）"""
+
+    def __init__(self, result: Any):
+        super().__init__("上游返回了不可用的结果")
+        self.result = result
+
+
+class SWRResult:
+    """一次 SWR 读取的结果及其来源"""
+
+    __slots__ = ("data", "status", "updated")
+
+    def __init__(self, data: Any, status: str, updated: Optional[float] = None):
+        self.data = data
+        self.status = status
+        self.updated = updated
+
+    def meta(self) -> Dict[str, Any]:
+        """返回可附加到工具响应中的缓存状态"""
+        meta: Dict[str, Any] = {"status": self.status}
+        if self.updated is not None:
+            meta["updated"] = datetime.fromtimestamp(self.updated).isoformat()
+        return meta
+
+
+class Placeholder(list):
+    """工具在上游不可用时返回的占位数据
+
+    内容照常返回给调用方，但不会写入缓存，也不会覆盖最后一次成功的数据。
+    """
+
+
+def placeholder(*items: Dict[str, Any]) -> Placeholder:
+    """把占位条目包装为 Placeholder"""
+    return Placeholder(items)
+
+
+def is_usable(data: Any) -> bool:
+    """判断结果是否值得缓存：空结果和 Placeholder 占位数据都不缓存"""
+    if data is None or isinstance(data, Placeholder):
+        return False
+    if isinstance(data, (list, dict)) and not data:
+        return False
+    return True
+
+
+class SWRCache:
+    """在 SimpleCache 之上实现 stale-while-revalidate"""
+
+    def __init__(
+        self,
+        cache: SimpleCache = default_cache,
+        flight: SingleFlight = singleflight,
+    ):
+        self._cache = cache
+        self._flight = flight
+        self._refreshing: Set[str] = set()
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+
+    async def fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        accept: Callable[[Any], bool] = is_usable,
+        force: bool = False,
+        min_refresh_interval: float = 0.0,
+    ) -> SWRResult:
+        """按 SWR 策略读取 key，必要时调用 fetch 获取新数据
+
+        force 为 True 时跳过新鲜/陈旧缓存直接请求上游，但上游失败时仍会退回缓存。
+        距上次写入不足 min_refresh_interval 秒时，force 和后台刷新都不会请求上游。
+        """
+        entry = await self._cache.aget_entry(key)
+        if entry is not None:
+            recent = entry.age < min_refresh_interval
+            if entry.is_fresh and (not force or recent):
+                return SWRResult(entry.data, FRESH, entry.updated)
+            if recent:
+                return SWRResult(entry.data, STALE, entry.updated)
+            if entry.is_stale and not force:
+                self._schedule_refresh(key, fetch, ttl, stale_ttl, accept)
+                return SWRResult(entry.data, STALE, entry.updated)
+
+        try:
+            data = await within_deadline(self._flight.do(
+                key, lambda: self._fetch_and_store(key, fetch, ttl, stale_ttl, accept)
+            ))
+            return SWRResult(data, FRESH, datetime.now().timestamp())
+        except UnusableResult as e:
+            if entry is not None:
+                return self._fallback(key, entry, "上游返回空数据")
+            return SWRResult(e.result, BYPASS)
+        except Exception as e:
+            if entry is not None:
+                return self._fallback(key, entry, str(e))
+            raise
+
+    def _fallback(self, key: str, entry: CacheEntry, reason: str) -> SWRResult:
+        logger.warning(f"{key} 刷新失败，返回最后一次成功的数据: {reason}")
+        return SWRResult(entry.data, FALLBACK, entry.updated)
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+        stale_ttl: Optional[float],
+        accept: Callable[[Any], bool],
+    ) -> Any:
+        data = await fetch()
+        if not accept(data):
+            raise UnusableResult(data)
+        await self._cache.aset(key, data, ttl=ttl, stale_ttl=stale_ttl)
+        return data
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+        stale_ttl: Optional[float],
+        accept: Callable[[Any], bool],
+    ) -> None:
+        """后台刷新一个陈旧的 key，同一个 key 同时只刷新一次"""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            try:
+                with no_deadline():
+                    await self._flight.do(
+                        key, lambda: self._fetch_and_store(key, fetch, ttl, stale_ttl, accept)
+                    )
+            except UnusableResult:
+                logger.warning(f"{key} 后台刷新返回空数据，继续使用缓存")
+            except Exception as e:
+                logger.warning(f"{key} 后台刷新失败，继续使用缓存: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        # 保留任务引用，避免任务在完成前被垃圾回收
+        task = asyncio.ensure_future(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def cancel_refreshes(self) -> None:
+        """取消并等待所有进行中的后台刷新，用于关闭 HTTP 客户端之前"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# 全局实例
+swr_cache = SWRCache()
+
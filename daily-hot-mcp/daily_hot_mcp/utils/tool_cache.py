@@ -0,0 +1,143 @@
+"""工具级缓存装饰
+
+对 tools/__init__.py 收集的所有 Tool.from_function 工具统一加上缓存：
+- 缓存键由工具名和绑定后的参数（含默认值）生成；
+- 缓存时长按工具名和参数从 ttl.py 的登记表解析，时长为 0 时只合并并发请求、不缓存；
+- 自动为每个工具增加 force_refresh 参数，用于跳过缓存；
+- 自动为每个工具增加 timeout_ms 参数，每次调用都有截止时间（默认值见 deadline.py），
+  到期时返回已有的缓存数据；
+- 读取按 stale-while-revalidate 策略进行，见 swr.py。
+
+各工具的抓取逻辑无需任何修改。
+"""
+
+import functools
+import inspect
+from typing import Annotated, Any, Iterable, List, Optional
+
+from fastmcp.tools import Tool
+from fastmcp.tools.tool import FunctionTool, ToolResult
+from pydantic import Field
+
+from .deadline import deadline_scope, tool_timeout, within_deadline
+from .singleflight import bind_arguments, make_key, singleflight
+from .swr import SWRCache, swr_cache
+from .ttl import TTLRegistry, ttl_registry
+
+FORCE_REFRESH_ARG = "force_refresh"
+TIMEOUT_ARG = "timeout_ms"
+
+_FORCE_REFRESH_ANNOTATION = Annotated[
+    bool, Field(description="是否跳过缓存，强制从数据源获取最新数据")
+]
+
+_TIMEOUT_ANNOTATION = Annotated[
+    Optional[int],
+    Field(description="本次调用最多等待的毫秒数，超时后返回已有的缓存数据；不传时使用服务端配置", ge=1),
+]
+
+# 缓存层为工具追加的参数：参数名 -> (默认值, 类型标注)
+_EXTRA_ARGS = {
+    FORCE_REFRESH_ARG: (False, _FORCE_REFRESH_ANNOTATION),
+    TIMEOUT_ARG: (None, _TIMEOUT_ANNOTATION),
+}
+
+
+def _with_extra_args(fn: Any, names: List[str]) -> inspect.Signature:
+    signature = inspect.signature(fn)
+    params = list(signature.parameters.values())
+    for name in names:
+        default, annotation = _EXTRA_ARGS[name]
+        params.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=default,
+                annotation=annotation,
+            )
+        )
+    return signature.replace(parameters=params)
+
+
+def cached_tool(
+    tool: FunctionTool,
+    ttl: Optional[float] = None,
+    stale_ttl: Optional[float] = None,
+    swr: SWRCache = swr_cache,
+    registry: TTLRegistry = ttl_registry,
+) -> FunctionTool:
+    """为工具加上缓存，返回新的工具
+
+    ttl/stale_ttl 单位为秒，指定时优先于登记表；未指定时每次调用按工具名和参数
+    从登记表解析，因此运行时修改登记表会立即生效。ttl 为 0 表示不缓存，
+    此时仍会合并相同参数的并发调用。
+
+    返回值的文本内容与原工具一致；结构化内容中额外附带 cache 字段，
+    说明本次数据是 fresh、stale 还是 fallback。
+    """
+    fn = tool.fn
+    wrap_result = bool(tool.output_schema and tool.output_schema.get("x-fastmcp-wrap-result"))
+    own_params = inspect.signature(fn).parameters
+    added_args = [name for name in _EXTRA_ARGS if name not in own_params]
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        force = kwargs.get(FORCE_REFRESH_ARG, False)
+        timeout_ms = kwargs.get(TIMEOUT_ARG)
+        for name in added_args:
+            kwargs.pop(name, None)
+        arguments = bind_arguments(fn, *args, **kwargs)
+        arguments.pop(FORCE_REFRESH_ARG, None)
+        arguments.pop(TIMEOUT_ARG, None)
+        key = make_key(tool.name, arguments)
+
+        async def call() -> Any:
+            result = fn(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        policy = registry.resolve(tool.name, arguments)
+        if ttl is not None:
+            policy = policy.merged({"ttl": ttl, "stale_ttl": stale_ttl})
+
+        # 截止时间对本次调用内的所有上游请求生效，包括备用接口
+        with deadline_scope(tool_timeout(tool.name, timeout_ms)):
+            if policy.ttl <= 0:
+                return await within_deadline(singleflight.do(key, call))
+
+            result = await swr.fetch(
+                key,
+                call,
+                ttl=policy.ttl,
+                stale_ttl=policy.stale_ttl,
+                force=bool(force),
+                min_refresh_interval=policy.min_refresh_interval,
+            )
+        if not wrap_result:
+            return result.data
+        return ToolResult(
+            content=result.data,
+            structured_content={"result": result.data, "cache": result.meta()},
+        )
+
+    if added_args:
+        wrapper.__signature__ = _with_extra_args(fn, added_args)  # type: ignore[attr-defined]
+        wrapper.__annotations__ = {
+            **getattr(fn, "__annotations__", {}),
+            **{name: _EXTRA_ARGS[name][1] for name in added_args},
+        }
+
+    return Tool.from_function(
+        fn=wrapper,
+        name=tool.name,
+        title=tool.title,
+        description=tool.description,
+        tags=tool.tags,
+        annotations=tool.annotations,
+    )
+
+
+def apply_tool_cache(tools: Iterable[FunctionTool]) -> List[FunctionTool]:
+    """为一组工具统一加上缓存，缓存时长由登记表决定"""
+    return [cached_tool(tool) for tool in tools]
@@ -0,0 +1,269 @@
+"""数据源缓存时长登记表
+
+不同数据源的更新频率差别很大：微博、抖音热搜每分钟都在变，而微信读书榜单、
+什么值得买月榜一天只变几次。登记表为每个工具（以及特定参数组合）记录：
+- ttl：新鲜期，期内直接返回缓存；
+- stale_ttl：新鲜期之后仍可先返回旧数据、后台刷新的时长；
+- min_refresh_interval：两次请求上游之间的最小间隔，force_refresh 和后台刷新都会遵守。
+
+优先级从高到低：运行时 set()、环境变量、配置文件、代码默认值。配置文件和环境变量中的
+时长单位为分钟，代码中（TTLPolicy、set()）统一为秒。
+
+配置文件示例（见 config.example.toml）：
+
+    [cache]
+    ttl = 30
+
+    [cache.tools."get-weibo-trending"]
+    ttl = 1
+
+    [[cache.rules]]
+    tool = "get-smzdm-rank"
+    args = { unit = 30 }
+    ttl = 360
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import env_float, get_section
+from .logger import logger
+
+
+class TTLPolicy:
+    """一个工具的缓存时长配置，单位为秒"""
+
+    __slots__ = ("ttl", "stale_ttl", "min_refresh_interval")
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: Optional[float] = None,
+        min_refresh_interval: float = 0.0,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.min_refresh_interval = min_refresh_interval
+
+    def merged(self, overrides: Dict[str, Optional[float]]) -> "TTLPolicy":
+        """返回用 overrides 中非空的值覆盖后的新配置"""
+        return TTLPolicy(
+            ttl=overrides["ttl"] if overrides.get("ttl") is not None else self.ttl,
+            stale_ttl=overrides["stale_ttl"] if overrides.get("stale_ttl") is not None else self.stale_ttl,
+            min_refresh_interval=(
+                overrides["min_refresh_interval"]
+                if overrides.get("min_refresh_interval") is not None
+                else self.min_refresh_interval
+            ),
+        )
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        return {
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            "min_refresh_interval": self.min_refresh_interval,
+        }
+
+    def __repr__(self) -> str:
+        return f"TTLPolicy({self.as_dict()})"
+
+
+def _minutes(ttl: float, min_refresh_interval: float = 0.5, stale_ttl: Optional[float] = None) -> TTLPolicy:
+    return TTLPolicy(
+        ttl=ttl * 60,
+        stale_ttl=None if stale_ttl is None else stale_ttl * 60,
+        min_refresh_interval=min_refresh_interval * 60,
+    )
+
+
+# 各工具的默认缓存时长（分钟），按数据源的实际更新频率设定
+DEFAULT_POLICY = _minutes(30)
+
+DEFAULT_TOOL_POLICIES: Dict[str, TTLPolicy] = {
+    # 分钟级变化的热搜
+    "get-weibo-trending": _minutes(2),
+    "get-douyin-trending": _minutes(2),
+    "get-baidu-trending": _minutes(5),
+    "get-toutiao-trending": _minutes(5),
+    "get-zhihu-trending": _minutes(5),
+    "get-so360-trending": _minutes(5),
+    "get-sogou-trending": _minutes(5),
+    "get-kuaishou-trending": _minutes(5),
+    "get-weibo-comments": _minutes(5),
+    "get-weibo-hot-feeds": _minutes(5),
+    # 小时内变化的新闻和社区热榜
+    "get-bilibili-trending": _minutes(10),
+    "get-xiaohongshu-trending": _minutes(10),
+    "get-hupu-trending": _minutes(10),
+    "get-thepaper-trending": _minutes(10),
+    "get-tencent-news-trending": _minutes(10),
+    "get-netease-news-trending": _minutes(10),
+    "get-ithome-trending": _minutes(10),
+    "search-weibo-content": _minutes(10),
+    "search-weibo-topics": _minutes(10),
+    "search-weibo-users": _minutes(30),
+    "get-weibo-user-feeds": _minutes(10),
+    "get-36kr-trending": _minutes(15),
+    "get-ifanr-news": _minutes(15),
+    "get-bbc-news": _minutes(15, 5),
+    "get-theverge-news": _minutes(15, 5),
+    "get-9to5mac-news": _minutes(15, 5),
+    "get-autohome-trending": _minutes(30, 5),
+    "get-infoq-news": _minutes(30, 10),
+    "get-sspai-rank": _minutes(30, 10),
+    "custom-rss": _minutes(30, 5),
+    "get-bilibili-rank": _minutes(30, 10),
+    "get-weibo-user-profile": _minutes(60, 10),
+    "get-weibo-user-followers": _minutes(60, 10),
+    "get-weibo-user-fans": _minutes(60, 10),
+    "get-douban-rank": _minutes(60, 15),
+    "get-smzdm-rank": _minutes(60, 15),
+    "crawl_website": _minutes(60, 10),
+    # 一天只更新几次的榜单
+    "get-gcores-new": _minutes(120, 30),
+    "get-weread-rank": _minutes(180, 60),
+}
+
+# 针对特定参数的默认配置：(工具名, 参数子集, 配置)
+DEFAULT_ARG_POLICIES: List[Tuple[str, Dict[str, Any], TTLPolicy]] = [
+    ("get-smzdm-rank", {"unit": 7}, _minutes(180, 60)),
+    ("get-smzdm-rank", {"unit": 30}, _minutes(360, 120)),
+]
+
+
+def _env_name(tool_name: str, field: str) -> str:
+    suffix = {"ttl": "TTL", "stale_ttl": "STALE_TTL", "min_refresh_interval": "MIN_REFRESH"}[field]
+    return f"DAILY_HOT_CACHE_{suffix}_" + tool_name.upper().replace("-", "_")
+
+
+def _seconds(section: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """把配置中以分钟为单位的字段转换为秒"""
+    result: Dict[str, Optional[float]] = {}
+    for field in ("ttl", "stale_ttl", "min_refresh_interval"):
+        value = section.get(field)
+        if value is None:
+            result[field] = None
+            continue
+        try:
+            result[field] = float(value) * 60
+        except (TypeError, ValueError):
+            logger.warning(f"缓存配置 {field} 不是合法的分钟数: {value}")
+            result[field] = None
+    return result
+
+
+def _matches(arguments: Dict[str, Any], expected: Dict[str, Any]) -> bool:
+    return all(
+        name in arguments and str(arguments[name]) == str(value)
+        for name, value in expected.items()
+    )
+
+
+class TTLRegistry:
+    """按工具名和参数解析缓存时长"""
+
+    def __init__(
+        self,
+        default: TTLPolicy = DEFAULT_POLICY,
+        tools: Optional[Dict[str, TTLPolicy]] = None,
+        rules: Optional[List[Tuple[str, Dict[str, Any], TTLPolicy]]] = None,
+    ):
+        self._default = default
+        self._tools: Dict[str, TTLPolicy] = dict(tools or {})
+        self._rules: List[Tuple[str, Dict[str, Any], TTLPolicy]] = list(rules or [])
+        self._overrides: Dict[str, Dict[str, Optional[float]]] = {}
+        self._arg_overrides: List[Tuple[str, Dict[str, Any], Dict[str, Optional[float]]]] = []
+        self._lock = threading.Lock()
+
+    def load_config(self) -> None:
+        """从配置文件的 [cache] 段落读取时长"""
+        section = get_section("cache")
+        if not section:
+            return
+        self._default = self._default.merged(_seconds(section))
+        for tool_name, tool_section in get_section("cache", "tools").items():
+            if isinstance(tool_section, dict):
+                base = self._tools.get(tool_name, self._default)
+                self._tools[tool_name] = base.merged(_seconds(tool_section))
+        for rule in section.get("rules", []):
+            if not isinstance(rule, dict) or "tool" not in rule:
+                continue
+            base = self._tools.get(rule["tool"], self._default)
+            # 配置文件中的规则优先于代码中的默认规则
+            self._rules.insert(0, (rule["tool"], dict(rule.get("args", {})), base.merged(_seconds(rule))))
+
+    def set(
+        self,
+        tool_name: str,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        min_refresh_interval: Optional[float] = None,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """运行时覆盖某个工具（或特定参数）的配置，单位为秒"""
+        overrides = {
+            "ttl": ttl,
+            "stale_ttl": stale_ttl,
+            "min_refresh_interval": min_refresh_interval,
+        }
+        with self._lock:
+            if args:
+                self._arg_overrides.insert(0, (tool_name, dict(args), overrides))
+            else:
+                current = self._overrides.setdefault(tool_name, {})
+                current.update({k: v for k, v in overrides.items() if v is not None})
+
+    def reset(self, tool_name: Optional[str] = None) -> None:
+        """清除运行时覆盖"""
+        with self._lock:
+            if tool_name is None:
+                self._overrides.clear()
+                self._arg_overrides.clear()
+            else:
+                self._overrides.pop(tool_name, None)
+                self._arg_overrides = [o for o in self._arg_overrides if o[0] != tool_name]
+
+    def resolve(self, tool_name: str, arguments: Optional[Dict[str, Any]] = None) -> TTLPolicy:
+        """返回某次调用应使用的缓存配置"""
+        arguments = arguments or {}
+        policy = self._tools.get(tool_name)
+        for rule_tool, expected, rule_policy in self._rules:
+            if rule_tool == tool_name and _matches(arguments, expected):
+                policy = rule_policy
+                break
+        if policy is None:
+            # 全局 DAILY_HOT_CACHE_TTL 只替换默认值，不影响有单独配置的工具
+            policy = self._default
+            global_ttl = env_float("DAILY_HOT_CACHE_TTL")
+            if global_ttl is not None:
+                policy = policy.merged({"ttl": global_ttl * 60})
+
+        env_overrides: Dict[str, Optional[float]] = {}
+        for field in ("ttl", "stale_ttl", "min_refresh_interval"):
+            value = env_float(_env_name(tool_name, field))
+            env_overrides[field] = None if value is None else value * 60
+        policy = policy.merged(env_overrides)
+
+        with self._lock:
+            if tool_name in self._overrides:
+                policy = policy.merged(self._overrides[tool_name])
+            for rule_tool, expected, overrides in self._arg_overrides:
+                if rule_tool == tool_name and _matches(arguments, expected):
+                    policy = policy.merged(overrides)
+                    break
+        return policy
+
+    def snapshot(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """返回所有已知工具当前生效的配置，便于排查"""
+        names = set(self._tools) | set(self._overrides)
+        return {name: self.resolve(name).as_dict() for name in sorted(names)}
+
+
+def _build_registry() -> TTLRegistry:
+    registry = TTLRegistry(tools=DEFAULT_TOOL_POLICIES, rules=DEFAULT_ARG_POLICIES)
+    registry.load_config()
+    return registry
+
+
+# 全局实例
+ttl_registry = _build_registry()
@@ -0,0 +1,127 @@
+"""启动时预热连接
+
+第一次调用某个工具时，请求要先完成 DNS 解析、TCP 和 TLS 握手，往往比后续调用慢
+几百毫秒。开启预热后，服务启动时在后台并发地向各数据源域名发送 HEAD 请求，
+让解析结果进入 DNS 缓存（见 dns.py）、keep-alive 连接进入连接池；之后每隔 interval
+秒再预热一次，避免空闲连接过期。
+
+预热在后台进行，不会阻塞服务启动；无法访问的域名只记录日志，单个域名最多等待
+timeout 秒。连接只有在 keepalive_expiry 大于 interval 时才能保持到下次预热，
+需要常驻连接的域名应在 [http.hosts] 中调大 keepalive_expiry：
+
+    [warmup]
+    enabled = true
+    interval = 50           # 秒，0 表示只在启动时预热一次
+    timeout = 5             # 秒
+    hosts = ["m.weibo.cn", "api.bilibili.com"]   # 不写时预热所有数据源
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from .config import get_section
+from .http import http_client
+from .logger import logger
+from .metrics import metrics
+
+DEFAULT_WARMUP_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "interval": 50.0,
+    "timeout": 5.0,
+}
+
+# 各工具请求的域名
+DEFAULT_WARMUP_HOSTS: List[str] = [
+    "9to5mac.com",
+    "api.bilibili.com",
+    "bbs.hupu.com",
+    "cache.thepaper.cn",
+    "feed.infoq.com",
+    "feeds.bbci.co.uk",
+    "gateway.36kr.com",
+    "m.163.com",
+    "m.douban.com",
+    "m.kuaishou.com",
+    "m.weibo.cn",
+    "post.smzdm.com",
+    "r.inews.qq.com",
+    "ranks.hao.360.com",
+    "sso.ifanr.com",
+    "sspai.com",
+    "sug.so.360.cn",
+    "suggestion.sogou.com",
+    "top.baidu.com",
+    "weread.qq.com",
+    "www.autohome.com.cn",
+    "www.douyin.com",
+    "www.gcores.com",
+    "www.hupu.com",
+    "www.ithome.com",
+    "www.kuaishou.com",
+    "www.sogou.com",
+    "www.theverge.com",
+    "www.toutiao.com",
+    "www.xiaohongshu.com",
+    "www.zhihu.com",
+]
+
+
+def warmup_config() -> Dict[str, Any]:
+    section = get_section("warmup")
+    config = {**DEFAULT_WARMUP_CONFIG, **{
+        k: v for k, v in section.items() if k in DEFAULT_WARMUP_CONFIG
+    }}
+    hosts = section.get("hosts")
+    config["hosts"] = list(hosts) if isinstance(hosts, list) else list(DEFAULT_WARMUP_HOSTS)
+    return config
+
+
+def _url(host: str) -> str:
+    return host if "://" in host else f"https://{host}/"
+
+
+async def _warm_host(host: str, timeout: float) -> bool:
+    start = time.monotonic()
+    try:
+        await asyncio.wait_for(http_client.warm(_url(host), timeout=timeout), timeout)
+    except Exception as e:
+        metrics.incr("warmup.hosts", ok=False)
+        logger.debug(f"预热 {host} 失败: {e!r}")
+        return False
+    metrics.incr("warmup.hosts", ok=True)
+    metrics.observe("warmup.seconds", time.monotonic() - start, host=host)
+    return True
+
+
+async def warm_up(hosts: Optional[List[str]] = None, timeout: Optional[float] = None) -> Dict[str, bool]:
+    """并发预热各域名的连接，返回每个域名是否成功"""
+    config = warmup_config()
+    hosts = config["hosts"] if hosts is None else hosts
+    timeout = float(config["timeout"]) if timeout is None else timeout
+    start = time.monotonic()
+    results = await asyncio.gather(*(_warm_host(host, timeout) for host in hosts))
+    status = dict(zip(hosts, results))
+    failed = [host for host, ok in status.items() if not ok]
+    logger.info(
+        f"连接预热完成：{len(hosts) - len(failed)}/{len(hosts)} 个域名，"
+        f"耗时 {time.monotonic() - start:.2f} 秒"
+        + (f"；失败: {', '.join(failed)}" if failed else "")
+    )
+    return status
+
+
+async def run_warmup() -> None:
+    """启动时预热一次，之后按 interval 定期预热，直到被取消；未启用时直接返回"""
+    config = warmup_config()
+    if not config["enabled"]:
+        return
+    interval = float(config["interval"])
+    while True:
+        try:
+            await warm_up(config["hosts"], float(config["timeout"]))
+        except Exception as e:
+            logger.warning(f"连接预热失败: {e}")
+        if interval <= 0:
+            return
+        await asyncio.sleep(interval)
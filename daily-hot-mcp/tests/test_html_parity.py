@@ -0,0 +1,80 @@
+"""HTML 提取的一致性测试
+
+tests/fixtures/html 中保存了百度、IT之家、汽车之家、虎扑、搜狗的页面（<名称>.html，
+以及记录页面地址和 HTTP 头中编码的 <名称>.json），包含注释、script、嵌套标签、重复标题、
+GBK 编码等容易产生差异的写法。每个页面分别交给旧版 BeautifulSoup 实现
+（benchmarks/legacy_bs4_parsers.py）和工具中的 lxml 实现解析，两者的结果必须完全相同。
+
+性能对比见 benchmarks/bench_html_extract.py。
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pytest
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "html"
+
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+import legacy_bs4_parsers as legacy  # noqa: E402
+from daily_hot_mcp.tools import autohome, baidu, hupu, ithome, sogou  # noqa: E402
+
+# 页面名称 -> (旧实现, 新实现)
+PARSERS = {
+    "baidu": (legacy.parse_baidu_html, baidu.parse_baidu_html),
+    "ithome": (legacy.parse_ithome_html, ithome.parse_ithome_html),
+    # 新闻列表在热榜之前：链接按规则顺序而不是文档顺序返回
+    "ithome-news-first": (legacy.parse_ithome_html, ithome.parse_ithome_html),
+    "autohome": (legacy.parse_autohome_html, autohome.parse_autohome_html),
+    "hupu-bxj": (legacy.parse_hupu_bxj_html, hupu.parse_hupu_bxj_html),
+    "hupu-homepage": (legacy.parse_hupu_homepage_html, hupu.parse_hupu_homepage_html),
+    "sogou": (legacy.parse_sogou_html, sogou.parse_sogou_html),
+}
+
+
+def load_fixture(name: str) -> tuple:
+    """返回 (页面字节, HTTP 头中的编码)"""
+    html = (FIXTURES_DIR / f"{name}.html").read_bytes()
+    meta = json.loads((FIXTURES_DIR / f"{name}.json").read_text(encoding="utf-8"))
+    return html, meta.get("encoding")
+
+
+def outcome(fn: Callable[..., list], html: bytes, encoding: Optional[str]) -> Any:
+    """解析结果；解析失败时返回异常的类型和信息，两种实现应抛出相同的异常"""
+    try:
+        return fn(html, encoding)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+@pytest.mark.parametrize("name", sorted(PARSERS))
+def test_lxml_matches_bs4(name: str) -> None:
+    old, new = PARSERS[name]
+    html, encoding = load_fixture(name)
+
+    expected = outcome(old, html, encoding)
+    actual = outcome(new, html, encoding)
+
+    assert isinstance(expected, list) and expected, f"{name} 的页面没有提取出条目"
+    assert actual == expected
+
+
+@pytest.mark.parametrize("name", sorted(PARSERS))
+def test_lxml_matches_bs4_without_declared_encoding(name: str) -> None:
+    """HTTP 头中没有编码时，两种实现按页面中的 meta 判断编码，结果同样一致"""
+    old, new = PARSERS[name]
+    html, _ = load_fixture(name)
+
+    assert outcome(new, html, None) == outcome(old, html, None)
+
+
+@pytest.mark.parametrize("name", sorted(PARSERS))
+def test_empty_page(name: str) -> None:
+    old, new = PARSERS[name]
+    html = b"<html><head></head><body><div class='nav'><a href='/'>\xe9\xa6\x96\xe9\xa1\xb5</a></div></body></html>"
+
+    assert outcome(new, html, "utf-8") == outcome(old, html, "utf-8")